@@ -24,11 +24,15 @@ from importlib import import_module
 import psutil
 import gunicorn
 
+from mindinsight.conf import settings
+
 
 gunicorn.SERVER_SOFTWARE = 'unknown'
 
 worker_class = 'sync'
-workers = 1
+# Data is loaded by one worker and published to the others if there are multiple workers.
+# Debugger server can only be started in one worker.
+workers = 1 if settings.ENABLE_DEBUGGER else settings.WORKERS
 threads = min(30, os.cpu_count() * 2 + 1)
 worker_connections = 1000
 
@@ -98,6 +98,20 @@ def cache_train_jobs():
     return jsonify({'cache_result': cache_result})
 
 
+@BLUEPRINT.route("/datavisual/loading-queue", methods=["GET"])
+def query_loading_queue():
+    """Query status of the loading queue of train jobs."""
+    processor = TrainTaskManager(DATA_MANAGER)
+    return jsonify(processor.query_loading_queue())
+
+
+@BLUEPRINT.route("/datavisual/cache-memory", methods=["GET"])
+def query_cache_memory_usage():
+    """Query the memory usage of the data loaded in detail cache."""
+    processor = TrainTaskManager(DATA_MANAGER)
+    return jsonify(processor.query_cache_memory_usage())
+
+
 def init_module(app):
     """
     Init module entry.
@@ -18,12 +18,17 @@ Backend interface module.
 This module provides the interfaces to train processors functions.
 """
 from flask import Blueprint
+from flask import current_app
 from flask import request
 from flask import jsonify
 
 from mindinsight.conf import settings
+from mindinsight.datavisual.common.enums import DownsampleMethodEnum
 from mindinsight.datavisual.utils.tools import get_train_id
 from mindinsight.datavisual.utils.tools import if_nan_inf_to_none
+from mindinsight.datavisual.utils.tools import str_to_bool
+from mindinsight.datavisual.utils.tools import to_int
+from mindinsight.datavisual.utils.response_cache import get_cached_json_response
 from mindinsight.datavisual.processors.histogram_processor import HistogramProcessor
 from mindinsight.datavisual.processors.tensor_processor import TensorProcessor
 from mindinsight.datavisual.processors.images_processor import ImageProcessor
@@ -49,8 +54,9 @@ def image_metadata():
     train_id = get_train_id(request)
 
     processor = ImageProcessor(DATA_MANAGER)
-    response = processor.get_metadata_list(train_id, tag)
-    return jsonify(response)
+    version = processor.get_data_version(train_id, tag)
+    return get_cached_json_response(('image_metadata', train_id, tag), version,
+                                    lambda: processor.get_metadata_list(train_id, tag))
 
 
 @BLUEPRINT.route("/datavisual/image/single-image", methods=["GET"])
@@ -58,16 +64,24 @@ def single_image():
     """
     Interface to fetch raw image data for a particular image.
 
+    The image is served with ETag and supports byte ranges, the thumbnail of the image is returned if
+    `thumbnail` is 'true'.
+
     Returns:
         Response, which contains a byte string of image.
     """
     tag = request.args.get("tag")
     step = request.args.get("step")
+    thumbnail = str_to_bool(request.args.get("thumbnail", default="false"), "thumbnail")
     train_id = get_train_id(request)
 
     processor = ImageProcessor(DATA_MANAGER)
-    img_data = processor.get_single_image(train_id, tag, step)
-    return img_data
+    img_data, digest = processor.get_single_image_with_digest(train_id, tag, step, thumbnail)
+
+    response = current_app.response_class(img_data)
+    response.set_etag(digest)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request, accept_ranges=True, complete_length=len(img_data))
 
 
 @BLUEPRINT.route("/datavisual/scalar/metadata", methods=["GET"])
@@ -83,14 +97,17 @@ def scalar_metadata():
     train_id = get_train_id(request)
 
     processor = ScalarsProcessor(DATA_MANAGER)
-    response = processor.get_metadata_list(train_id, tag)
 
-    metadatas = response['metadatas']
-    for metadata in metadatas:
-        value = metadata.get("value")
-        metadata["value"] = if_nan_inf_to_none('scalar_value', value)
+    def build_response():
+        response = processor.get_metadata_list(train_id, tag)
+        metadatas = response['metadatas']
+        for metadata in metadatas:
+            value = metadata.get("value")
+            metadata["value"] = if_nan_inf_to_none('scalar_value', value)
+        return response
 
-    return jsonify(response)
+    version = processor.get_data_version(train_id, tag)
+    return get_cached_json_response(('scalar_metadata', train_id, tag), version, build_response)
 
 
 @BLUEPRINT.route("/datavisual/graphs/nodes", methods=["GET"])
@@ -159,19 +176,35 @@ def histogram():
     train_id = get_train_id(request)
 
     processor = HistogramProcessor(DATA_MANAGER)
-    response = processor.get_histograms(train_id, tag)
-    return jsonify(response)
+    version = processor.get_data_version(train_id, tag)
+    return get_cached_json_response(('histograms', train_id, tag), version,
+                                    lambda: processor.get_histograms(train_id, tag))
 
 
 @BLUEPRINT.route("/datavisual/scalars", methods=["GET"])
 def get_scalars():
-    """Get scalar data for given train_ids and tags."""
+    """
+    Get scalar data for given train_ids and tags.
+
+    Series with more points than the optional `max_points` are downsampled by the `method`, 'lttb' or 'min_max',
+    and the columns of each series are returned instead of a list of points if `columnar` is 'true'.
+
+    Returns:
+        Response, which contains a JSON object.
+    """
     train_ids = request.args.getlist('train_id')
     tags = request.args.getlist('tag')
+    max_points = request.args.get('max_points', default=None)
+    if max_points is not None:
+        max_points = to_int(max_points, 'max_points')
+    method = request.args.get('method', default=DownsampleMethodEnum.LTTB.value)
+    columnar = str_to_bool(request.args.get('columnar', default='false'), 'columnar')
 
     processor = ScalarsProcessor(DATA_MANAGER)
-    scalars = processor.get_scalars(train_ids, tags)
-    return jsonify({'scalars': scalars})
+    version = processor.get_scalars_version(train_ids, tags)
+    return get_cached_json_response(
+        ('scalars', tuple(train_ids), tuple(tags), max_points, method, columnar), version,
+        lambda: {'scalars': processor.get_scalars(train_ids, tags, max_points, method, columnar)})
 
 
 @BLUEPRINT.route("/datavisual/tensors", methods=["GET"])
@@ -177,11 +177,15 @@ def retrieve_tensor_value():
     """
     Retrieve tensor value according to name and shape.
 
+    The detail can be 'data' for the tensor value, or 'overview' for the statistics, histogram and min/max
+    pyramid of the whole tensor without the value.
+
     Returns:
         str, the required data.
 
     Examples:
         >>> GET http://xxxx/v1/mindinsight/debugger/tensors?name=node_name&detail=data&shape=[1,1,:,:]
+        >>> GET http://xxxx/v1/mindinsight/debugger/tensors?name=node_name&detail=overview
     """
     name = request.args.get('name')
     detail = request.args.get('detail')
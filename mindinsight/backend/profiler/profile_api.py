@@ -26,7 +26,7 @@ from flask import request
 from marshmallow import ValidationError
 
 from mindinsight.conf import settings
-from mindinsight.datavisual.utils.tools import get_train_id, get_profiler_dir, to_int, get_device_id
+from mindinsight.datavisual.utils.tools import get_train_id, get_profiler_dir, to_int, to_float, get_device_id
 from mindinsight.datavisual.utils.tools import unquote_args
 from mindinsight.profiler.analyser.analyser_factory import AnalyserFactory
 from mindinsight.profiler.analyser.minddata_analyser import MinddataAnalyser
@@ -119,6 +119,41 @@ def get_profile_device_list():
     return jsonify(device_list)
 
 
+@BLUEPRINT.route("/profile/cluster/step-trace", methods=["GET"])
+def get_cluster_step_trace():
+    """
+    Get the step trace analysis of all devices.
+
+    Returns:
+        Response, the average step time of each device, the slowest device of each step
+            and the skew of each all reduce among devices.
+
+    Raises:
+        ParamValueError: If the search condition contains some errors.
+
+    Examples:
+        >>> GET http://xxxx/v1/mindinsight/profile/cluster/step-trace
+    """
+    profiler_dir = get_profiler_dir(request)
+    train_id = get_train_id(request)
+    if not profiler_dir or not train_id:
+        raise ParamValueError("No profiler_dir or train_id.")
+
+    profiler_dir_abs = os.path.join(settings.SUMMARY_BASE_DIR, train_id, profiler_dir)
+    try:
+        profiler_dir_abs = validate_and_normalize_path(profiler_dir_abs, "profiler")
+    except ValidationError:
+        raise ParamValueError("Invalid profiler dir")
+    if not os.path.exists(profiler_dir_abs):
+        raise ProfilerDirNotFoundException(msg=profiler_dir)
+
+    analyser = AnalyserFactory.instance().get_analyser('cluster', profiler_dir_abs)
+    cluster_info = analyser.query()
+    cluster_info['step_skew'] = analyser.step_skew
+    cluster_info['all_reduce_skew'] = analyser.all_reduce_skew
+    return jsonify(cluster_info)
+
+
 @BLUEPRINT.route("/profile/training-trace/graph", methods=["GET"])
 def get_training_trace_graph():
     """
@@ -179,6 +214,7 @@ def get_target_time_info():
             'proc_name': proc_name
         }})
     target_time_info['summary'] = analyser.summary
+    target_time_info['statistics'] = analyser.statistics.get(proc_name, {})
     return jsonify(target_time_info)
 
 
@@ -475,6 +511,47 @@ def get_timeline_detail():
     return jsonify(timeline)
 
 
+@BLUEPRINT.route("/profile/timeline-window", methods=["GET"])
+def get_timeline_window():
+    """
+    Get timeline detail in a time window.
+
+    The ops shorter than a pixel of the resolution are aggregated into summary bars.
+
+    Returns:
+        Response, the detail information of timeline in the time window.
+
+    Examples:
+        >>> GET http://xxxx/v1/mindinsight/profile/timeline-window?start_time=0&end_time=1000&resolution=1920
+    """
+    summary_dir = request.args.get("dir")
+    profiler_dir = validate_and_normalize_profiler_path(summary_dir, settings.SUMMARY_BASE_DIR)
+    if not os.path.exists(profiler_dir):
+        raise ProfilerDirNotFoundException(msg=summary_dir)
+    device_id = request.args.get("device_id", default='0')
+    _ = to_int(device_id, 'device_id')
+    device_type = request.args.get("device_type", default='ascend')
+    if device_type not in ['gpu', 'ascend']:
+        logger.info("Invalid device_type, device_type should be gpu or ascend.")
+        raise ParamValueError("Invalid device_type.")
+
+    start_time = request.args.get("start_time")
+    if start_time is not None:
+        start_time = to_float(start_time, 'start_time')
+    end_time = request.args.get("end_time")
+    if end_time is not None:
+        end_time = to_float(end_time, 'end_time')
+    resolution = request.args.get("resolution")
+    if resolution is not None:
+        resolution = to_int(resolution, 'resolution')
+
+    analyser = AnalyserFactory.instance().get_analyser(
+        'timeline', profiler_dir, device_id)
+    timeline = analyser.get_display_timeline_window(device_type, start_time, end_time, resolution)
+
+    return jsonify(timeline)
+
+
 def init_module(app):
     """
     Init module entry.
@@ -40,6 +40,25 @@ class ReloadIntervalAction(argparse.Action):
         setattr(namespace, self.dest, reload_interval)
 
 
+class DetailCacheMemoryLimitAction(argparse.Action):
+    """Detail cache memory limit action class definition."""
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        """
+        Inherited __call__ method from argparse.Action.
+
+        Args:
+            parser (ArgumentParser): Passed-in argument parser.
+            namespace (Namespace): Namespace object to hold arguments.
+            values (object): Argument values with type depending on argument definition.
+            option_string (str): Option string for specific argument name.
+        """
+        memory_limit = values
+        if memory_limit < 0:
+            parser.error(f'{option_string} should be greater than or equal to 0')
+        setattr(namespace, self.dest, memory_limit)
+
+
 class SummaryBaseDirAction(argparse.Action):
     """Summary base dir action class definition."""
 
@@ -57,6 +76,24 @@ class SummaryBaseDirAction(argparse.Action):
         setattr(namespace, self.dest, summary_base_dir)
 
 
+class EnableSummaryIndexCacheAction(argparse.Action):
+    """Enable summary index cache action class definition."""
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        """
+        Inherited __call__ method from argparse.Action.
+
+        Args:
+            parser (ArgumentParser): Passed-in argument parser.
+            namespace (Namespace): Namespace object to hold arguments.
+            values (object): Argument values with type depending on argument definition.
+            option_string (str): Option string for specific argument name.
+        """
+        if values.lower() not in ('true', 'false'):
+            parser.error(f'{option_string} should be True or False')
+        setattr(namespace, self.dest, values.lower() == 'true')
+
+
 class Hook(BaseHook):
     """Hook class definition."""
 
@@ -87,3 +124,32 @@ class Hook(BaseHook):
                 file directory. Summary file existing in summary-base-dir indicates that
                 sumamry-base-dir is one of the summary file directories as well. Default
                 value is current directory.""")
+
+        parser.add_argument(
+            '--enable-summary-index-cache',
+            type=str,
+            action=EnableSummaryIndexCacheAction,
+            help="""
+                Save parsed offsets and data of summary directories in workspace, so that
+                summary files will not be parsed again from the beginning after restarting.
+                Default value is %s.""" % settings.ENABLE_SUMMARY_INDEX_CACHE)
+
+        parser.add_argument(
+            '--summary-watch-mode',
+            type=str,
+            choices=['scan', 'mtime', 'inotify'],
+            help="""
+                How to find changes of summary directories when reloading. 'scan' scans all
+                directories every time, 'mtime' only scans directories whose mtime changes,
+                and 'inotify' uses inotify on Linux to find changed directories.
+                Default value is %s.""" % settings.SUMMARY_WATCH_MODE)
+
+        parser.add_argument(
+            '--detail-cache-memory-limit',
+            type=int,
+            action=DetailCacheMemoryLimitAction,
+            help="""
+                max memory(MB) of the data loaded from summary files. Train jobs which are used
+                least recently and use large memory are removed from cache when the limit is
+                exceeded. If it equals 0, the memory is not limited. Default value is %s.
+            """ % settings.DETAIL_CACHE_MEMORY_LIMIT)
@@ -51,6 +51,20 @@ API_PREFIX = '/v1/mindinsight'
 ####################################
 MAX_PROCESSES_COUNT = max(min(int(multiprocessing.cpu_count() * 0.75), 45), 1)
 
+# Summary events are parsed in batches by the computing workers, a batch is limited by both count and bytes.
+MAX_EVENT_COUNT_PER_PARSE_TASK = 1000
+MAX_EVENT_BYTES_PER_PARSE_TASK = 16 * 1024 * 1024
+
+# Max time(Seconds) spent on requested train jobs in each loading round before loading other train jobs.
+REQUESTED_LOADER_TIME_SLICE = 1
+
+# Minimum interval(Seconds) between two saves of the summary index cache of one summary directory.
+SUMMARY_INDEX_CACHE_SAVE_INTERVAL = 60
+
+# Minimum interval(Seconds) between two publishes of one summary directory to reader workers, if there are
+# multiple workers.
+SUMMARY_PUBLISH_INTERVAL = 5
+
 MAX_TAG_SIZE_PER_EVENTS_DATA = 300
 DEFAULT_STEP_SIZES_PER_TAG = 500
 
@@ -62,3 +76,16 @@ MAX_GRAPH_STEP_SIZE_PER_TAG = 1
 MAX_HISTOGRAM_STEP_SIZE_PER_TAG = 50
 MAX_TENSOR_STEP_SIZE_PER_TAG = 20
 MAX_TENSOR_RESPONSE_DATA_SIZE = 100000
+
+# Max width and height(Pixels) of the thumbnails of images, thumbnails are generated only if Pillow is installed.
+IMAGE_THUMBNAIL_SIZE = 256
+
+# Interval(Seconds) between two scans of the image blob store to find the blobs never referenced by loaded images.
+IMAGE_BLOB_STORE_SCAN_INTERVAL = 3600
+
+####################################
+# Profiler default settings.
+####################################
+# The step trace of a cluster is analysed by a process pool only if it has at least this number of devices, the
+# cost of starting processes is larger than the analysis of a few devices.
+MIN_DEVICE_COUNT_ANALYSED_IN_PROCESSES = 16
@@ -25,15 +25,39 @@ WORKSPACE = os.path.join(os.environ['HOME'], 'mindinsight')
 ####################################
 PORT = 8080
 URL_PATH_PREFIX = ''
+# Number of worker processes of the web service. If there are multiple workers, only one worker parses summary
+# files and publishes the data to the others.
+WORKERS = 1
 
 ####################################
 # Debugger default settings.
 ####################################
 DEBUGGER_PORT = '50051'
 ENABLE_DEBUGGER = False
+# Max memory(MB) of the tensor values received by debugger, the tensors read least recently are spilled to
+# memory-mapped files in workspace when the limit is exceeded.
+DEBUGGER_TENSOR_MEMORY_LIMIT = 1024
+# Max disk usage(MB) of the spilled tensor values, the tensors read least recently are removed when the limit is
+# exceeded and will be queried from the client again. If it equals 0, tensors are removed instead of spilled.
+DEBUGGER_TENSOR_DISK_LIMIT = 4096
 
 ####################################
 # Datavisual default settings.
 ####################################
 RELOAD_INTERVAL = 3 # Seconds
 SUMMARY_BASE_DIR = os.getcwd()
+# Persist parsed offsets and reservoirs of summary directories in workspace to speed up restarting.
+ENABLE_SUMMARY_INDEX_CACHE = False
+# How to find changes of summary directories on reloading, 'scan' rescans all directories, 'mtime' only rescans
+# directories whose mtime changes, and 'inotify' uses inotify on Linux to find changed directories.
+SUMMARY_WATCH_MODE = 'scan'
+# Max memory(MB) of the data loaded in detail cache, train jobs which are used least recently and use large memory
+# are removed from cache when the limit is exceeded. If it equals 0, the memory is not limited.
+DETAIL_CACHE_MEMORY_LIMIT = 0
+# Max memory(MB) of the encoded responses of datavisual APIs cached for polling dashboards. If it equals 0,
+# responses are not cached, but clients still get `304 Not Modified` if their copies are up to date.
+RESPONSE_CACHE_MEMORY_LIMIT = 64
+# Max disk usage(MB) of the encoded images stored in workspace instead of memory for each port, the images not
+# loaded and referenced least recently are removed when the limit is exceeded. If it equals 0, images are kept
+# in memory.
+IMAGE_BLOB_STORE_DISK_LIMIT = 1024
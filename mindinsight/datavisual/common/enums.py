@@ -47,3 +47,9 @@ class CacheStatus(enum.Enum):
     NOT_IN_CACHE = "NOT_IN_CACHE"
     CACHING = "CACHING"
     CACHED = "CACHED"
+
+
+class DownsampleMethodEnum(BaseEnum):
+    """Downsampling method of scalars."""
+    LTTB = 'lttb'
+    MIN_MAX = 'min_max'
@@ -48,7 +48,11 @@ def handle_mindinsight_error(ex):
         logger.error('%r %r detail: %r', request.method, quote(request.path), ex.message)
         logger.exception(ex)
     res_body = dict(error_code=ex.error_code, error_msg=ex.message)
-    return jsonify(res_body), ex.http_code
+    response = jsonify(res_body)
+    retry_after = getattr(ex, 'retry_after', None)
+    if retry_after is not None:
+        response.headers['Retry-After'] = str(retry_after)
+    return response, ex.http_code
 
 
 def handle_unknown_error(ex):
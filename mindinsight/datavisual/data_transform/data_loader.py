@@ -18,8 +18,11 @@ DataLoader is an adapter for all other loaders.
 This module can identify what loader should be used to load data.
 """
 
+from mindinsight.conf import settings
 from mindinsight.datavisual.common.log import logger
 from mindinsight.datavisual.data_transform.ms_data_loader import MSDataLoader
+from mindinsight.datavisual.data_transform.shared_summary_store import SHARED_SUMMARY_STORE
+from mindinsight.datavisual.data_transform.summary_index_cache import SUMMARY_INDEX_CACHE
 from mindinsight.datavisual.common import exceptions
 
 
@@ -33,16 +36,21 @@ class DataLoader:
     def __init__(self, summary_dir):
         self._summary_dir = summary_dir
         self._loader = None
+        self._published_mtime = None
 
     def load(self, executor=None):
         """Load the data when loader is exist.
 
+        In a reader worker, the data published by the loader worker is restored instead of parsing summary files.
+
         Args:
             executor (Optional[Executor]): The executor instance.
 
         Returns:
             bool, True if the loader is finished loading.
         """
+        if SHARED_SUMMARY_STORE.is_reader():
+            return self._load_published()
 
         if self._loader is None:
             ms_dataloader = MSDataLoader(self._summary_dir)
@@ -56,8 +64,50 @@ class DataLoader:
                 logger.warning("No valid files can be loaded, summary_dir: %s.", self._summary_dir)
                 raise exceptions.SummaryLogPathInvalid()
 
+            # The loader worker continues parsing from the index published before.
+            if SHARED_SUMMARY_STORE.enabled:
+                self._loader.load_index(SHARED_SUMMARY_STORE.index_cache)
+            elif settings.ENABLE_SUMMARY_INDEX_CACHE:
+                self._loader.load_index(SUMMARY_INDEX_CACHE)
+
         return self._loader.load(executor)
 
+    def _load_published(self):
+        """
+        Restore the data published by the loader worker if it has been updated.
+
+        The data is restored into a new loader, so the current data is kept if restoring fails. The parsed
+        offsets are restored too, so parsing can be continued if current process becomes the loader worker.
+
+        Returns:
+            bool, always True, because the data published later will be restored in the next loading.
+        """
+        published_mtime = SHARED_SUMMARY_STORE.index_cache.get_index_mtime(self._summary_dir)
+        if published_mtime is None or published_mtime == self._published_mtime:
+            return True
+
+        loader = MSDataLoader(self._summary_dir)
+        if loader.load_index(SHARED_SUMMARY_STORE.index_cache):
+            self._loader = loader
+        self._published_mtime = published_mtime
+        return True
+
+    def save_index(self):
+        """
+        Save the index of loaded data if the summary index cache is enabled.
+
+        If there are multiple workers, the index is published to the shared summary store for reader workers.
+        It should be called when there is no pending parsing task.
+        """
+        if self._loader is None:
+            return
+        if SHARED_SUMMARY_STORE.enabled:
+            if not SHARED_SUMMARY_STORE.is_reader():
+                self._loader.save_index(SHARED_SUMMARY_STORE.index_cache, settings.SUMMARY_PUBLISH_INTERVAL)
+            return
+        if settings.ENABLE_SUMMARY_INDEX_CACHE:
+            self._loader.save_index(SUMMARY_INDEX_CACHE)
+
     def get_events_data(self):
         """
         Get events data from log file.
@@ -67,6 +117,28 @@ class DataLoader:
         """
         return self._loader.get_events_data()
 
+    def get_nbytes_by_plugin(self):
+        """
+        Get the approximate memory(Bytes) of loaded data of each plugin.
+
+        Returns:
+            dict[str, int], the memory of each plugin, it is empty if no data is loaded.
+        """
+        if self._loader is None:
+            return {}
+        return self._loader.get_events_data().get_nbytes_by_plugin()
+
+    def get_image_blob_keys(self):
+        """
+        Get the keys of the image blobs referenced by loaded data.
+
+        Returns:
+            set[str], the keys of the image blobs, it is empty if no data is loaded.
+        """
+        if self._loader is None:
+            return set()
+        return self._loader.get_events_data().get_image_blob_keys()
+
     def has_valid_files(self):
         """
         Check the directory for valid files.
@@ -27,7 +27,9 @@ import time
 import os
 from typing import Iterable, Optional
 
-from mindinsight.datavisual.data_transform.summary_watcher import SummaryWatcher
+import numpy as np
+
+from mindinsight.datavisual.data_transform.summary_watcher import SummaryWatcher, IncrementalSummaryWatcher
 
 from mindinsight.conf import settings
 from mindinsight.datavisual.common import exceptions
@@ -38,6 +40,9 @@ from mindinsight.datavisual.common.enums import PluginNameEnum
 from mindinsight.datavisual.common.exceptions import TrainJobNotExistError
 from mindinsight.datavisual.data_transform.loader_generators.loader_generator import MAX_DATA_LOADER_SIZE
 from mindinsight.datavisual.data_transform.loader_generators.data_loader_generator import DataLoaderGenerator
+from mindinsight.datavisual.data_transform.image_blob_store import IMAGE_BLOB_STORE
+from mindinsight.datavisual.data_transform.reservoir import ScalarColumns
+from mindinsight.datavisual.data_transform.shared_summary_store import SHARED_SUMMARY_STORE
 from mindinsight.utils.computing_resource_mgr import ComputingResourceManager
 from mindinsight.utils.exceptions import MindInsightException
 from mindinsight.utils.exceptions import ParamValueError
@@ -364,6 +369,18 @@ class _BaseCacheManager:
 class _BriefCacheManager(_BaseCacheManager):
     """A cache manager that holds all disk train jobs on disk."""
 
+    def __init__(self, summary_base_dir):
+        super().__init__(summary_base_dir)
+        self._summary_watcher = None
+        if settings.SUMMARY_WATCH_MODE != 'scan':
+            self._summary_watcher = IncrementalSummaryWatcher(use_inotify=settings.SUMMARY_WATCH_MODE == 'inotify')
+
+    def delete_train_job(self, train_id):
+        """Delete train job from cache, it will be cached again on next reloading if it is still on disk."""
+        super().delete_train_job(train_id)
+        if self._summary_watcher is not None:
+            self._summary_watcher.forget(train_id)
+
     def cache_train_job(self, train_id):
         """
         Cache given train job.
@@ -381,18 +398,25 @@ class _BriefCacheManager(_BaseCacheManager):
     def update_cache(self, executor):
         """Update cache."""
         logger.info('Start to update BriefCacheManager.')
-        summaries_info = SummaryWatcher().list_summary_directories(self._summary_base_dir)
-
-        basic_train_jobs = []
-        for info in summaries_info:
-            basic_train_jobs.append(_BasicTrainJob(
-                abs_summary_base_dir=self._summary_base_dir,
-                entry=info
-            ))
-
-        with self._lock:
-            new_cache_items = self._merge_with_disk(basic_train_jobs)
-            self._cache_items = new_cache_items
+        if self._summary_watcher is not None:
+            changes = self._summary_watcher.scan_changes(self._summary_base_dir)
+            updated_train_jobs = [_BasicTrainJob(abs_summary_base_dir=self._summary_base_dir, entry=info)
+                                  for info in changes.updated]
+            with self._lock:
+                self._cache_items = self._merge_changes_with_disk(updated_train_jobs, changes.removed)
+        else:
+            summaries_info = SummaryWatcher().list_summary_directories(self._summary_base_dir)
+
+            basic_train_jobs = []
+            for info in summaries_info:
+                basic_train_jobs.append(_BasicTrainJob(
+                    abs_summary_base_dir=self._summary_base_dir,
+                    entry=info
+                ))
+
+            with self._lock:
+                new_cache_items = self._merge_with_disk(basic_train_jobs)
+                self._cache_items = new_cache_items
         for updater in self._updaters.values():
             for cache_item in self._cache_items.values():
                 updater.update_item(cache_item)
@@ -420,12 +444,174 @@ class _BriefCacheManager(_BaseCacheManager):
 
         return new_cache_items
 
+    def _merge_changes_with_disk(self, updated_train_jobs: Iterable[_BasicTrainJob], removed_train_ids):
+        """
+        Merge train jobs in cache with the changes of train jobs on disk.
+
+        Call this function with lock for thread safety.
+
+        Args:
+            updated_train_jobs (Iterable[_BasicTrainJob]): Basic info of new or updated train jobs on disk.
+            removed_train_ids (Iterable[str]): IDs of train jobs removed from disk.
+
+        Returns:
+            dict, a dict containing train jobs to be cached.
+        """
+        new_cache_items = dict(self._cache_items)
+        for train_id in removed_train_ids:
+            new_cache_items.pop(train_id, None)
+
+        for train_job in updated_train_jobs:
+            if train_job.train_id not in new_cache_items:
+                new_cache_items[train_job.train_id] = CachedTrainJob(train_job)
+            else:
+                new_cache_items[train_job.train_id].basic_info = train_job
+
+        return new_cache_items
+
     @property
     def cache_items(self):
         """Get cache items."""
         return self._cache_items
 
 
+class _LoaderScheduler:
+    """
+    Scheduler to decide the loading order of loaders in detail cache.
+
+    Loaders with pending requests, which means users are waiting for them, are loaded first. Other loaders are
+    ordered by their last access time, so recently viewed train jobs are loaded before the others.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Key is loader id, value is the time of the request.
+        self._pending_requests = {}
+        self._access_times = {}
+        self._loading_stats = {}
+
+    def request(self, loader_id):
+        """
+        Add a pending request of the loader, it will be removed when the loader finishes loading.
+
+        Args:
+            loader_id (str): ID of loader.
+        """
+        now = time.time()
+        with self._lock:
+            self._pending_requests.setdefault(loader_id, now)
+            self._access_times[loader_id] = now
+
+    def get_requested_loader_ids(self):
+        """
+        Get IDs of loaders with pending requests, the earliest requested comes first.
+
+        Returns:
+            list[str], the loader IDs.
+        """
+        with self._lock:
+            return sorted(self._pending_requests, key=self._pending_requests.get)
+
+    def sort_loader_ids(self, loader_pool):
+        """
+        Sort loaders by priority.
+
+        Args:
+            loader_pool (dict[str, LoaderStruct]): The loader pool.
+
+        Returns:
+            list[str], the loader IDs in the loading order.
+        """
+        with self._lock:
+            def priority(loader_id):
+                requested_time = self._pending_requests.get(loader_id)
+                return (requested_time is None,
+                        requested_time or 0,
+                        -self._access_times.get(loader_id, 0),
+                        -loader_pool[loader_id].latest_update_time)
+            return sorted(loader_pool, key=priority)
+
+    def record(self, loader_id, finished, cost):
+        """
+        Record a time slice of loading.
+
+        Args:
+            loader_id (str): ID of loader.
+            finished (bool): Whether the loader finished loading.
+            cost (float): Time(Seconds) cost by the time slice.
+        """
+        now = time.time()
+        with self._lock:
+            stats = self._loading_stats.setdefault(loader_id, dict(slices=0, load_time=0.0,
+                                                                    last_finished_time=None,
+                                                                    unfinished_since=None))
+            stats['slices'] += 1
+            stats['load_time'] += cost
+            if finished:
+                stats['last_finished_time'] = now
+                stats['unfinished_since'] = None
+                self._pending_requests.pop(loader_id, None)
+            elif stats['unfinished_since'] is None:
+                stats['unfinished_since'] = now - cost
+
+    def get_access_times(self):
+        """
+        Get the last access time of loaders.
+
+        Returns:
+            dict[str, float], the last access time of each loader accessed by users.
+        """
+        with self._lock:
+            return dict(self._access_times)
+
+    def remove(self, loader_id):
+        """
+        Remove the records of the loader.
+
+        Args:
+            loader_id (str): ID of loader.
+        """
+        with self._lock:
+            self._pending_requests.pop(loader_id, None)
+            self._access_times.pop(loader_id, None)
+            self._loading_stats.pop(loader_id, None)
+
+    def get_queue_status(self, loader_pool):
+        """
+        Get status of the loading queue.
+
+        Args:
+            loader_pool (dict[str, LoaderStruct]): The loader pool.
+
+        Returns:
+            dict, including the queue depth and the status of each loader in the loading order. The lag of a loader
+                is the time(Seconds) since it began to fall behind the summary files, and it is 0 if the loader has
+                loaded all data.
+        """
+        now = time.time()
+        loaders = []
+        for loader_id in self.sort_loader_ids(loader_pool):
+            with self._lock:
+                stats = dict(self._loading_stats.get(loader_id, {}))
+                pending_request = loader_id in self._pending_requests
+                access_time = self._access_times.get(loader_id)
+            finished = stats.get('last_finished_time') is not None and stats.get('unfinished_since') is None
+            unfinished_since = stats.get('unfinished_since')
+            loaders.append(dict(
+                train_id=loader_id,
+                cache_status=loader_pool[loader_id].cache_status.value,
+                pending_request=pending_request,
+                last_access_time=access_time,
+                finished=finished,
+                lag=now - unfinished_since if unfinished_since is not None else 0,
+                slices=stats.get('slices', 0),
+                load_time=stats.get('load_time', 0.0),
+            ))
+        return dict(queue_depth=sum(not loader['finished'] for loader in loaders),
+                    pending_requests=sum(loader['pending_request'] for loader in loaders),
+                    loaders=loaders)
+
+
 # Key for plugin tags.
 DATAVISUAL_PLUGIN_KEY = "tag_mapping"
 # Detail train job cache key for datavisual content.
@@ -441,6 +627,10 @@ class _DetailCacheManager(_BaseCacheManager):
         self._loader_pool_mutex = threading.Lock()
         self._loader_generators = [DataLoaderGenerator(summary_base_dir)]
         self._loading_mutex = threading.Lock()
+        self._scheduler = _LoaderScheduler()
+        # Loaders removed for exceeding the memory limit, they will not be loaded again until they are requested.
+        # Key is loader id, value is the time of removing.
+        self._evicted_loaders = {}
 
     def has_content(self):
         """Whether this cache manager has train jobs."""
@@ -487,6 +677,7 @@ class _DetailCacheManager(_BaseCacheManager):
                 loader = self._loader_pool.get(train_id)
 
             if loader is None:
+                self._evicted_loaders.pop(train_id, None)
                 for generator in self._loader_generators:
                     tmp_loader = generator.generate_loader_by_train_id(train_id)
                     if loader and loader.latest_update_time > tmp_loader.latest_update_time:
@@ -500,8 +691,22 @@ class _DetailCacheManager(_BaseCacheManager):
                 need_reload = True
 
         self._update_loader_latest_update_time(loader.loader_id)
+        # The train job is viewed by user, so load it before the others.
+        self._scheduler.request(loader.loader_id)
+        if SHARED_SUMMARY_STORE.is_reader():
+            SHARED_SUMMARY_STORE.request_train_job(loader.loader_id)
         return need_reload
 
+    def _cache_shared_requested_train_jobs(self):
+        """Cache the train jobs requested by reader workers, if current process is the loader worker."""
+        if not SHARED_SUMMARY_STORE.enabled or SHARED_SUMMARY_STORE.is_reader():
+            return
+        for train_id in SHARED_SUMMARY_STORE.pop_requested_train_jobs():
+            try:
+                self.cache_train_job(train_id)
+            except TrainJobNotExistError:
+                logger.warning("Train job %r requested by reader worker does not exist.", train_id)
+
     def get_train_jobs(self):
         """
         Get train jobs
@@ -535,6 +740,7 @@ class _DetailCacheManager(_BaseCacheManager):
         if self._loader_pool.get(loader_id) is not None:
             logger.debug("delete loader %s", loader_id)
             self._loader_pool.pop(loader_id)
+            self._scheduler.remove(loader_id)
 
     def _execute_loader(self, loader_id, executor):
         """
@@ -557,7 +763,10 @@ class _DetailCacheManager(_BaseCacheManager):
                     return True
 
             loader.cache_status = CacheStatus.CACHING
-            if loader.data_loader.load(executor):
+            start_time = time.time()
+            finished = loader.data_loader.load(executor)
+            self._scheduler.record(loader_id, finished, time.time() - start_time)
+            if finished:
                 # Update loader cache status to CACHED.
                 # Loader with cache status CACHED should remain the same cache status.
                 loader.cache_status = CacheStatus.CACHED
@@ -577,11 +786,32 @@ class _DetailCacheManager(_BaseCacheManager):
         loader_dict = {}
         for generator in self._loader_generators:
             loader_dict.update(generator.generate_loaders(self._loader_pool))
+        self._prune_evicted_loaders(loader_dict)
 
         sorted_loaders = sorted(loader_dict.items(), key=lambda loader: loader[1].latest_update_time)
         latest_loaders = sorted_loaders[-MAX_DATA_LOADER_SIZE:]
         self._deal_loaders(latest_loaders)
 
+    def _prune_evicted_loaders(self, loader_dict):
+        """
+        Forget the evicted loaders whose train jobs no longer exist on disk.
+
+        Args:
+            loader_dict (dict[str, LoaderStruct]): The loaders generated from the summary base directory.
+        """
+        with self._loader_pool_mutex:
+            unlisted_loader_ids = [loader_id for loader_id in self._evicted_loaders if loader_id not in loader_dict]
+        # Only the latest train jobs are generated, so the unlisted ones may still exist.
+        removed_loader_ids = [loader_id for loader_id in unlisted_loader_ids
+                              if not any(generator.check_train_job_exist(loader_id)
+                                         for generator in self._loader_generators)]
+        if not removed_loader_ids:
+            return
+        with self._loader_pool_mutex:
+            for loader_id in removed_loader_ids:
+                logger.debug("Train job %r of evicted loader no longer exists.", loader_id)
+                self._evicted_loaders.pop(loader_id, None)
+
     def _deal_loaders(self, latest_loaders):
         """
         This function determines which loaders to keep or remove or added.
@@ -595,6 +825,8 @@ class _DetailCacheManager(_BaseCacheManager):
         with self._loader_pool_mutex:
             for loader_id, loader in latest_loaders:
                 if self._loader_pool.get(loader_id, None) is None:
+                    if loader_id in self._evicted_loaders:
+                        continue
                     self._add_loader(loader)
                     continue
 
@@ -604,14 +836,162 @@ class _DetailCacheManager(_BaseCacheManager):
                     self._update_loader_latest_update_time(loader_id, loader.latest_update_time)
 
     def _execute_load_data(self, executor):
-        """Load data through multiple threads."""
+        """
+        Load data of all loaders for one round.
+
+        Each loader loads one slice of data in the order of priority. Before each slice, the loaders requested by
+        users are loaded first, so a requested train job does not wait for the other train jobs. The requested
+        loaders share one time budget in a round, so they can not starve the other loaders.
+
+        Args:
+            executor (Executor): The Executor instance.
+
+        Returns:
+            bool, True if all loaders are finished loading.
+        """
+        self._cache_shared_requested_train_jobs()
         self._generate_loaders()
         loader_pool = self._get_snapshot_loader_pool()
         loaded = True
-        for loader_id in loader_pool:
+        requested_deadline = time.time() + settings.REQUESTED_LOADER_TIME_SLICE
+        for loader_id in self._scheduler.sort_loader_ids(loader_pool):
+            self._execute_requested_loaders(executor, requested_deadline)
             loaded = self._execute_loader(loader_id, executor) and loaded
+        self._evict_by_memory_limit()
         return loaded
 
+    def _get_loader_nbytes(self, loader_pool):
+        """
+        Get the approximate memory(Bytes) of each loader.
+
+        Args:
+            loader_pool (dict[str, LoaderStruct]): The loader pool.
+
+        Returns:
+            dict[str, dict[str, int]], the memory of each plugin of each loader.
+        """
+        return {loader_id: loader.data_loader.get_nbytes_by_plugin() for loader_id, loader in loader_pool.items()}
+
+    def _evict_by_memory_limit(self):
+        """
+        Remove loaders from loader pool until the memory of loaded data is under the limit.
+
+        Loaders that are accessed least recently and use large memory are removed first, the loaders never accessed
+        by users are regarded as idle for the longest time. The most recently accessed loader is always kept, so the
+        train job being viewed is not removed even if it exceeds the limit alone.
+        """
+        memory_limit = settings.DETAIL_CACHE_MEMORY_LIMIT * 1024 * 1024
+        if memory_limit <= 0:
+            return
+
+        loader_pool = self._get_snapshot_loader_pool()
+        loader_nbytes = {loader_id: sum(nbytes_by_plugin.values())
+                         for loader_id, nbytes_by_plugin in self._get_loader_nbytes(loader_pool).items()}
+        total_nbytes = sum(loader_nbytes.values())
+        if total_nbytes <= memory_limit:
+            return
+
+        now = time.time()
+        requested_loader_ids = set(self._scheduler.get_requested_loader_ids())
+        # The update time of loader is also changed by new summary files, so the access time is used instead.
+        access_times = self._scheduler.get_access_times()
+
+        def eviction_order(loader_id):
+            idle_time = max(now - access_times.get(loader_id, 0), 0)
+            return loader_id in requested_loader_ids, -idle_time * loader_nbytes[loader_id]
+
+        candidates = sorted(loader_pool, key=eviction_order)
+        most_recent_loader_id = max(loader_pool, key=lambda loader_id: (access_times.get(loader_id, 0),
+                                                                        loader_pool[loader_id].latest_update_time))
+        candidates.remove(most_recent_loader_id)
+        with self._loader_pool_mutex:
+            for loader_id in candidates:
+                if total_nbytes <= memory_limit:
+                    break
+                logger.warning("Memory of detail cache exceeds the limit, remove loader %r which uses %d bytes.",
+                               loader_id, loader_nbytes[loader_id])
+                self._delete_loader(loader_id)
+                self._evicted_loaders[loader_id] = now
+                total_nbytes -= loader_nbytes[loader_id]
+
+        if total_nbytes > memory_limit:
+            logger.warning("Memory of loader %r exceeds the limit of detail cache, it is kept as the most recently "
+                           "used train job.", most_recent_loader_id)
+
+    def get_memory_usage(self):
+        """
+        Get the approximate memory usage of detail cache.
+
+        Returns:
+            dict, including the memory limit, the total memory, the memory of each plugin of each loader in
+                descending order of memory and the train IDs removed for exceeding the memory limit.
+        """
+        loader_pool = self._get_snapshot_loader_pool()
+        loaders = []
+        for loader_id, nbytes_by_plugin in self._get_loader_nbytes(loader_pool).items():
+            loaders.append(dict(train_id=loader_id,
+                                nbytes=sum(nbytes_by_plugin.values()),
+                                nbytes_by_plugin=nbytes_by_plugin,
+                                latest_update_time=loader_pool[loader_id].latest_update_time))
+        loaders.sort(key=lambda loader: loader['nbytes'], reverse=True)
+        with self._loader_pool_mutex:
+            evicted_train_ids = list(self._evicted_loaders)
+        return dict(memory_limit=settings.DETAIL_CACHE_MEMORY_LIMIT * 1024 * 1024,
+                    total_nbytes=sum(loader['nbytes'] for loader in loaders),
+                    loaders=loaders,
+                    evicted_train_ids=evicted_train_ids)
+
+    def _execute_requested_loaders(self, executor, deadline):
+        """
+        Load data of the loaders with pending requests.
+
+        A requested loader keeps loading until it finishes or the time budget of this round is used up.
+
+        Args:
+            executor (Executor): The Executor instance.
+            deadline (float): The time when the time budget of requested loaders in this round is used up.
+        """
+        for loader_id in self._scheduler.get_requested_loader_ids():
+            while time.time() < deadline:
+                if self._execute_loader(loader_id, executor):
+                    break
+
+    def get_loading_queue_status(self):
+        """
+        Get status of the loading queue, see `_LoaderScheduler.get_queue_status` for details.
+
+        Returns:
+            dict, the status of the loading queue.
+        """
+        return self._scheduler.get_queue_status(self._get_snapshot_loader_pool())
+
+    def get_image_blob_keys(self):
+        """
+        Get the keys of the image blobs referenced by the loaders in the loader pool.
+
+        Returns:
+            set[str], the keys of the image blobs.
+        """
+        keys = set()
+        for loader in self._get_snapshot_loader_pool().values():
+            keys.update(loader.data_loader.get_image_blob_keys())
+        return keys
+
+    def save_index_cache(self):
+        """
+        Save the summary index of all loaders which have been cached.
+
+        It should be called when there is no pending parsing task.
+        """
+        loader_pool = self._get_snapshot_loader_pool()
+        for loader in loader_pool.values():
+            if loader.cache_status != CacheStatus.CACHED:
+                continue
+            try:
+                loader.data_loader.save_index()
+            except MindInsightException as ex:
+                logger.warning("Save summary index of loader %r failed. Detail: %s", loader.loader_id, ex)
+
     def delete_train_job(self, train_id):
         """
         Delete train job with a train id.
@@ -657,6 +1037,68 @@ class _DetailCacheManager(_BaseCacheManager):
 
         return tensors
 
+    def list_scalar_columns(self, train_id, tag):
+        """
+        List the columns of scalars of the given train job and tag without copying.
+
+        If the scalars can not find by the given tag, will raise exception.
+
+        Args:
+            train_id (str): ID for train job.
+            tag (str): The tag name.
+
+        Returns:
+            ScalarColumns, the read-only columns of steps, wall times and values.
+        """
+        loader_pool = self._get_snapshot_loader_pool()
+        if not self._is_loader_in_loader_pool(train_id, loader_pool):
+            raise TrainJobNotExistError("Can not find the given train job in cache.")
+
+        data_loader = loader_pool[train_id].data_loader
+
+        try:
+            events_data = data_loader.get_events_data()
+            return events_data.scalar_columns(tag)
+        except KeyError:
+            error_msg = "Can not find any data in this train job by given tag."
+            raise ParamValueError(error_msg)
+        except AttributeError:
+            logger.debug("Train job %r has been deleted or it has not loaded data, "
+                         "and set scalars to empty columns.", train_id)
+
+        return ScalarColumns(steps=np.array([], dtype=np.int64),
+                             wall_times=np.array([], dtype=np.float64),
+                             values=np.array([], dtype=np.float64))
+
+    def get_reservoir_version(self, train_id, tag):
+        """
+        Get the version of the data of the given train job and tag.
+
+        Args:
+            train_id (str): ID for train job.
+            tag (str): The tag name.
+
+        Returns:
+            Union[int, None], the version of the reservoir of the tag, or None if the train job has not
+                loaded data.
+        """
+        loader_pool = self._get_snapshot_loader_pool()
+        if not self._is_loader_in_loader_pool(train_id, loader_pool):
+            raise TrainJobNotExistError("Can not find the given train job in cache.")
+
+        data_loader = loader_pool[train_id].data_loader
+
+        try:
+            events_data = data_loader.get_events_data()
+            return events_data.reservoir_version(tag)
+        except KeyError:
+            error_msg = "Can not find any data in this train job by given tag."
+            raise ParamValueError(error_msg)
+        except AttributeError:
+            logger.debug("Train job %r has been deleted or it has not loaded data.", train_id)
+
+        return None
+
     def _check_train_job_exist(self, train_id, loader_pool):
         """
         Check train job exist, if not exist, will raise exception.
@@ -917,6 +1359,16 @@ class DataManager:
                         self._brief_cache.update_cache(executor)
                         brief_cache_update += update_interval
                 executor.wait_all_tasks_finish()
+                self._detail_cache.save_index_cache()
+            image_blob_keys = self._detail_cache.get_image_blob_keys()
+            if SHARED_SUMMARY_STORE.is_reader():
+                SHARED_SUMMARY_STORE.publish_image_blob_keys(image_blob_keys)
+            else:
+                # The blobs of images loaded by any worker are kept, the removed loaders parse their images again
+                # if reloaded.
+                if SHARED_SUMMARY_STORE.enabled:
+                    image_blob_keys |= SHARED_SUMMARY_STORE.get_published_image_blob_keys()
+                IMAGE_BLOB_STORE.evict(image_blob_keys)
             with self._status_mutex:
                 if not self._brief_cache.has_content() and not self._detail_cache.has_content():
                     self.status = DataManagerStatus.INVALID.value
@@ -975,6 +1427,37 @@ class DataManager:
         self._check_status_valid()
         return self._detail_cache.list_tensors(train_id, tag)
 
+    def list_scalar_columns(self, train_id, tag):
+        """
+        List the columns of scalars of the given train job and tag without copying.
+
+        If the scalars can not find by the given tag, will raise exception.
+
+        Args:
+            train_id (str): ID for train job.
+            tag (str): The tag name.
+
+        Returns:
+            ScalarColumns, the read-only columns of steps, wall times and values.
+        """
+        self._check_status_valid()
+        return self._detail_cache.list_scalar_columns(train_id, tag)
+
+    def get_reservoir_version(self, train_id, tag):
+        """
+        Get the version of the data of the given train job and tag, which changes whenever the data changes.
+
+        Args:
+            train_id (str): ID for train job.
+            tag (str): The tag name.
+
+        Returns:
+            Union[int, None], the version of the reservoir of the tag, or None if the train job has not
+                loaded data.
+        """
+        self._check_status_valid()
+        return self._detail_cache.get_reservoir_version(train_id, tag)
+
     def _check_status_valid(self):
         """Check if the status is valid to load data."""
 
@@ -1012,6 +1495,24 @@ class DataManager:
         """Set data manger status."""
         self._status = status
 
+    def get_loading_queue_status(self):
+        """
+        Get status of the loading queue of train jobs.
+
+        Returns:
+            dict, including the queue depth, the number of pending requests and the status of each loader.
+        """
+        return self._detail_cache.get_loading_queue_status()
+
+    def get_detail_cache_memory_usage(self):
+        """
+        Get the approximate memory usage of the data loaded in detail cache.
+
+        Returns:
+            dict, including the memory limit, the total memory and the memory of each train job in bytes.
+        """
+        return self._detail_cache.get_memory_usage()
+
     def cache_train_job(self, train_id):
         """Cache given train job (async)."""
         brief_need_reload = self._brief_cache.cache_train_job(train_id)
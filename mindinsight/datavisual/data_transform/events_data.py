@@ -171,6 +171,118 @@ class EventsData:
             raise KeyError('TAG %r could not be found.' % tag)
         return self._reservoir_by_tag[tag].samples()
 
+    def dump_snapshot(self):
+        """
+        Dump a snapshot of all the tags and reservoirs, which can be pickled.
+
+        Returns:
+            dict, the snapshot of events data.
+        """
+        with self._reservoir_mutex_lock:
+            reservoirs = {tag: reservoir.dump_state() for tag, reservoir in self._reservoir_by_tag.items()}
+
+        tags_by_plugin = {}
+        for plugin_name, lock in list(self._tags_by_plugin_mutex_lock.items()):
+            with lock:
+                tags_by_plugin[plugin_name] = list(self._tags_by_plugin[plugin_name])
+
+        return dict(tags=list(self._tags),
+                    deleted_tags=set(self._deleted_tags),
+                    tags_by_plugin=tags_by_plugin,
+                    reservoirs=reservoirs)
+
+    def restore_snapshot(self, snapshot):
+        """
+        Restore the tags and reservoirs from a snapshot dumped by `dump_snapshot`.
+
+        Args:
+            snapshot (dict): The snapshot of events data.
+        """
+        self._tags = list(snapshot['tags'])
+        self._deleted_tags = set(snapshot['deleted_tags'])
+
+        reservoirs = {}
+        for plugin_name, tags in snapshot['tags_by_plugin'].items():
+            with self._tags_by_plugin_mutex_lock[plugin_name]:
+                self._tags_by_plugin[plugin_name] = list(tags)
+            for tag in tags:
+                if tag not in snapshot['reservoirs']:
+                    continue
+                tag_reservoir = reservoir.ReservoirFactory().create_reservoir(
+                    plugin_name, self._get_reservoir_size(plugin_name))
+                tag_reservoir.restore_state(snapshot['reservoirs'][tag])
+                reservoirs[tag] = tag_reservoir
+
+        with self._reservoir_mutex_lock:
+            self._reservoir_by_tag = reservoirs
+
+    def get_image_blob_keys(self):
+        """
+        Get the keys of the image blobs referenced by the image reservoirs.
+
+        Returns:
+            set[str], the keys of the image blobs.
+        """
+        with self._reservoir_mutex_lock:
+            reservoirs = dict(self._reservoir_by_tag)
+        with self._tags_by_plugin_mutex_lock[PluginNameEnum.IMAGE.value]:
+            tags = list(self._tags_by_plugin[PluginNameEnum.IMAGE.value])
+
+        keys = set()
+        for tag in tags:
+            if tag not in reservoirs:
+                continue
+            for sample in reservoirs[tag].samples():
+                keys.update(sample.value.blob_keys)
+        return keys
+
+    def get_nbytes_by_plugin(self):
+        """
+        Get the approximate memory(Bytes) of the reservoirs of each plugin.
+
+        Returns:
+            dict[str, int], the memory of each plugin.
+        """
+        with self._reservoir_mutex_lock:
+            reservoirs = dict(self._reservoir_by_tag)
+
+        nbytes_by_plugin = {}
+        for plugin_name, lock in list(self._tags_by_plugin_mutex_lock.items()):
+            with lock:
+                tags = list(self._tags_by_plugin[plugin_name])
+            nbytes_by_plugin[plugin_name] = sum(reservoirs[tag].nbytes() for tag in tags if tag in reservoirs)
+        return nbytes_by_plugin
+
+    def scalar_columns(self, tag):
+        """
+        Return the columns of all scalars of the tag without copying.
+
+        Args:
+            tag (str): The tag name.
+
+        Returns:
+            ScalarColumns, the read-only columns of steps, wall times and values.
+        """
+        tag_reservoir = self._reservoir_by_tag.get(tag)
+        if not isinstance(tag_reservoir, reservoir.ScalarReservoir):
+            raise KeyError('Scalar TAG %r could not be found.' % tag)
+        return tag_reservoir.columns()
+
+    def reservoir_version(self, tag):
+        """
+        Return the version of the reservoir of the tag, which changes whenever the data of the tag changes.
+
+        Args:
+            tag (str): The tag name.
+
+        Returns:
+            int, the version of the reservoir.
+        """
+        tag_reservoir = self._reservoir_by_tag.get(tag)
+        if tag_reservoir is None:
+            raise KeyError('TAG %r could not be found.' % tag)
+        return tag_reservoir.version
+
     def _is_out_of_order_step(self, step, tag):
         """
         If the current step is smaller than the latest one, it is out-of-order step.
@@ -182,11 +294,11 @@ class EventsData:
         Returns:
             bool, boolean value.
         """
-        if self.tensors(tag):
-            tensors = self.tensors(tag)
-            last_step = tensors[-1].step
-            if step <= last_step:
-                return True
+        if tag not in self._reservoir_by_tag:
+            raise KeyError('TAG %r could not be found.' % tag)
+        last_step = self._reservoir_by_tag[tag].last_step()
+        if last_step is not None and step <= last_step:
+            return True
         return False
 
     @staticmethod
@@ -202,8 +314,7 @@ class EventsData:
         Returns:
             int, the number of items removed.
         """
-        cnt_out_of_order = tensor_reservoir.remove_sample(
-            lambda x: x.step < start_step or (x.step > start_step and x.filename == filename))
+        cnt_out_of_order = tensor_reservoir.remove_out_of_order_samples(filename, start_step)
 
         return cnt_out_of_order
 
@@ -42,6 +42,9 @@ class Graph:
     # In the same scope, the number of children of the same type exceeds this threshold, and we will combine them.
     MIN_GROUP_NODE_COUNT = 5
 
+    # Approximate memory(Bytes) of a node, including its attributes, inputs and outputs.
+    _NODE_BYTES = 2048
+
     def __init__(self):
         # Used to cache all nodes, and the key is node name, value is `Node` object.
         self._normal_node_map = {}
@@ -456,6 +459,11 @@ class Graph:
         """Get the normal node count."""
         return len(self._normal_node_map)
 
+    @property
+    def nbytes(self):
+        """Get approximate memory(Bytes) of the graph."""
+        return self.normal_node_count * self._NODE_BYTES
+
     def _cache_node(self, node):
         """Store the node in the cache."""
         # Notice:
@@ -15,6 +15,8 @@
 """Histogram data."""
 import math
 
+import numpy as np
+
 from mindinsight.utils.exceptions import ParamValueError
 from mindinsight.datavisual.utils.utils import calc_histogram_bins
 
@@ -83,6 +85,8 @@ class Histogram:
 
     # Max quantity of original buckets.
     MAX_ORIGINAL_BUCKETS_COUNT = 90
+    # Approximate memory(Bytes) of a bucket object or tuple.
+    _BUCKET_BYTES = 200
 
     def __init__(self, buckets, max_val, min_val, count):
         self._visual_max = max_val
@@ -91,8 +95,20 @@ class Histogram:
         self._original_buckets = buckets
         # default bin number
         self._visual_bins = calc_histogram_bins(count)
+        # The visual range set by caller, the visual max and min may be adjusted when re-sampling.
+        self._visual_range = (max_val, min_val, self._visual_bins)
         # Note that tuple is immutable, so sharing tuple is often safe.
+        # Re-sampled buckets are stored as tuples of (left, width, count).
         self._re_sampled_buckets = ()
+        self._original_columns = None
+
+    @property
+    def nbytes(self):
+        """Gets approximate memory(Bytes) of original buckets and re-sampled buckets."""
+        nbytes = (len(self._original_buckets) + len(self._re_sampled_buckets)) * self._BUCKET_BYTES
+        if self._original_columns is not None:
+            nbytes += sum(column.nbytes for column in self._original_columns)
+        return nbytes
 
     @property
     def original_buckets_count(self):
@@ -124,99 +140,128 @@ class Histogram:
         if bins < 1:
             raise ParamValueError("Invalid input bins({}). Must be greater than 0.".format(bins))
 
+        if self._re_sampled_buckets and (max_val, min_val, bins) == self._visual_range:
+            # Re-sampled buckets are still valid for the same visual range.
+            return
+
         self._visual_max = max_val
         self._visual_min = min_val
         self._visual_bins = bins
+        self._visual_range = (max_val, min_val, bins)
 
         # mark _re_sampled_buckets to empty
         self._re_sampled_buckets = ()
 
-    def _calc_intersection_len(self, max1, min1, max2, min2):
-        """Calculates intersection length of [min1, max1] and [min2, max2]."""
-        if max1 < min1:
-            raise ParamValueError(
-                "Invalid input. max1({}) is less than min1({}).".format(max1, min1))
+    @staticmethod
+    def _get_visual_buckets_edges(visual_max, visual_min, visual_bins):
+        """
+        Calculates the edges of visual buckets.
 
-        if max2 < min2:
-            raise ParamValueError(
-                "Invalid input. max2({}) is less than min2({}).".format(max2, min2))
-
-        if min1 <= min2:
-            if max1 <= min2:
-                # return value must be calculated by max1.__sub__
-                return max1 - max1
-            if max1 <= max2:
-                return max1 - min2
-            # max1 > max2
-            return max2 - min2
-
-        # min1 > min2
-        if max2 <= min1:
-            return max2 - max2
-        if max2 <= max1:
-            return max2 - min1
-        return max1 - min1
+        Args:
+            visual_max (float): Max value for visual histogram.
+            visual_min (float): Min value for visual histogram.
+            visual_bins (int): Bins number for visual histogram.
 
-    def _re_sample_buckets(self):
-        """Re-samples buckets according to visual_max, visual_min and visual_bins."""
-        if self._visual_max == self._visual_min:
-            # Adjust visual range if max equals min.
-            self._visual_max += 0.5
-            self._visual_min -= 0.5
+        Returns:
+            tuple, contains the width, the left edges and the right edges of visual buckets.
+        """
+        width = (visual_max - visual_min) / visual_bins
+        lefts = [visual_min + width * i for i in range(visual_bins)]
+        rights = [left + width for left in lefts]
+        return width, lefts, rights
+
+    def _get_original_columns(self):
+        """Gets the left edges, right edges, widths and counts of original buckets as float64 arrays."""
+        if self._original_columns is None:
+            buckets = self._original_buckets
+            lefts, rights, counts = (np.array([getattr(bucket, name) for bucket in buckets], dtype=np.float64)
+                                     for name in ('left', 'right', 'count'))
+            # The width is calculated from the edges, so a fully covered bucket is counted exactly once
+            # even if the edges are rounded from lower precision.
+            self._original_columns = (lefts, rights, rights - lefts, counts)
+        return self._original_columns
+
+    @staticmethod
+    def re_sample_histograms(histograms):
+        """
+        Re-samples the out of date buckets of histograms in one vectorized pass.
 
-        width = (self._visual_max - self._visual_min) / self._visual_bins
+        Histograms of all steps in a tag share the same visual range, so the original buckets of them are stacked
+        into arrays and re-sampled together. The estimated count of a visual bucket is the sum of counts of the
+        original buckets weighted by the intersection length, and a zero width original bucket is counted by the
+        visual bucket which contains it.
 
-        if not self._count:
-            self._re_sampled_buckets = tuple(
-                Bucket(self._visual_min + width * i, width, 0)
-                for i in range(self._visual_bins))
+        Args:
+            histograms (Iterable[Histogram]): The histograms to be re-sampled.
+        """
+        groups = {}
+        for histogram in histograms:
+            if histogram._re_sampled_buckets:
+                continue
+            if histogram._visual_max == histogram._visual_min:
+                # Adjust visual range if max equals min.
+                histogram._visual_max += 0.5
+                histogram._visual_min -= 0.5
+            visual_range = (histogram._visual_max, histogram._visual_min, histogram._visual_bins)
+            groups.setdefault(visual_range, []).append(histogram)
+
+        for visual_range, group in groups.items():
+            Histogram._re_sample_group(group, *visual_range)
+
+    @staticmethod
+    def _re_sample_group(histograms, visual_max, visual_min, visual_bins):
+        """Re-samples buckets of histograms with the same visual range."""
+        width, lefts, rights = Histogram._get_visual_buckets_edges(visual_max, visual_min, visual_bins)
+        empty_counts = [0] * visual_bins
+        valid_histograms = [histogram for histogram in histograms if histogram._count]
+        for histogram in histograms:
+            if not histogram._count:
+                histogram._re_sampled_buckets = tuple(zip(lefts, [width] * visual_bins, empty_counts))
+        if not valid_histograms:
             return
 
-        re_sampled = []
-        original_pos = 0
-        original_bucket = self._original_buckets[original_pos]
-        for i in range(self._visual_bins):
-            cur_left = self._visual_min + width * i
-            cur_right = cur_left + width
-            cur_estimated_count = 0.0
-
-            # Skip no bucket range.
-            if cur_right <= original_bucket.left:
-                re_sampled.append(Bucket(cur_left, width, math.ceil(cur_estimated_count)))
-                continue
+        # Stack original buckets into arrays of shape (histograms, 1, original buckets). Padding buckets have
+        # zero count, so they make no contribution.
+        max_buckets_count = max(histogram.original_buckets_count for histogram in valid_histograms)
+        shape = (len(valid_histograms), 1, max_buckets_count)
+        original_lefts = np.zeros(shape, dtype=np.float64)
+        original_rights = np.zeros(shape, dtype=np.float64)
+        original_widths = np.ones(shape, dtype=np.float64)
+        original_counts = np.zeros(shape, dtype=np.float64)
+        for row, histogram in enumerate(valid_histograms):
+            columns = histogram._get_original_columns()
+            buckets_count = len(columns[0])
+            for stacked, column in zip((original_lefts, original_rights, original_widths, original_counts), columns):
+                stacked[row, 0, :buckets_count] = column
+
+        # Visual buckets are in shape of (1, visual buckets, 1).
+        visual_lefts = np.array(lefts, dtype=np.float64).reshape((1, -1, 1))
+        visual_rights = np.array(rights, dtype=np.float64).reshape((1, -1, 1))
+
+        # The overlap matrix is in shape of (histograms, visual buckets, original buckets). Multiplying it by the
+        # count density of original buckets sums the estimated counts without a temporary of the same shape.
+        intersections = np.minimum(visual_rights, original_rights) - np.maximum(visual_lefts, original_lefts)
+        np.maximum(intersections, 0, out=intersections)
+        zero_width = original_widths == 0
+        densities = np.where(zero_width, 0, original_counts / np.where(zero_width, 1, original_widths))
+        estimated_counts = np.matmul(intersections, densities.transpose((0, 2, 1)))[:, :, 0]
+
+        if zero_width.any():
+            # A bucket of zero width belongs to the visual bucket containing its left edge.
+            contained = (visual_lefts <= original_lefts) & (original_lefts < visual_rights)
+            # The right edge of the last visual bucket is closed.
+            contained[:, -1, :] |= original_lefts[:, 0, :] == visual_rights[0, -1, 0]
+            zero_width_counts = np.where(zero_width, original_counts, 0).transpose((0, 2, 1))
+            estimated_counts += np.matmul(contained.astype(np.float64), zero_width_counts)[:, :, 0]
+
+        counts = np.ceil(estimated_counts).astype(np.int64).tolist()
+        widths = [width] * visual_bins
+        for histogram, histogram_counts in zip(valid_histograms, counts):
+            histogram._re_sampled_buckets = tuple(zip(lefts, widths, histogram_counts))
 
-            # Skip no intersect range.
-            while cur_left >= original_bucket.right:
-                original_pos += 1
-                if original_pos >= len(self._original_buckets):
-                    break
-                original_bucket = self._original_buckets[original_pos]
-
-            # entering with this condition: cur_right > original_bucket.left and cur_left < original_bucket.right
-            while True:
-                if original_pos >= len(self._original_buckets):
-                    break
-                original_bucket = self._original_buckets[original_pos]
-
-                intersection = self._calc_intersection_len(
-                    min1=cur_left, max1=cur_right,
-                    min2=original_bucket.left, max2=original_bucket.right)
-                if not original_bucket.width:
-                    estimated_count = original_bucket.count
-                else:
-                    estimated_count = (intersection / original_bucket.width) * original_bucket.count
-
-                cur_estimated_count += estimated_count
-                if cur_right > original_bucket.right:
-                    # Need to sample next original bucket to this visual bucket.
-                    original_pos += 1
-                else:
-                    # Current visual bucket has taken all intersect buckets into account.
-                    break
-
-            re_sampled.append(Bucket(cur_left, width, math.ceil(cur_estimated_count)))
-
-        self._re_sampled_buckets = tuple(re_sampled)
+    def _re_sample_buckets(self):
+        """Re-samples buckets according to visual_max, visual_min and visual_bins."""
+        self.re_sample_histograms((self,))
 
     def buckets(self, convert_to_tuple=True):
         """
@@ -232,6 +277,6 @@ class Histogram:
             self._re_sample_buckets()
 
         if not convert_to_tuple:
-            return self._re_sampled_buckets
+            return tuple(Bucket(left, width, count) for left, width, count in self._re_sampled_buckets)
 
-        return tuple(bucket.as_tuple() for bucket in self._re_sampled_buckets)
+        return self._re_sampled_buckets
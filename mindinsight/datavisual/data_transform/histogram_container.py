@@ -54,6 +54,11 @@ class HistogramContainer:
         """Gets histogram data"""
         return self._histogram
 
+    @property
+    def nbytes(self):
+        """Gets approximate memory(Bytes) of the histogram data."""
+        return self._histogram.nbytes
+
     def buckets(self):
         """Gets histogram buckets"""
         return self._histogram.buckets()
@@ -0,0 +1,223 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+On-disk blob store of encoded images.
+
+Encoded images are written into the store by the parsing workers and only their keys are kept in the
+reservoirs, so images do not occupy the memory of the web service and are not copied between processes.
+Blobs are named by the digest of their content, so the same image is stored once, and the workers of the
+web service and a restarted server with summary index cache share the blobs. Each port has its own store, so
+servers on different ports never remove the blobs of each other.
+
+The store is bounded by disk usage. Only the loader worker removes blobs, and the blobs referenced least recently
+among the blobs not referenced by loaded images of any worker are removed first, so a blob is never removed while
+an image still points to it. The sizes of blobs are tracked in memory, and the directory is scanned again only
+at intervals to find the blobs which have never been referenced, such as the blobs left by the last run.
+"""
+import hashlib
+import os
+import time
+
+from mindinsight.conf import settings
+from mindinsight.datavisual.common.log import logger
+
+_BLOB_FILE_SUFFIX = '.blob'
+
+
+class ImageBlobStore:
+    """
+    Blob store of encoded images in a directory.
+
+    Args:
+        store_dir (Optional[str]): Directory of the blobs. If it is None, a directory in workspace for the
+            current port will be used. Default: None.
+        disk_limit (Optional[int]): Max disk usage(Bytes) of the blobs. If it is None,
+            `IMAGE_BLOB_STORE_DISK_LIMIT` in settings will be used. If it equals 0, the store is disabled.
+            Default: None.
+    """
+
+    def __init__(self, store_dir=None, disk_limit=None):
+        self._store_dir = store_dir
+        self._disk_limit = disk_limit
+        # Size and last referenced time of the blobs known by the evicting process, key is the key of blob.
+        self._blobs = {}
+        self._total_size = 0
+        self._scanned_time = None
+
+    @property
+    def store_dir(self):
+        """Get the directory of blobs."""
+        if self._store_dir is not None:
+            return self._store_dir
+        return os.path.join(settings.WORKSPACE, 'image_blob', str(settings.PORT))
+
+    @property
+    def disk_limit(self):
+        """Get the max disk usage(Bytes) of blobs."""
+        if self._disk_limit is not None:
+            return self._disk_limit
+        return settings.IMAGE_BLOB_STORE_DISK_LIMIT * 1024 * 1024
+
+    @property
+    def enabled(self):
+        """Whether images are stored in the store instead of memory."""
+        return self.disk_limit > 0
+
+    def _get_blob_path(self, key):
+        """Get the path of the blob."""
+        return os.path.join(self.store_dir, key + _BLOB_FILE_SUFFIX)
+
+    def put(self, data):
+        """
+        Put the data into the store.
+
+        The blob is written to a temporary file and then renamed, so a reader never gets a partial blob.
+
+        Args:
+            data (bytes): The data to be stored.
+
+        Returns:
+            Union[str, None], the key of the blob, or None if the data can not be stored.
+        """
+        key = hashlib.sha256(data).hexdigest()
+        blob_path = self._get_blob_path(key)
+        if os.path.isfile(blob_path):
+            return key
+
+        tmp_path = '{}.{}.tmp'.format(blob_path, os.getpid())
+        try:
+            os.makedirs(self.store_dir, mode=0o700, exist_ok=True)
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            with os.fdopen(os.open(tmp_path, flags, 0o600), 'wb') as blob_file:
+                blob_file.write(data)
+            os.replace(tmp_path, blob_path)
+        except OSError as ex:
+            logger.warning("Save image blob failed, detail: %r.", str(ex))
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+        return key
+
+    def exists(self, key):
+        """
+        Check whether the blob exists.
+
+        Args:
+            key (str): The key of the blob.
+
+        Returns:
+            bool, whether the blob exists.
+        """
+        return os.path.isfile(self._get_blob_path(key))
+
+    def get(self, key):
+        """
+        Get the data of the blob.
+
+        Args:
+            key (str): The key of the blob.
+
+        Returns:
+            Union[bytes, None], the data, or None if the blob has been removed.
+        """
+        try:
+            with open(self._get_blob_path(key), 'rb') as blob_file:
+                data = blob_file.read()
+        except OSError:
+            logger.debug("Image blob %s does not exist.", key)
+            return None
+        return data
+
+    def _scan(self):
+        """Scan the directory to find all the blobs, the modification time of a new blob is its referenced time."""
+        blobs = {}
+        try:
+            with os.scandir(self.store_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(_BLOB_FILE_SUFFIX):
+                        continue
+                    key = entry.name[:-len(_BLOB_FILE_SUFFIX)]
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    referenced_time = self._blobs[key][1] if key in self._blobs else stat.st_mtime
+                    blobs[key] = [stat.st_size, referenced_time]
+        except OSError:
+            pass
+        self._blobs = blobs
+        self._total_size = sum(size for size, _ in blobs.values())
+
+    def _reference(self, keys, referenced_time):
+        """Update the referenced time of the blobs, only the blobs not known before are checked on disk."""
+        for key in keys:
+            blob = self._blobs.get(key)
+            if blob is not None:
+                blob[1] = referenced_time
+                continue
+            try:
+                size = os.stat(self._get_blob_path(key)).st_size
+            except OSError:
+                continue
+            self._blobs[key] = [size, referenced_time]
+            self._total_size += size
+
+    def evict(self, referenced_keys=frozenset()):
+        """
+        Remove the blobs referenced least recently until the disk usage is not greater than the limit.
+
+        The referenced blobs are never removed, so the disk usage may still exceed the limit if the referenced
+        blobs exceed it. The store should be evicted by only one process.
+
+        Args:
+            referenced_keys (Collection[str]): The keys of the blobs referenced by loaded images.
+                Default: frozenset().
+
+        Returns:
+            int, the number of blobs removed.
+        """
+        if not self.enabled:
+            return 0
+
+        now = time.time()
+        if self._scanned_time is None or now - self._scanned_time >= settings.IMAGE_BLOB_STORE_SCAN_INTERVAL:
+            self._scan()
+            self._scanned_time = now
+        self._reference(referenced_keys, now)
+
+        removed_count = 0
+        if self._total_size > self.disk_limit:
+            blobs = sorted((referenced_time, key) for key, (_, referenced_time) in self._blobs.items()
+                           if key not in referenced_keys)
+            for _, key in blobs:
+                if self._total_size <= self.disk_limit:
+                    break
+                try:
+                    os.remove(self._get_blob_path(key))
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue
+                self._total_size -= self._blobs.pop(key)[0]
+                removed_count += 1
+        if removed_count:
+            logger.info("Remove %d image blobs to limit the disk usage.", removed_count)
+        if self._total_size > self.disk_limit:
+            logger.warning("The disk usage %d of image blobs referenced by loaded images exceeds the limit %d.",
+                           self._total_size, self.disk_limit)
+        return removed_count
+
+
+IMAGE_BLOB_STORE = ImageBlobStore()
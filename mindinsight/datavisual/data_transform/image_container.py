@@ -13,13 +13,59 @@
 # limitations under the License.
 # ============================================================================
 """Image container."""
+import hashlib
+import io
+
+from mindinsight.conf import settings
+from mindinsight.datavisual.common.log import logger
+from mindinsight.datavisual.data_transform.image_blob_store import IMAGE_BLOB_STORE
 from mindinsight.datavisual.proto_files.mindinsight_summary_pb2 import Summary
 
+try:
+    from PIL import Image
+except ImportError:
+    # Pillow is optional, thumbnails are not generated without it.
+    Image = None
+
+
+def create_thumbnail(encoded_image, size):
+    """
+    Create the thumbnail of the image.
+
+    Args:
+        encoded_image (bytes): The encoded image.
+        size (int): The max width and height of the thumbnail.
+
+    Returns:
+        Union[bytes, None], the encoded thumbnail, or None if the image is not larger than the size or it
+            can not be decoded.
+    """
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(encoded_image)) as image:
+            if image.width <= size and image.height <= size:
+                return None
+            image.thumbnail((size, size))
+            if image.mode not in ('RGB', 'L'):
+                image_format = 'PNG'
+            else:
+                image_format = 'JPEG'
+            output = io.BytesIO()
+            image.save(output, format=image_format)
+    except (OSError, ValueError, Image.DecompressionBombError) as ex:
+        logger.debug("Create thumbnail failed, detail: %r.", str(ex))
+        return None
+    return output.getvalue()
+
 
 class ImageContainer:
     """
     Container for image to allow pickling.
 
+    The encoded image and its thumbnail are kept in the image blob store if it is enabled, so only their keys
+    are pickled. They are kept in memory if the store is disabled or fails.
+
     Args:
         image_message (Summary.Image): Image proto buffer message.
     """
@@ -27,4 +73,76 @@ class ImageContainer:
         self.height = image_message.height
         self.width = image_message.width
         self.colorspace = image_message.colorspace
-        self.encoded_image = image_message.encoded_image
+        self._image, self._image_key = self._store(image_message.encoded_image)
+        thumbnail = create_thumbnail(image_message.encoded_image, settings.IMAGE_THUMBNAIL_SIZE)
+        if thumbnail is None:
+            self._thumbnail, self._thumbnail_key = None, None
+        else:
+            self._thumbnail, self._thumbnail_key = self._store(thumbnail)
+
+    @staticmethod
+    def _store(data):
+        """
+        Store the data into the blob store.
+
+        Args:
+            data (bytes): The data to be stored.
+
+        Returns:
+            tuple[Union[bytes, None], Union[str, None]], the data kept in memory and the key of the blob.
+        """
+        if IMAGE_BLOB_STORE.enabled:
+            key = IMAGE_BLOB_STORE.put(data)
+            if key is not None:
+                return None, key
+        return data, None
+
+    @staticmethod
+    def _load(data, key):
+        """Load the data from memory or the blob store."""
+        if data is not None:
+            return data
+        return IMAGE_BLOB_STORE.get(key)
+
+    @property
+    def encoded_image(self):
+        """Get the encoded image, it is None if the image has been removed from the blob store."""
+        return self._load(self._image, self._image_key)
+
+    @property
+    def thumbnail(self):
+        """Get the encoded thumbnail, or the encoded image if it has no thumbnail."""
+        if self._thumbnail is None and self._thumbnail_key is None:
+            return self.encoded_image
+        return self._load(self._thumbnail, self._thumbnail_key)
+
+    def get_digest(self, thumbnail=False):
+        """
+        Get the SHA-256 digest of the encoded image or thumbnail.
+
+        The key of the blob is the digest, so it is computed only if the data is kept in memory.
+
+        Args:
+            thumbnail (bool): Whether to get the digest of the thumbnail, the digest of the encoded image is got
+                if it has no thumbnail. Default: False.
+
+        Returns:
+            str, the hex digest.
+        """
+        if thumbnail and (self._thumbnail is not None or self._thumbnail_key is not None):
+            data, key = self._thumbnail, self._thumbnail_key
+        else:
+            data, key = self._image, self._image_key
+        if key is not None:
+            return key
+        return hashlib.sha256(data).hexdigest()
+
+    @property
+    def blob_keys(self):
+        """Get the keys of the encoded image and thumbnail kept in the blob store."""
+        return [key for key in (self._image_key, self._thumbnail_key) if key is not None]
+
+    @property
+    def nbytes(self):
+        """Get memory(Bytes) of the encoded image and thumbnail kept in memory."""
+        return len(self._image or b'') + len(self._thumbnail or b'')
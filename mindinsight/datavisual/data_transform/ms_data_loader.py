@@ -20,11 +20,12 @@ Each instance will read an entire run, a run can contain one or
 more log file.
 """
 import re
-import struct
+import time
 
 from google.protobuf.message import DecodeError
 from google.protobuf.text_format import ParseError
 
+from mindinsight.conf import settings
 from mindinsight.datavisual.common import exceptions
 from mindinsight.datavisual.common.enums import PluginNameEnum
 from mindinsight.datavisual.common.log import logger
@@ -34,17 +35,19 @@ from mindinsight.datavisual.data_transform.events_data import TensorEvent
 from mindinsight.datavisual.data_transform.graph import MSGraph
 from mindinsight.datavisual.data_transform.histogram import Histogram
 from mindinsight.datavisual.data_transform.histogram_container import HistogramContainer
+from mindinsight.datavisual.data_transform.image_blob_store import IMAGE_BLOB_STORE
 from mindinsight.datavisual.data_transform.image_container import ImageContainer
+from mindinsight.datavisual.data_transform.summary_record_reader import SummaryRecordReader
 from mindinsight.datavisual.data_transform.tensor_container import TensorContainer, MAX_TENSOR_COUNT
 from mindinsight.datavisual.proto_files import mindinsight_anf_ir_pb2 as anf_ir_pb2
 from mindinsight.datavisual.proto_files import mindinsight_summary_pb2 as summary_pb2
-from mindinsight.datavisual.utils import crc32
 from mindinsight.utils.computing_resource_mgr import ComputingResourceManager, Executor
+from mindinsight.utils.exceptions import PathNotExistError
 from mindinsight.utils.exceptions import UnknownError
 
-HEADER_SIZE = 8
-CRC_STR_SIZE = 4
 MAX_EVENT_STRING = 500000000
+_EVENT_COUNT_PER_PARSE_TASK = settings.MAX_EVENT_COUNT_PER_PARSE_TASK
+_EVENT_BYTES_PER_PARSE_TASK = settings.MAX_EVENT_BYTES_PER_PARSE_TASK
 
 
 class MSDataLoader:
@@ -64,10 +67,118 @@ class MSDataLoader:
         self._parser_list.append(_SummaryParser(summary_dir))
         self._parser_list.append(_PbParser(summary_dir))
 
+        self._saved_parser_states = None
+        self._index_saved_time = 0
+
     def get_events_data(self):
         """Return events data read from log file."""
         return self._events_data
 
+    def load_index(self, index_cache):
+        """
+        Restore parsed offsets and events data from the index cache.
+
+        The index is ignored if any file parsed before has been deleted or modified other than appended, or any
+        image blob referenced by the index has been removed from the image blob store.
+
+        Args:
+            index_cache (SummaryIndexCache): The summary index cache.
+
+        Returns:
+            bool, True if the index is restored.
+        """
+        index = index_cache.load(self._summary_dir)
+        if index is None:
+            return False
+
+        try:
+            parser_states = index['parser_states']
+            if len(parser_states) != len(self._parser_list) or not self._is_index_valid(index):
+                logger.info("Summary files have been changed, ignore the summary index, summary_dir: %s.",
+                            self._summary_dir)
+                return False
+
+            for parser, state in zip(self._parser_list, parser_states):
+                parser.restore_state(state)
+            self._events_data.restore_snapshot(index['events_data'])
+        except (KeyError, TypeError, ValueError, OSError) as ex:
+            logger.warning("Restore summary index failed, summary_dir: %s, detail: %r.", self._summary_dir, str(ex))
+            self.__init__(self._summary_dir)
+            return False
+
+        if not all(IMAGE_BLOB_STORE.exists(key) for key in self._events_data.get_image_blob_keys()):
+            # The images are parsed from summary files again to restore the removed blobs.
+            logger.info("Image blobs have been removed, ignore the summary index, summary_dir: %s.",
+                        self._summary_dir)
+            self.__init__(self._summary_dir)
+            return False
+
+        self._valid_filenames = list(index['file_stats'])
+        self._saved_parser_states = parser_states
+        self._index_saved_time = time.time()
+        return True
+
+    def save_index(self, index_cache, save_interval=None):
+        """
+        Save parsed offsets and events data to the index cache.
+
+        The index is saved only if the parsed offsets have been changed, and not more than once
+        in `save_interval` seconds. It should be called when there is no pending parsing task,
+        so the offsets are consistent with the events data.
+
+        Args:
+            index_cache (SummaryIndexCache): The summary index cache.
+            save_interval (Optional[int]): Minimum interval(Seconds) between two saves. If it is None,
+                `SUMMARY_INDEX_CACHE_SAVE_INTERVAL` will be used. Default: None.
+        """
+        if save_interval is None:
+            save_interval = settings.SUMMARY_INDEX_CACHE_SAVE_INTERVAL
+        parser_states = [parser.dump_state() for parser in self._parser_list]
+        if parser_states == self._saved_parser_states:
+            return
+        if time.time() - self._index_saved_time < save_interval:
+            return
+
+        file_stats = {}
+        for filename in self._valid_filenames:
+            try:
+                stat = FileHandler.file_stat(FileHandler.join(self._summary_dir, filename))
+            except PathNotExistError:
+                return
+            file_stats[filename] = (stat.size, stat.mtime)
+
+        index = dict(file_stats=file_stats,
+                     parser_states=parser_states,
+                     events_data=self._events_data.dump_snapshot())
+        index_cache.save(self._summary_dir, index)
+        self._saved_parser_states = parser_states
+        self._index_saved_time = time.time()
+
+    def _is_index_valid(self, index):
+        """
+        Check whether the files recorded in the index are unchanged.
+
+        The latest summary file is allowed to be appended.
+
+        Args:
+            index (dict): The summary index.
+
+        Returns:
+            bool, True if the index is valid.
+        """
+        appendable_filename = index['parser_states'][0].get('latest_filename')
+        for filename, (size, mtime) in index['file_stats'].items():
+            try:
+                stat = FileHandler.file_stat(FileHandler.join(self._summary_dir, filename))
+            except PathNotExistError:
+                return False
+            if (stat.size, stat.mtime) == (size, mtime):
+                continue
+            if filename == appendable_filename and stat.size > size:
+                continue
+            return False
+        return True
+
     def _check_files_deleted(self, filenames, old_filenames):
         """
         Check the file list for updates.
@@ -171,6 +282,24 @@ class _Parser:
         """
         raise NotImplementedError
 
+    def dump_state(self):
+        """
+        Dump the parsing progress, which can be pickled.
+
+        Returns:
+            dict, the parsing progress.
+        """
+        return dict(latest_filename=self._latest_filename)
+
+    def restore_state(self, state):
+        """
+        Restore the parsing progress dumped by `dump_state`.
+
+        Args:
+            state (dict): The parsing progress.
+        """
+        self._latest_filename = state['latest_filename']
+
     def filter_files(self, filenames):
         """
         Gets a list of files that this parsing class can parse.
@@ -191,6 +320,17 @@ class _PbParser(_Parser):
         super(_PbParser, self).__init__(summary_dir)
         self._latest_mtime = 0
 
+    def dump_state(self):
+        """Dump the parsing progress, see parent class for details."""
+        state = super(_PbParser, self).dump_state()
+        state.update(latest_mtime=self._latest_mtime)
+        return state
+
+    def restore_state(self, state):
+        """Restore the parsing progress, see parent class for details."""
+        super(_PbParser, self).restore_state(state)
+        self._latest_mtime = state['latest_mtime']
+
     def parse_files(self, executor, filenames, events_data):
         pb_filenames = self.filter_files(filenames)
         pb_filenames = self.sort_files(pb_filenames)
@@ -297,9 +437,28 @@ class _SummaryParser(_Parser):
     def __init__(self, summary_dir):
         super(_SummaryParser, self).__init__(summary_dir)
         self._latest_file_size = 0
-        self._summary_file_handler = None
+        self._summary_record_reader = None
         self._events_data = None
 
+    def dump_state(self):
+        """Dump the parsing progress, see parent class for details."""
+        state = super(_SummaryParser, self).dump_state()
+        offset = self._summary_record_reader.offset if self._summary_record_reader is not None else 0
+        state.update(latest_file_size=self._latest_file_size, offset=offset)
+        return state
+
+    def restore_state(self, state):
+        """Restore the parsing progress, see parent class for details."""
+        super(_SummaryParser, self).restore_state(state)
+        self._latest_file_size = state['latest_file_size']
+        if self._summary_record_reader is not None:
+            self._summary_record_reader.close()
+            self._summary_record_reader = None
+        if self._latest_filename:
+            file_path = FileHandler.join(self._summary_dir, self._latest_filename)
+            self._summary_record_reader = SummaryRecordReader(file_path)
+            self._summary_record_reader.reset_offset(state['offset'])
+
     def parse_files(self, executor, filenames, events_data):
         """
         Load summary file and parse file content.
@@ -323,7 +482,9 @@ class _SummaryParser(_Parser):
             file_path = FileHandler.join(self._summary_dir, filename)
 
             if filename != self._latest_filename:
-                self._summary_file_handler = FileHandler(file_path, 'rb')
+                if self._summary_record_reader is not None:
+                    self._summary_record_reader.close()
+                self._summary_record_reader = SummaryRecordReader(file_path)
                 self._latest_filename = filename
                 self._latest_file_size = 0
 
@@ -332,8 +493,8 @@ class _SummaryParser(_Parser):
                 continue
 
             try:
-                if not self._load_single_file(self._summary_file_handler, executor):
-                    self._latest_file_size = self._summary_file_handler.offset
+                if not self._load_single_file(self._summary_record_reader, executor):
+                    self._latest_file_size = self._summary_record_reader.offset
                 else:
                     self._latest_file_size = new_size
                 # Wait for data in this file to be processed to avoid loading multiple files at the same time.
@@ -358,111 +519,99 @@ class _SummaryParser(_Parser):
             lambda filename: (re.search(r'summary\.\d+', filename)
                               and not filename.endswith("_lineage")), filenames))
 
-    def _load_single_file(self, file_handler, executor):
+    def _load_single_file(self, record_reader, executor):
         """
         Load a log file data.
 
+        Events are framed into batches, each batch is limited by `MAX_EVENT_COUNT_PER_PARSE_TASK` and
+        `MAX_EVENT_BYTES_PER_PARSE_TASK`, and parsed by one task of the executor.
+
         Args:
-            file_handler (FileHandler): A file handler.
+            record_reader (SummaryRecordReader): A summary record reader.
             executor (Executor): The executor instance.
 
         Returns:
             bool, True if the summary file is finished loading.
         """
-        while True:
-            start_offset = file_handler.offset
+        event_strs = []
+        try:
+            return self._frame_events(record_reader, event_strs)
+        finally:
+            if event_strs:
+                self._submit_events_parse(executor, event_strs)
+
+    def _frame_events(self, record_reader, event_strs):
+        """
+        Frame a batch of events from the summary file.
+
+        Args:
+            record_reader (SummaryRecordReader): A summary record reader.
+            event_strs (list[bytes]): The list to collect event strings.
+
+        Returns:
+            bool, True if the summary file is finished loading.
+        """
+        batch_bytes = 0
+        while len(event_strs) < _EVENT_COUNT_PER_PARSE_TASK and batch_bytes < _EVENT_BYTES_PER_PARSE_TASK:
+            start_offset = record_reader.offset
             try:
-                event_str = self._event_load(file_handler)
-                if event_str is None:
-                    file_handler.reset_offset(start_offset)
+                event_view = record_reader.read_record()
+                if event_view is None:
+                    record_reader.reset_offset(start_offset)
                     return True
-                if len(event_str) > MAX_EVENT_STRING:
+                if len(event_view) > MAX_EVENT_STRING:
                     logger.warning("file_path: %s, event string: %d exceeds %d and drop it.",
-                                   file_handler.file_path, len(event_str), MAX_EVENT_STRING)
+                                   record_reader.file_path, len(event_view), MAX_EVENT_STRING)
                     continue
 
-                future = executor.submit(self._event_parse, event_str, self._latest_filename)
-
-                def _add_tensor_event_callback(future_value):
-                    try:
-                        tensor_values = future_value.result()
-                        for tensor_value in tensor_values:
-                            if tensor_value.plugin_name == PluginNameEnum.GRAPH.value:
-                                try:
-                                    graph_tags = self._events_data.list_tags_by_plugin(PluginNameEnum.GRAPH.value)
-                                except KeyError:
-                                    graph_tags = []
-
-                                summary_tags = self.filter_files(graph_tags)
-                                for tag in summary_tags:
-                                    self._events_data.delete_tensor_event(tag)
-
-                            self._events_data.add_tensor_event(tensor_value)
-                    except Exception as exc:
-                        # Log exception for debugging.
-                        logger.exception(exc)
-                        raise
-
-                future.add_done_callback(_add_tensor_event_callback)
-                return False
+                # The event view can not be sent to other processes, this is the only copy of the event body.
+                event_strs.append(event_view.tobytes())
+                batch_bytes += len(event_view)
             except exceptions.CRCFailedError:
-                file_handler.reset_offset(start_offset)
+                record_reader.reset_offset(start_offset)
                 logger.warning("Check crc faild and ignore this file, file_path=%s, "
-                               "offset=%s.", file_handler.file_path, file_handler.offset)
+                               "offset=%s.", record_reader.file_path, record_reader.offset)
                 return True
             except (OSError, DecodeError, exceptions.MindInsightException) as ex:
                 logger.warning("Parse log file fail, and ignore this file, detail: %r,"
-                               "file path: %s.", str(ex), file_handler.file_path)
+                               "file path: %s.", str(ex), record_reader.file_path)
                 return True
             except Exception as ex:
                 logger.exception(ex)
                 raise UnknownError(str(ex))
+        return False
 
-    def _event_load(self, file_handler):
+    def _submit_events_parse(self, executor, event_strs):
         """
-        Load binary string to event string.
+        Submit a batch of event strings to the executor and add the parsed tensor events to `EventsData`.
 
         Args:
-            file_handler (FileHandler): A file handler.
-
-        Returns:
-            bytes, MindSpore event in bytes.
+            executor (Executor): The executor instance.
+            event_strs (list[bytes]): Event strings to be parsed.
         """
-        # read the header
-        header_str = file_handler.read(HEADER_SIZE)
-        if not header_str:
-            logger.info("Load summary file finished, file_path=%s.", file_handler.file_path)
-            return None
-        header_crc_str = file_handler.read(CRC_STR_SIZE)
-        if not header_crc_str:
-            header_crc_str = ''
-
-        if len(header_str) != HEADER_SIZE or len(header_crc_str) != CRC_STR_SIZE:
-            logger.warning("Check header size and crc, record truncated at offset %s, "
-                           "file_path=%s.", file_handler.offset, file_handler.file_path)
-            return None
-        if not crc32.CheckValueAgainstData(header_crc_str, header_str, HEADER_SIZE):
-            raise exceptions.CRCFailedError()
-
-        # read the event body if integrity of header is verified
-        header = struct.unpack('Q', header_str)
-        event_len = int(header[0])
-
-        event_str = file_handler.read(event_len)
-        if not event_str:
-            event_str = ''
-        event_crc_str = file_handler.read(CRC_STR_SIZE)
-        if not event_crc_str:
-            event_crc_str = ''
-
-        if len(event_str) != event_len or len(event_crc_str) != CRC_STR_SIZE:
-            logger.warning("Check event crc, record truncated at offset %d, file_path: %s.",
-                           file_handler.offset, file_handler.file_path)
-            return None
-        if not crc32.CheckValueAgainstData(event_crc_str, event_str, event_len):
-            raise exceptions.CRCFailedError()
+        future = executor.submit(self._events_parse, event_strs, self._latest_filename)
 
-        return event_str
+        def _add_tensor_event_callback(future_value):
+            try:
+                tensor_values = future_value.result()
+                for tensor_value in tensor_values:
+                    if tensor_value.plugin_name == PluginNameEnum.GRAPH.value:
+                        try:
+                            graph_tags = self._events_data.list_tags_by_plugin(PluginNameEnum.GRAPH.value)
+                        except KeyError:
+                            graph_tags = []
+
+                        summary_tags = self.filter_files(graph_tags)
+                        for tag in summary_tags:
+                            self._events_data.delete_tensor_event(tag)
+
+                    self._events_data.add_tensor_event(tensor_value)
+            except Exception as exc:
+                # Log exception for debugging.
+                logger.exception(exc)
+                raise
+
+        future.add_done_callback(_add_tensor_event_callback)
 
     @staticmethod
     def _parse_summary_value(value, plugin):
@@ -493,6 +642,8 @@ class _SummaryParser(_Parser):
                 logger.warning('tag: %s/tensor, dims: %s, tensor count: %d exceeds %d and drop it.',
                                value.tag, tensor_event_value.dims, tensor_event_value.size, MAX_TENSOR_COUNT)
                 return None
+            # Compute the statistics and histogram in the parse task instead of the first request of them.
+            _ = tensor_event_value.histogram
 
         elif plugin == PluginNameEnum.IMAGE.value:
             tensor_event_value = ImageContainer(tensor_event_value)
@@ -556,6 +707,29 @@ class _SummaryParser(_Parser):
 
         return ret_tensor_events
 
+    @staticmethod
+    def _events_parse(event_strs, latest_file_name):
+        """
+        Transform a batch of `Event` data to tensor events.
+
+        A broken event is skipped, so it will not drop the other events of the batch.
+
+        Args:
+            event_strs (list[bytes]): Message event strings in summary proto.
+            latest_file_name (str): Latest file name.
+
+        Returns:
+            list[TensorEvent], tensor events of all the events in order.
+        """
+        ret_tensor_events = []
+        for event_str in event_strs:
+            try:
+                ret_tensor_events.extend(_SummaryParser._event_parse(event_str, latest_file_name))
+            except Exception as ex:
+                # Log exception for debugging.
+                logger.exception(ex)
+        return ret_tensor_events
+
     def sort_files(self, filenames):
         """Sort by creating time increments and filenames decrement."""
         filenames = sorted(filenames,
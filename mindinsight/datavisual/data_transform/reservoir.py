@@ -14,14 +14,27 @@
 # ============================================================================
 """A reservoir sampling on the values."""
 
+import collections
+import itertools
 import random
 import threading
 
+import numpy as np
+
 from mindinsight.datavisual.common.log import logger
 from mindinsight.datavisual.common.enums import PluginNameEnum
+from mindinsight.datavisual.data_transform.histogram import Histogram
 from mindinsight.utils.exceptions import ParamValueError
 from mindinsight.datavisual.utils.utils import calc_histogram_bins
 
+ScalarColumns = collections.namedtuple('ScalarColumns', ['steps', 'wall_times', 'values'])
+
+# Approximate memory(Bytes) of a sample tuple, excluding the memory of its value.
+_SAMPLE_BYTES = 200
+
+# Versions are shared by all reservoirs, so a reservoir created again for the same tag never reuses a version.
+_VERSION_COUNTER = itertools.count(1)
+
 
 def binary_search(samples, target):
     """Binary search target in samples."""
@@ -68,6 +81,21 @@ class Reservoir:
         self._sample_counter = 0
         self._sample_selector = random.Random(0)
         self._mutex = threading.Lock()
+        self._version = next(_VERSION_COUNTER)
+
+    @property
+    def version(self):
+        """
+        Get the version of the samples, it increases whenever the samples are changed.
+
+        Returns:
+            int, the version.
+        """
+        return self._version
+
+    def _update_version(self):
+        """Update the version after the samples are changed. Call this function with lock."""
+        self._version = next(_VERSION_COUNTER)
 
     def samples(self):
         """Return all stored samples."""
@@ -96,6 +124,7 @@ class Reservoir:
                     self._samples = self._samples[:-1]
                 self._add_sample(sample)
             self._sample_counter += 1
+            self._update_version()
 
     def _add_sample(self, sample):
         """Search the index and add sample."""
@@ -108,6 +137,33 @@ class Reservoir:
         else:
             self._samples.insert(index, sample)
 
+    def last_step(self):
+        """
+        Get the step of the last sample.
+
+        Returns:
+            Union[int, None], the step of the last sample, or None if the reservoir is empty.
+        """
+        with self._mutex:
+            return self._samples[-1].step if self._samples else None
+
+    def remove_out_of_order_samples(self, filename, start_step):
+        """
+        Remove the samples which are out of order when a sample with the given step comes again.
+
+        The samples with step less than the start step, and the samples with step greater than the start step
+        in the same file are kept.
+
+        Args:
+            filename (str): The file name of the coming sample.
+            start_step (int): The step of the coming sample.
+
+        Returns:
+            int, the number of samples removed.
+        """
+        return self.remove_sample(
+            lambda x: x.step < start_step or (x.step > start_step and x.filename == filename))
+
     def remove_sample(self, filter_fun):
         """
         Remove the samples from Reservoir that do not meet the filter criteria.
@@ -130,6 +186,7 @@ class Reservoir:
                 remove_size = before_remove_size - after_remove_size
 
                 if remove_size > 0:
+                    self._update_version()
                     # update _sample_counter when samples has been removed.
                     sample_remaining_rate = float(
                         after_remove_size) / before_remove_size
@@ -138,6 +195,264 @@ class Reservoir:
 
         return remove_size
 
+    def nbytes(self):
+        """
+        Get the approximate memory(Bytes) of all stored samples.
+
+        The memory of a sample value is got from its `nbytes` attribute, values without `nbytes` are not counted.
+
+        Returns:
+            int, the approximate memory.
+        """
+        with self._mutex:
+            return sum(_SAMPLE_BYTES + getattr(sample.value, 'nbytes', 0) for sample in self._samples)
+
+    def dump_state(self):
+        """
+        Dump the state of the reservoir, which can be pickled.
+
+        Returns:
+            dict, the state of the reservoir.
+        """
+        with self._mutex:
+            return dict(samples=list(self._samples),
+                        sample_counter=self._sample_counter,
+                        sample_selector_state=self._sample_selector.getstate())
+
+    def restore_state(self, state):
+        """
+        Restore the reservoir from a state dumped by `dump_state`.
+
+        Args:
+            state (dict): The state of the reservoir.
+        """
+        with self._mutex:
+            self._samples = list(state['samples'])
+            self._sample_counter = state['sample_counter']
+            self._sample_selector.setstate(state['sample_selector_state'])
+            self._update_version()
+
+
+class ScalarReservoir(Reservoir):
+    """
+    Reservoir for scalars, which stores steps, wall times and values in numpy arrays.
+
+    Samples are kept sorted by step as `Reservoir` does. The arrays start small and grow geometrically up to the
+    container size, so a tag with few samples does not pay for the whole size. Appending a sample with the largest
+    step is O(1) amortized, and the columns can be read without copying by `columns`.
+
+    Args:
+        size (int): Container Size. If the size is 0, the container is not limited.
+    """
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self, size):
+        super().__init__(size)
+        self._count = 0
+        self._sample_cls = None
+        self._filenames = []
+        self._filename_codes = {}
+        # Samples before this index have been exported by `columns`, they must not be written in place.
+        self._exported_count = 0
+        self._allocate(min(size, self._INITIAL_CAPACITY) if size else self._INITIAL_CAPACITY)
+
+    def _allocate(self, capacity, keep_samples=True):
+        """
+        Allocate new columns with the given capacity.
+
+        Args:
+            capacity (int): Capacity of the new columns.
+            keep_samples (bool): If True, the current samples will be copied to the new columns. Default: True.
+        """
+        count = self._count if keep_samples else 0
+        columns = dict(steps=np.int64, wall_times=np.float64, values=np.float64, codes=np.int32)
+        for name, dtype in columns.items():
+            column = np.empty(capacity, dtype=dtype)
+            if count:
+                column[:count] = getattr(self, '_' + name)[:count]
+            setattr(self, '_' + name, column)
+        self._exported_count = 0
+
+    def _before_write(self, index):
+        """Copy the columns before writing at the index, if the index has been exported."""
+        if index < self._exported_count:
+            self._allocate(len(self._steps))
+
+    def _get_filename_code(self, filename):
+        """Get the code of file name."""
+        code = self._filename_codes.get(filename)
+        if code is None:
+            code = len(self._filenames)
+            self._filenames.append(filename)
+            self._filename_codes[filename] = code
+        return code
+
+    def samples(self):
+        """Return all stored samples."""
+        with self._mutex:
+            return self._build_samples()
+
+    def _build_samples(self):
+        """Build the samples from columns. Call this function with lock for thread safety."""
+        if self._sample_cls is None:
+            return []
+        count = self._count
+        steps = self._steps[:count].tolist()
+        wall_times = self._wall_times[:count].tolist()
+        values = self._values[:count].tolist()
+        filenames = [self._filenames[code] for code in self._codes[:count].tolist()]
+        return [self._sample_cls(wall_time=wall_time, step=step, value=value, filename=filename)
+                for wall_time, step, value, filename in zip(wall_times, steps, values, filenames)]
+
+    def columns(self):
+        """
+        Return the read-only columns of all stored samples without copying.
+
+        Returns:
+            ScalarColumns, the columns of steps, wall times and values.
+        """
+        with self._mutex:
+            count = self._count
+            self._exported_count = max(self._exported_count, count)
+            columns = ScalarColumns(steps=self._steps[:count],
+                                    wall_times=self._wall_times[:count],
+                                    values=self._values[:count])
+        for column in columns:
+            column.flags.writeable = False
+        return columns
+
+    def last_step(self):
+        """Get the step of the last sample, see parent class for details."""
+        with self._mutex:
+            return int(self._steps[self._count - 1]) if self._count else None
+
+    def nbytes(self):
+        """Get the memory of the allocated columns, see parent class for details."""
+        with self._mutex:
+            return sum(getattr(self, '_' + name).nbytes for name in ('steps', 'wall_times', 'values', 'codes'))
+
+    def add_sample(self, sample):
+        """Add a sample, see parent class for details."""
+        with self._mutex:
+            if self._sample_cls is None:
+                self._sample_cls = type(sample)
+            if self._count < self._samples_max_size or self._samples_max_size == 0:
+                self._add_sample(sample)
+            else:
+                # Use the Reservoir Sampling algorithm to replace the old sample.
+                rand_int = self._sample_selector.randint(0, self._sample_counter)
+                if rand_int < self._samples_max_size:
+                    self._delete(rand_int)
+                else:
+                    self._count -= 1
+                self._add_sample(sample)
+            self._sample_counter += 1
+            self._update_version()
+
+    def _add_sample(self, sample):
+        """Search the index and add sample."""
+        count = self._count
+        if not count or sample.step > self._steps[count - 1]:
+            index = count
+        else:
+            index = int(np.searchsorted(self._steps[:count], sample.step))
+
+        if count == len(self._steps):
+            # A full reservoir removes a sample before adding one, so the size is never exceeded.
+            capacity = count * 2
+            if self._samples_max_size:
+                capacity = min(capacity, self._samples_max_size)
+            self._allocate(capacity)
+        self._before_write(index)
+        if index < count:
+            for column in (self._steps, self._wall_times, self._values, self._codes):
+                column[index + 1:count + 1] = column[index:count]
+        self._steps[index] = sample.step
+        self._wall_times[index] = sample.wall_time
+        self._values[index] = sample.value
+        self._codes[index] = self._get_filename_code(sample.filename)
+        self._count += 1
+
+    def _delete(self, index):
+        """Delete the sample at the index."""
+        count = self._count
+        self._before_write(index)
+        for column in (self._steps, self._wall_times, self._values, self._codes):
+            column[index:count - 1] = column[index + 1:count]
+        self._count -= 1
+
+    def _keep(self, mask):
+        """
+        Keep the samples selected by the mask.
+
+        Args:
+            mask (numpy.ndarray): Boolean mask of the samples to be kept.
+
+        Returns:
+            int, the number of samples removed.
+        """
+        before_remove_size = self._count
+        after_remove_size = int(np.count_nonzero(mask))
+        remove_size = before_remove_size - after_remove_size
+        if remove_size <= 0:
+            return 0
+
+        old_columns = dict(steps=self._steps, wall_times=self._wall_times, values=self._values, codes=self._codes)
+        self._allocate(len(self._steps), keep_samples=False)
+        for name, old_column in old_columns.items():
+            getattr(self, '_' + name)[:after_remove_size] = old_column[:before_remove_size][mask]
+        self._count = after_remove_size
+        self._update_version()
+
+        # update _sample_counter when samples has been removed.
+        sample_remaining_rate = float(after_remove_size) / before_remove_size
+        self._sample_counter = int(round(self._sample_counter * sample_remaining_rate))
+        return remove_size
+
+    def remove_out_of_order_samples(self, filename, start_step):
+        """Remove the out of order samples with vectorized comparison, see parent class for details."""
+        with self._mutex:
+            count = self._count
+            steps = self._steps[:count]
+            code = self._filename_codes.get(filename, -1)
+            mask = (steps < start_step) | ((steps > start_step) & (self._codes[:count] == code))
+            return self._keep(mask)
+
+    def remove_sample(self, filter_fun):
+        """Remove the samples, see parent class for details."""
+        with self._mutex:
+            samples = self._build_samples()
+            mask = np.fromiter((bool(filter_fun(sample)) for sample in samples), dtype=np.bool_, count=len(samples))
+            return self._keep(mask)
+
+    def dump_state(self):
+        """Dump the state of the reservoir, see parent class for details."""
+        with self._mutex:
+            count = self._count
+            return dict(steps=self._steps[:count].copy(),
+                        wall_times=self._wall_times[:count].copy(),
+                        values=self._values[:count].copy(),
+                        codes=self._codes[:count].copy(),
+                        filenames=list(self._filenames),
+                        sample_cls=self._sample_cls,
+                        sample_counter=self._sample_counter,
+                        sample_selector_state=self._sample_selector.getstate())
+
+    def restore_state(self, state):
+        """Restore the reservoir, see parent class for details."""
+        with self._mutex:
+            count = len(state['steps'])
+            self._allocate(max(len(self._steps), count), keep_samples=False)
+            for name in ('steps', 'wall_times', 'values', 'codes'):
+                getattr(self, '_' + name)[:count] = state[name]
+            self._count = count
+            self._filenames = list(state['filenames'])
+            self._filename_codes = {filename: code for code, filename in enumerate(self._filenames)}
+            self._sample_cls = state['sample_cls']
+            self._sample_counter = state['sample_counter']
+            self._sample_selector.setstate(state['sample_selector_state'])
+            self._update_version()
+
 
 class _VisualRange:
     """Simple helper class to merge visual ranges."""
@@ -195,6 +510,18 @@ class HistogramReservoir(Reservoir):
         super().add_sample(sample)
         self._visual_range_up_to_date = False
 
+    def remove_sample(self, filter_fun):
+        """Removes samples, see parent class for details."""
+        remove_size = super().remove_sample(filter_fun)
+        if remove_size:
+            self._visual_range_up_to_date = False
+        return remove_size
+
+    def restore_state(self, state):
+        """Restores state, see parent class for details."""
+        super().restore_state(state)
+        self._visual_range_up_to_date = False
+
     def samples(self):
         """Return all stored samples."""
         with self._mutex:
@@ -224,9 +551,11 @@ class HistogramReservoir(Reservoir):
                 visual_range.max,
                 bins,
                 max_count)
-            for sample in self._samples:
-                histogram = sample.value.histogram
+            histograms = [sample.value.histogram for sample in self._samples]
+            for histogram in histograms:
                 histogram.set_visual_range(visual_range.max, visual_range.min, bins)
+            # Re-sample buckets of all steps at once, histograms whose visual range is unchanged are skipped.
+            Histogram.re_sample_histograms(histograms)
 
             self._visual_range_up_to_date = True
             return list(self._samples)
@@ -247,4 +576,6 @@ class ReservoirFactory:
         """
         if plugin_name in (PluginNameEnum.HISTOGRAM.value, PluginNameEnum.TENSOR.value):
             return HistogramReservoir(size)
+        if plugin_name == PluginNameEnum.SCALAR.value:
+            return ScalarReservoir(size)
         return Reservoir(size)
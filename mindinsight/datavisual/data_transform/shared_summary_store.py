@@ -0,0 +1,231 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Summary store shared by multiple worker processes.
+
+When the web service runs with multiple workers, only one worker, the loader worker, parses summary files.
+The loader worker publishes the index of each summary directory into the shared store, and the other
+workers, the reader workers, restore the reservoirs from the published index instead of parsing the summary
+files again. Train jobs requested by reader workers are passed to the loader worker through the store, and the
+reader workers publish the keys of the image blobs they reference, so the loader worker does not remove them.
+
+The loader worker is elected by an exclusive file lock, so another worker takes over parsing if the loader
+worker exits.
+"""
+import fcntl
+import hashlib
+import json
+import os
+import time
+
+from mindinsight.conf import settings
+from mindinsight.datavisual.common.log import logger
+from mindinsight.datavisual.data_transform.summary_index_cache import SummaryIndexCache
+
+_LOCK_FILE_NAME = 'loader.lock'
+_REQUEST_DIR_NAME = 'requests'
+_INDEX_DIR_NAME = 'index'
+_REQUEST_FILE_SUFFIX = '.request'
+_REFERENCE_DIR_NAME = 'references'
+_REFERENCE_FILE_SUFFIX = '.keys'
+
+
+class SharedSummaryStore:
+    """
+    Summary store shared by the worker processes of the web service.
+
+    Args:
+        store_dir (Optional[str]): Directory of the store. If it is None, a directory in workspace for the
+            current port will be used. Default: None.
+    """
+
+    def __init__(self, store_dir=None):
+        self._store_dir = store_dir
+        self._lock_file = None
+        self._next_lock_time = 0
+        self._index_cache = None
+
+    @property
+    def enabled(self):
+        """Whether the store is used, it is used only if there are multiple workers."""
+        return settings.WORKERS > 1 and not settings.ENABLE_DEBUGGER
+
+    @property
+    def store_dir(self):
+        """Get the directory of the store."""
+        if self._store_dir is not None:
+            return self._store_dir
+        return os.path.join(settings.WORKSPACE, 'shared_summary', str(settings.PORT))
+
+    @property
+    def index_cache(self):
+        """Get the index cache where the loader worker publishes indexes."""
+        if self._index_cache is None:
+            self._index_cache = SummaryIndexCache(os.path.join(self.store_dir, _INDEX_DIR_NAME))
+        return self._index_cache
+
+    def is_reader(self):
+        """
+        Check whether current process is a reader worker.
+
+        A reader worker tries to become the loader worker at most once per `SUMMARY_PUBLISH_INTERVAL`, so parsing
+        is taken over when the loader worker exits, and the check is cheap in between.
+
+        Returns:
+            bool, True if the store is used and current process is not the loader worker.
+        """
+        if not self.enabled:
+            return False
+        return not self._try_lock()
+
+    def _try_lock(self):
+        """
+        Try to hold the lock of loader worker without blocking.
+
+        Returns:
+            bool, True if current process holds the lock.
+        """
+        if self._lock_file is not None:
+            return True
+        now = time.time()
+        if now < self._next_lock_time:
+            return False
+        self._next_lock_time = now + settings.SUMMARY_PUBLISH_INTERVAL
+
+        lock_file = None
+        try:
+            os.makedirs(self.store_dir, mode=0o700, exist_ok=True)
+            lock_file = open(os.path.join(self.store_dir, _LOCK_FILE_NAME), 'a')
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            if lock_file is not None:
+                lock_file.close()
+            return False
+
+        logger.info("Current process %d becomes the loader worker, store dir: %s.", os.getpid(), self.store_dir)
+        self._lock_file = lock_file
+        return True
+
+    def _get_request_dir(self):
+        """Get the directory of requested train jobs."""
+        return os.path.join(self.store_dir, _REQUEST_DIR_NAME)
+
+    def request_train_job(self, train_id):
+        """
+        Request the loader worker to load the train job.
+
+        Args:
+            train_id (str): Train ID.
+        """
+        request_dir = self._get_request_dir()
+        digest = hashlib.sha256(train_id.encode('utf-8')).hexdigest()
+        request_path = os.path.join(request_dir, digest + _REQUEST_FILE_SUFFIX)
+        tmp_path = '{}.{}.tmp'.format(request_path, os.getpid())
+        try:
+            os.makedirs(request_dir, mode=0o700, exist_ok=True)
+            with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as request_file:
+                request_file.write(train_id)
+            os.replace(tmp_path, request_path)
+        except OSError as ex:
+            logger.warning("Request train job %r failed, detail: %r.", train_id, str(ex))
+
+    def pop_requested_train_jobs(self):
+        """
+        Pop the train jobs requested by reader workers.
+
+        Returns:
+            list[str], the requested train IDs, the earliest requested comes first.
+        """
+        request_dir = self._get_request_dir()
+        try:
+            entries = [entry for entry in os.scandir(request_dir) if entry.name.endswith(_REQUEST_FILE_SUFFIX)]
+        except OSError:
+            return []
+
+        train_ids = []
+        for entry in sorted(entries, key=lambda entry: entry.stat().st_mtime):
+            try:
+                with open(entry.path) as request_file:
+                    train_ids.append(request_file.read())
+                os.remove(entry.path)
+            except OSError as ex:
+                logger.warning("Read requested train job failed, path: %s, detail: %r.", entry.path, str(ex))
+        return train_ids
+
+
+    def _get_reference_dir(self):
+        """Get the directory of the image blob keys referenced by reader workers."""
+        return os.path.join(self.store_dir, _REFERENCE_DIR_NAME)
+
+    def publish_image_blob_keys(self, keys):
+        """
+        Publish the keys of the image blobs referenced by current process.
+
+        Args:
+            keys (Collection[str]): The keys of the image blobs.
+        """
+        reference_dir = self._get_reference_dir()
+        reference_path = os.path.join(reference_dir, str(os.getpid()) + _REFERENCE_FILE_SUFFIX)
+        tmp_path = reference_path + '.tmp'
+        try:
+            os.makedirs(reference_dir, mode=0o700, exist_ok=True)
+            with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as reference_file:
+                json.dump(sorted(keys), reference_file)
+            os.replace(tmp_path, reference_path)
+        except OSError as ex:
+            logger.warning("Publish image blob keys failed, detail: %r.", str(ex))
+
+    def get_published_image_blob_keys(self):
+        """
+        Get the keys of the image blobs referenced by the alive reader workers.
+
+        The keys published by the exited workers are removed.
+
+        Returns:
+            set[str], the keys of the image blobs.
+        """
+        reference_dir = self._get_reference_dir()
+        try:
+            entries = [entry for entry in os.scandir(reference_dir) if entry.name.endswith(_REFERENCE_FILE_SUFFIX)]
+        except OSError:
+            return set()
+
+        keys = set()
+        for entry in entries:
+            try:
+                pid = int(entry.name[:-len(_REFERENCE_FILE_SUFFIX)])
+                if not _is_process_alive(pid):
+                    os.remove(entry.path)
+                    continue
+                with open(entry.path) as reference_file:
+                    keys.update(json.load(reference_file))
+            except (OSError, ValueError) as ex:
+                logger.warning("Read image blob keys failed, path: %s, detail: %r.", entry.path, str(ex))
+        return keys
+
+
+def _is_process_alive(pid):
+    """Check whether the process exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but it belongs to another user.
+        pass
+    return True
+
+
+SHARED_SUMMARY_STORE = SharedSummaryStore()
@@ -0,0 +1,144 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Persistent index cache of summary directories.
+
+The index of a summary directory contains the parsed offsets of summary files and a snapshot of
+the reservoirs, so a restarted server can resume parsing from the saved offsets instead of
+parsing all the summary files again. Index files are stored in the workspace, one file per
+summary directory.
+"""
+import hashlib
+import os
+import pickle
+
+from mindinsight.conf import settings
+from mindinsight.datavisual.common.log import logger
+
+INDEX_CACHE_VERSION = 4
+_INDEX_FILE_SUFFIX = '.index'
+
+
+class SummaryIndexCache:
+    """
+    Summary index cache stored in a directory.
+
+    Args:
+        cache_dir (Optional[str]): Directory to store the index files. If it is None,
+            the `summary_index` directory in workspace will be used. Default: None.
+    """
+
+    def __init__(self, cache_dir=None):
+        self._cache_dir = cache_dir
+
+    @property
+    def cache_dir(self):
+        """Get the directory of index files."""
+        if self._cache_dir is not None:
+            return self._cache_dir
+        return os.path.join(settings.WORKSPACE, 'summary_index')
+
+    def _get_index_path(self, summary_dir):
+        """Get the index file path of the summary directory."""
+        digest = hashlib.sha256(os.path.realpath(summary_dir).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest + _INDEX_FILE_SUFFIX)
+
+    def load(self, summary_dir):
+        """
+        Load the index of the summary directory.
+
+        Args:
+            summary_dir (str): Summary directory path.
+
+        Returns:
+            Union[dict, None], the index saved by `save`, or None if there is no valid index.
+        """
+        index_path = self._get_index_path(summary_dir)
+        if not os.path.isfile(index_path):
+            return None
+
+        try:
+            with open(index_path, 'rb') as index_file:
+                cached = pickle.load(index_file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as ex:
+            logger.warning("Load summary index failed and ignore it, index path: %s, detail: %r.",
+                           index_path, str(ex))
+            return None
+
+        if not isinstance(cached, dict) \
+                or cached.get('version') != INDEX_CACHE_VERSION \
+                or cached.get('summary_dir') != os.path.realpath(summary_dir):
+            logger.info("Summary index is outdated and ignore it, index path: %s.", index_path)
+            return None
+
+        logger.info("Load summary index success, summary dir: %s.", summary_dir)
+        return cached['index']
+
+    def save(self, summary_dir, index):
+        """
+        Save the index of the summary directory.
+
+        The index file is replaced atomically, so a broken index will not be left if the server is stopped.
+
+        Args:
+            summary_dir (str): Summary directory path.
+            index (dict): The index to be saved, it should be able to be pickled.
+        """
+        index_path = self._get_index_path(summary_dir)
+        tmp_path = '{}.{}.tmp'.format(index_path, os.getpid())
+        cached = dict(version=INDEX_CACHE_VERSION,
+                      summary_dir=os.path.realpath(summary_dir),
+                      index=index)
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            with os.fdopen(os.open(tmp_path, flags, 0o600), 'wb') as index_file:
+                pickle.dump(cached, index_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, index_path)
+        except (OSError, pickle.PicklingError) as ex:
+            logger.warning("Save summary index failed, summary dir: %s, detail: %r.", summary_dir, str(ex))
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        logger.info("Save summary index success, summary dir: %s.", summary_dir)
+
+    def get_index_mtime(self, summary_dir):
+        """
+        Get the modification time of the index of the summary directory.
+
+        Args:
+            summary_dir (str): Summary directory path.
+
+        Returns:
+            Union[int, None], the modification time in nanoseconds, or None if there is no index.
+        """
+        try:
+            return os.stat(self._get_index_path(summary_dir)).st_mtime_ns
+        except OSError:
+            return None
+
+    def remove(self, summary_dir):
+        """
+        Remove the index of the summary directory.
+
+        Args:
+            summary_dir (str): Summary directory path.
+        """
+        index_path = self._get_index_path(summary_dir)
+        if os.path.isfile(index_path):
+            os.remove(index_path)
+
+
+SUMMARY_INDEX_CACHE = SummaryIndexCache()
@@ -0,0 +1,179 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Record reader for summary files.
+
+A summary file is a sequence of records, each record is framed as below:
+    header (8 bytes, event length) | header crc (4 bytes) | event body | event crc (4 bytes)
+
+The reader memory-maps the local summary file and yields `memoryview` objects of the event body,
+so the header and body are never copied before they are handed over to protobuf.
+"""
+import mmap
+import os
+import struct
+
+from mindinsight.datavisual.common import exceptions
+from mindinsight.datavisual.common.log import logger
+from mindinsight.datavisual.utils import crc32
+from mindinsight.datavisual.utils.tools import to_str
+
+HEADER_SIZE = 8
+CRC_STR_SIZE = 4
+_HEADER_FORMAT = struct.Struct('Q')
+
+
+class SummaryRecordReader:
+    """
+    Memory mapped summary record reader.
+
+    The summary file may still be written by the training process, so the mapping will be
+    extended when the file grows. An incomplete record at the end of the file is not consumed,
+    it will be read again after the file grows.
+
+    Args:
+        file_path (str): Summary file path.
+    """
+
+    def __init__(self, file_path):
+        self._file_path = to_str(file_path)
+        self._file = None
+        self._mmap = None
+        self._view = None
+        self._file_size = 0
+        self._offset = 0
+
+    @property
+    def offset(self):
+        """Get the offset of the next record."""
+        return self._offset
+
+    @property
+    def file_path(self):
+        """Get file path."""
+        return self._file_path
+
+    def reset_offset(self, offset):
+        """
+        Reset offset of the next record.
+
+        Args:
+            offset (int): Offset.
+        """
+        self._offset = offset
+
+    def close(self):
+        """
+        Close the reader.
+
+        Record views yielded before are still valid after closing, the mapping will be
+        released when all of them are released.
+        """
+        self._view = None
+        self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def read_record(self):
+        """
+        Read the next record and advance the offset.
+
+        Returns:
+            Union[memoryview, None], the event body of the record, or None if there is no complete record.
+
+        Raises:
+            CRCFailedError, if the crc check of header or event body fails.
+        """
+        start = self._offset
+        if not self._ensure_mapped(start + HEADER_SIZE + CRC_STR_SIZE):
+            if start < self._file_size:
+                logger.warning("Check header size and crc, record truncated at offset %s, "
+                               "file_path=%s.", start, self._file_path)
+            else:
+                logger.info("Load summary file finished, file_path=%s.", self._file_path)
+            return None
+
+        view = self._view
+        header = view[start:start + HEADER_SIZE]
+        header_crc = view[start + HEADER_SIZE:start + HEADER_SIZE + CRC_STR_SIZE]
+        if not crc32.CheckValueAgainstData(header_crc, header, HEADER_SIZE):
+            raise exceptions.CRCFailedError()
+
+        event_len = _HEADER_FORMAT.unpack_from(view, start)[0]
+        body_start = start + HEADER_SIZE + CRC_STR_SIZE
+        record_end = body_start + event_len + CRC_STR_SIZE
+        if not self._ensure_mapped(record_end):
+            logger.warning("Check event crc, record truncated at offset %d, file_path: %s.",
+                           start, self._file_path)
+            return None
+
+        # The mapping may be extended by `_ensure_mapped`, so the view should be fetched again.
+        view = self._view
+        event = view[body_start:body_start + event_len]
+        event_crc = view[body_start + event_len:record_end]
+        if not crc32.CheckValueAgainstData(event_crc, event, event_len):
+            raise exceptions.CRCFailedError()
+
+        self._offset = record_end
+        return event
+
+    def records(self):
+        """
+        Iterate the complete records from current offset.
+
+        Yields:
+            tuple[int, memoryview], the start offset of the record and the event body.
+
+        Raises:
+            CRCFailedError, if the crc check of header or event body fails. The offset is kept
+                at the start of the corrupted record.
+        """
+        while True:
+            start = self._offset
+            event = self.read_record()
+            if event is None:
+                return
+            yield start, event
+
+    def _mapped_size(self):
+        """Get the size of the mapped region."""
+        return len(self._mmap) if self._mmap is not None else 0
+
+    def _ensure_mapped(self, end):
+        """
+        Make sure the region [0, end) is mapped, remap the file if it has grown.
+
+        Args:
+            end (int): The end offset of the region.
+
+        Returns:
+            bool, True if the region is mapped.
+        """
+        if end <= self._mapped_size():
+            return True
+
+        if self._file is None:
+            self._file = open(self._file_path, 'rb')
+        file_size = os.fstat(self._file.fileno()).st_size
+        self._file_size = file_size
+        if file_size < end:
+            return False
+
+        # Old views may still be referenced by records being parsed, so the old mapping is not closed
+        # explicitly, it will be released when all views of it are released.
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        return end <= len(self._mmap)
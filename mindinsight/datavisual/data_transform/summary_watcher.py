@@ -14,12 +14,14 @@
 # ============================================================================
 """Summary watcher module."""
 
+import collections
 import os
 import re
 import datetime
 from pathlib import Path
 
 from mindinsight.datavisual.common.log import logger
+from mindinsight.datavisual.utils.inotify import Inotify, IN_Q_OVERFLOW
 from mindinsight.datavisual.common.validation import Validation
 from mindinsight.datavisual.utils.tools import Counter
 from mindinsight.datavisual.utils.utils import contains_null_byte
@@ -28,6 +30,8 @@ from mindinsight.utils.exceptions import FileSystemPermissionError
 
 LINEAGE_SUMMARY_SUFFIX = '_lineage'
 
+SummaryChanges = collections.namedtuple('SummaryChanges', ['updated', 'removed'])
+
 class SummaryWatcher:
     """SummaryWatcher class."""
 
@@ -104,11 +108,14 @@ class SummaryWatcher:
             }
             directories.append(directory)
 
-        # sort by update time in descending order and relative path in ascending order
-        directories.sort(key=lambda x: (-int(x['update_time'].timestamp()), x['relative_path']))
-
+        self._sort_directories(directories)
         return directories
 
+    @staticmethod
+    def _sort_directories(directories):
+        """Sort directories by update time in descending order and relative path in ascending order."""
+        directories.sort(key=lambda x: (-int(x['update_time'].timestamp()), x['relative_path']))
+
     def _scan_subdir_entries(self, summary_dict, summary_base_dir, entry_path, entry_name, counter):
         """
         Scan subdir entries.
@@ -410,3 +417,276 @@ class SummaryWatcher:
         summaries.sort(key=lambda x: (-int(x['update_time'].timestamp()), x['file_name']))
 
         return summaries
+
+
+class _DirectoryState:
+    """
+    Scanned state of a directory in summary base directory.
+
+    Args:
+        directory (dict): Summary directory info of the directory, or None if it is not a summary directory.
+        watched_mtimes (dict): The mtime of watched paths, the directory needs scanning again if any of them changes.
+        update_file (str): Path of the file whose modification time is the update time of the directory.
+    """
+    def __init__(self, directory, watched_mtimes, update_file):
+        self.directory = directory
+        self.watched_mtimes = watched_mtimes
+        self.update_file = update_file
+        self.watch_descriptors = []
+
+
+class IncrementalSummaryWatcher(SummaryWatcher):
+    """
+    Summary watcher which remembers the scanned directories and only scans the changed directories again.
+
+    A directory is changed if the mtime of itself or its profiler subdirectory changes. The update time of an
+    unchanged directory is refreshed by checking the single summary file it comes from. If inotify is used, the
+    changed directories are reported by kernel and unchanged directories are not checked at all.
+
+    Args:
+        use_inotify (bool): Whether to use inotify to detect changes, it is only supported on Linux. If inotify
+            is not available, mtime of directories will be checked instead. Default: False.
+    """
+
+    def __init__(self, use_inotify=False):
+        self._summary_base_dir = None
+        self._subdir_names = []
+        # Key is the directory name in summary base directory, and '' stands for the summary base directory.
+        self._states = {}
+        self._reported_directories = {}
+        self._inotify = None
+        self._watch_keys = {}
+        if use_inotify:
+            try:
+                self._inotify = Inotify()
+            except OSError as ex:
+                logger.warning("Inotify is not available and check mtime of directories instead. Detail: %s.",
+                               str(ex))
+
+    def list_summary_directories(self, summary_base_dir, overall=True):
+        """
+        List summary directories within base directory, only changed directories are scanned.
+
+        If overall is False, the scanning is limited, so a full scanning is taken as parent class.
+        See parent class for details.
+        """
+        if not overall:
+            return super().list_summary_directories(summary_base_dir, overall)
+        directories = self._scan(summary_base_dir)
+        self._sort_directories(directories)
+        return directories
+
+    def scan_changes(self, summary_base_dir):
+        """
+        Scan changed directories and get the changes since last calling.
+
+        Args:
+            summary_base_dir (str): Path of summary base directory.
+
+        Returns:
+            SummaryChanges, including the following attributes.
+                - updated (list): Info of new or updated summary directories, as `list_summary_directories` returns.
+                - removed (list): Relative paths of removed summary directories.
+        """
+        directories = {directory['relative_path']: directory for directory in self._scan(summary_base_dir)}
+        updated = [directory for relative_path, directory in directories.items()
+                   if self._reported_directories.get(relative_path) != directory]
+        removed = [relative_path for relative_path in self._reported_directories
+                   if relative_path not in directories]
+        self._reported_directories = directories
+        return SummaryChanges(updated=updated, removed=removed)
+
+    def forget(self, relative_path):
+        """
+        Forget the reported summary directory, so it will be reported as updated by next `scan_changes`.
+
+        Args:
+            relative_path (str): Relative path of summary directory.
+        """
+        self._reported_directories.pop(relative_path, None)
+
+    def close(self):
+        """Release the inotify instance."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def _scan(self, summary_base_dir):
+        """Scan changed directories and get info of all summary directories."""
+        if summary_base_dir != self._summary_base_dir:
+            self._reset()
+            self._summary_base_dir = summary_base_dir
+
+        if contains_null_byte(summary_base_dir=summary_base_dir) \
+                or not self._is_valid_summary_directory(summary_base_dir, os.path.join('.', '')):
+            self._reset()
+            return []
+
+        changed_keys = self._read_changed_keys()
+        base_state = self._states.get('')
+        if base_state is None or self._is_changed('', base_state, changed_keys):
+            self._scan_base_directory(summary_base_dir)
+        else:
+            self._refresh_update_time('', base_state, changed_keys)
+
+        directories = []
+        if self._states[''].directory is not None:
+            directories.append(self._states[''].directory)
+        for name in self._subdir_names:
+            if len(directories) == self.MAX_SUMMARY_DIR_COUNT:
+                break
+            state = self._states.get(name)
+            if state is None or self._is_changed(name, state, changed_keys):
+                state = self._scan_directory(summary_base_dir, name)
+            else:
+                self._refresh_update_time(name, state, changed_keys)
+            if state.directory is not None:
+                directories.append(state.directory)
+        return directories
+
+    def _reset(self):
+        """Forget all scanned states."""
+        for key in list(self._states):
+            self._drop_state(key)
+        self._subdir_names = []
+
+    def _drop_state(self, key):
+        """Drop the state of directory and remove its watches."""
+        state = self._states.pop(key)
+        for watch_descriptor in state.watch_descriptors:
+            self._watch_keys.pop(watch_descriptor, None)
+            if self._inotify is not None:
+                self._inotify.remove_watch(watch_descriptor)
+
+    def _read_changed_keys(self):
+        """
+        Read changed directories from inotify events.
+
+        Returns:
+            Union[set, None], keys of changed directories, or None if they are unknown and mtime should be checked.
+        """
+        if self._inotify is None:
+            return None
+        changed_keys = set()
+        for watch_descriptor, mask in self._inotify.read_events():
+            if mask & IN_Q_OVERFLOW:
+                logger.info("Inotify event queue overflows, check mtime of all directories.")
+                return None
+            key = self._watch_keys.get(watch_descriptor)
+            if key is not None:
+                changed_keys.add(key)
+        return changed_keys
+
+    def _watch(self, key, state, path):
+        """Record mtime of the path and watch it by inotify, so the directory is scanned again if it changes."""
+        if self._inotify is not None:
+            try:
+                watch_descriptor = self._inotify.add_watch(path)
+            except OSError as ex:
+                logger.warning("Add inotify watch failed and check mtime of directories instead. Detail: %s.",
+                               str(ex))
+                self.close()
+            else:
+                self._watch_keys[watch_descriptor] = key
+                state.watch_descriptors.append(watch_descriptor)
+        try:
+            state.watched_mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            state.watched_mtimes[path] = None
+
+    @staticmethod
+    def _is_changed(key, state, changed_keys):
+        """Check whether the directory has changed since last scanning."""
+        if changed_keys is not None:
+            return key in changed_keys
+        for path, mtime in state.watched_mtimes.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _refresh_update_time(self, key, state, changed_keys):
+        """Refresh update time of an unchanged directory, whose summary files may be still being written."""
+        if changed_keys is not None or state.update_file is None:
+            # Modification of files is reported by inotify, so the directory must be unchanged.
+            return
+        try:
+            stat = os.stat(state.update_file)
+        except OSError:
+            logger.warning('File %s not found', os.path.basename(state.update_file))
+            return
+        update_time = datetime.datetime.fromtimestamp(stat.st_mtime).astimezone()
+        if update_time == state.directory['update_time']:
+            return
+        directory = dict(state.directory, update_time=update_time)
+        if re.search(self.SUMMARY_FILENAME_REGEX, os.path.basename(state.update_file)) is None:
+            # The creation time of graph file comes from the file status.
+            directory['create_time'] = datetime.datetime.fromtimestamp(stat.st_ctime).astimezone()
+        # Replace the directory info instead of updating it, since it may have been reported.
+        state.directory = directory
+        logger.debug("Refresh update time of %s.", key)
+
+    def _scan_base_directory(self, summary_base_dir):
+        """Scan summary base directory for summary files and subdirectories."""
+        subdir_names = []
+        self._scan_directory(summary_base_dir, '', subdir_names)
+        for name in set(self._subdir_names).difference(subdir_names):
+            if name in self._states:
+                self._drop_state(name)
+        self._subdir_names = subdir_names
+
+    def _scandir(self, summary_base_dir, name):
+        """List entries of the directory."""
+        try:
+            return list(os.scandir(os.path.join(summary_base_dir, name)))
+        except PermissionError:
+            if not name:
+                logger.error('Path of summary base directory is not accessible.')
+                raise FileSystemPermissionError('Path of summary base directory is not accessible.')
+            logger.warning('Path of %s under summary base directory is not accessible.', name)
+        except FileNotFoundError:
+            logger.warning('Path of %s under summary base directory is not found.', name)
+        return []
+
+    def _scan_directory(self, summary_base_dir, name, subdir_names=None):
+        """
+        Scan the directory in summary base directory and save its state.
+
+        Args:
+            summary_base_dir (str): Path of summary base directory.
+            name (str): Name of the directory, '' means the summary base directory.
+            subdir_names (list): If it is not None, names of the subdirectories will be appended to it.
+                Default: None.
+
+        Returns:
+            _DirectoryState, the state of the directory.
+        """
+        if name in self._states:
+            self._drop_state(name)
+        state = _DirectoryState(directory=None, watched_mtimes={}, update_file=None)
+        self._states[name] = state
+
+        # Watch before listing, so the changes during scanning will be found next time.
+        directory_path = os.path.join(summary_base_dir, name)
+        self._watch(name, state, directory_path)
+        relative_path = os.path.join('.', name)
+        summary_dict = {}
+        for entry in self._scandir(summary_base_dir, name):
+            if not name and (entry.is_symlink() or not entry.is_file()):
+                # Subdirectories of summary base directory are scanned separately.
+                if subdir_names is not None and not entry.is_symlink() and entry.is_dir():
+                    subdir_names.append(entry.name)
+                continue
+            if name and entry.is_dir() and re.search(self.PROFILER_DIRECTORY_REGEX, entry.name):
+                self._watch(name, state, os.path.join(directory_path, entry.name))
+
+            last_update_time = summary_dict[relative_path]['update_time'] if relative_path in summary_dict else None
+            self._update_summary_dict(summary_dict, summary_base_dir, relative_path, entry)
+            if relative_path in summary_dict and summary_dict[relative_path]['update_time'] is not last_update_time:
+                state.update_file = entry.path if entry.is_file() else None
+
+        if relative_path in summary_dict:
+            state.directory = {'relative_path': relative_path, **summary_dict[relative_path]}
+        return state
@@ -14,14 +14,112 @@
 # ============================================================================
 """Tensor data container."""
 import numpy as np
+from google.protobuf.internal import api_implementation
 
 from mindinsight.datavisual.data_transform.histogram import Histogram, Bucket
+from mindinsight.datavisual.proto_files import mindinsight_anf_ir_pb2 as anf_ir_pb2
 from mindinsight.datavisual.utils.utils import calc_histogram_bins
 from mindinsight.utils.exceptions import ParamValueError
 from mindinsight.utils.tensor import TensorUtils
 
 MAX_TENSOR_COUNT = 10000000
 
+# Repeated field which stores the tensor data and the dtype of decoded values for each data type.
+_DATA_FIELDS = {
+    anf_ir_pb2.DT_BOOL: ('int32_data', np.int64),
+    anf_ir_pb2.DT_INT8: ('int32_data', np.int64),
+    anf_ir_pb2.DT_INT16: ('int32_data', np.int64),
+    anf_ir_pb2.DT_INT32: ('int32_data', np.int64),
+    anf_ir_pb2.DT_INT64: ('int64_data', np.int64),
+    anf_ir_pb2.DT_UINT8: ('int32_data', np.int64),
+    anf_ir_pb2.DT_UINT16: ('int32_data', np.int64),
+    anf_ir_pb2.DT_UINT32: ('uint64_data', np.uint64),
+    anf_ir_pb2.DT_UINT64: ('uint64_data', np.uint64),
+    anf_ir_pb2.DT_FLOAT64: ('double_data', np.float64),
+}
+_DEFAULT_DATA_FIELD = ('float_data', np.float64)
+
+# Field number and little-endian dtype of the fixed-width repeated fields, which can be decoded from buffer.
+_FIXED_WIDTH_FIELDS = {
+    'float_data': (3, np.dtype('<f4')),
+    'double_data': (6, np.dtype('<f8')),
+}
+
+# Little-endian dtype of raw data for each data type.
+_RAW_DATA_DTYPES = {
+    anf_ir_pb2.DT_BOOL: np.dtype('?'),
+    anf_ir_pb2.DT_INT8: np.dtype('i1'),
+    anf_ir_pb2.DT_INT16: np.dtype('<i2'),
+    anf_ir_pb2.DT_INT32: np.dtype('<i4'),
+    anf_ir_pb2.DT_INT64: np.dtype('<i8'),
+    anf_ir_pb2.DT_UINT8: np.dtype('u1'),
+    anf_ir_pb2.DT_UINT16: np.dtype('<u2'),
+    anf_ir_pb2.DT_UINT32: np.dtype('<u4'),
+    anf_ir_pb2.DT_UINT64: np.dtype('<u8'),
+    anf_ir_pb2.DT_FLOAT16: np.dtype('<f2'),
+    anf_ir_pb2.DT_FLOAT32: np.dtype('<f4'),
+    anf_ir_pb2.DT_FLOAT64: np.dtype('<f8'),
+}
+
+_WIRE_TYPE_VARINT = 0
+_WIRE_TYPE_FIXED64 = 1
+_WIRE_TYPE_LENGTH_DELIMITED = 2
+_WIRE_TYPE_FIXED32 = 5
+
+
+def _decode_varint(buffer, pos):
+    """Decode a varint from the buffer at the position, return the value and the position after it."""
+    result = 0
+    shift = 0
+    while True:
+        byte = buffer[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _find_length_delimited_field(buffer, field_number):
+    """
+    Find the payload of a length-delimited field in a serialized message without parsing the message.
+
+    Args:
+        buffer (bytes): The serialized message.
+        field_number (int): The field number.
+
+    Returns:
+        memoryview, the payload of the field. If the field is not found, an empty memoryview is returned.
+    """
+    view = memoryview(buffer)
+    pos = 0
+    while pos < len(view):
+        key, pos = _decode_varint(view, pos)
+        wire_type = key & 0x7
+        if wire_type == _WIRE_TYPE_VARINT:
+            _, pos = _decode_varint(view, pos)
+        elif wire_type == _WIRE_TYPE_FIXED64:
+            pos += 8
+        elif wire_type == _WIRE_TYPE_FIXED32:
+            pos += 4
+        elif wire_type == _WIRE_TYPE_LENGTH_DELIMITED:
+            length, pos = _decode_varint(view, pos)
+            if key >> 3 == field_number:
+                return view[pos:pos + length]
+            pos += length
+        else:
+            raise ParamValueError("Unsupported wire type {} in tensor message.".format(wire_type))
+    return view[0:0]
+
+
+def _get_widened_dtype(dtype):
+    """Get the dtype of values widened as they are decoded from the repeated fields of tensor message."""
+    if dtype.kind == 'f':
+        return np.float64
+    if dtype.kind == 'u' and dtype.itemsize == 8:
+        return np.uint64
+    return np.int64
+
 
 def calc_original_buckets(np_value, stats):
     """
@@ -65,26 +163,56 @@ class TensorContainer:
     """
     Tensor data container.
 
+    The tensor data is kept as a packed array of the serialized data type, and it is widened only when the
+    ndarray of the tensor is requested. The statistics and histogram are computed from a temporary widened array.
+
     Args:
         tensor_message (Summary.TensorProto): Tensor message in summary file.
+
+    Raises:
+        ParamValueError, If the count of tensor data does not match the dims.
     """
 
     def __init__(self, tensor_message):
         # Original dims can not be pickled to transfer to other process, so tuple is used.
         self._dims = tuple(tensor_message.dims)
         self._data_type = tensor_message.data_type
-        self._np_array = self.get_ndarray(tensor_message.float_data)
-        self._stats = TensorUtils.get_statistics_from_tensor(self._np_array)
-        original_buckets = calc_original_buckets(self._np_array, self._stats)
-        self._count = sum(bucket.count for bucket in original_buckets)
-        self._max = self._stats.max
-        self._min = self._stats.min
-        self._histogram = Histogram(tuple(original_buckets), self._max, self._min, self._count)
+        self._size = int(np.prod(self._dims, dtype=np.int64))
+        self._np_array = None
+        self._buffer = None
+        self._stats = None
+        self._count = None
+        self._histogram = None
+        self._load_tensor_data(tensor_message)
+
+    def _load_tensor_data(self, tensor_message):
+        """Load tensor data as a packed array without copying it if possible."""
+        if tensor_message.raw_data:
+            buffer, buffer_dtype = tensor_message.raw_data, _RAW_DATA_DTYPES.get(self._data_type)
+            if buffer_dtype is None:
+                raise ParamValueError("Unsupported data type of raw data: {}.".format(self._data_type))
+        else:
+            field_name, dtype = _DATA_FIELDS.get(self._data_type, _DEFAULT_DATA_FIELD)
+            if not getattr(tensor_message, field_name) and getattr(tensor_message, _DEFAULT_DATA_FIELD[0]):
+                # MindSpore writes the data of all data types into float_data.
+                field_name, dtype = _DEFAULT_DATA_FIELD
+            if field_name not in _FIXED_WIDTH_FIELDS or api_implementation.Type() == 'python':
+                # Serializing message is slow in the pure python implementation of protobuf.
+                self._np_array = self.get_ndarray(getattr(tensor_message, field_name), dtype)
+                return
+            field_number, buffer_dtype = _FIXED_WIDTH_FIELDS[field_name]
+            buffer = _find_length_delimited_field(tensor_message.SerializeToString(), field_number)
+
+        if len(buffer) != self._size * buffer_dtype.itemsize:
+            raise ParamValueError("The size of tensor data {} does not match dims {}.".format(
+                len(buffer) // buffer_dtype.itemsize, self._dims))
+        # The array is a view of the raw data or the serialized message, so the data is not copied again.
+        self._buffer = np.frombuffer(buffer, dtype=buffer_dtype)
 
     @property
     def size(self):
         """Get size of tensor."""
-        return self._np_array.size
+        return self._size
 
     @property
     def dims(self):
@@ -99,45 +227,79 @@ class TensorContainer:
     @property
     def ndarray(self):
         """Get ndarray of tensor."""
+        if self._np_array is None:
+            self._np_array = self._widen_buffer()
+            self._buffer = None
         return self._np_array
 
+    def _widen_buffer(self):
+        """Get the ndarray widened from the packed array without caching it."""
+        if self._np_array is not None:
+            return self._np_array
+        return self._buffer.astype(_get_widened_dtype(self._buffer.dtype)).reshape(self._dims)
+
+    @property
+    def nbytes(self):
+        """Get approximate memory(Bytes) of the tensor data, including the cached histogram."""
+        nbytes = self._buffer.nbytes if self._np_array is None else self._np_array.nbytes
+        if self._histogram is not None:
+            nbytes += self._histogram.nbytes
+        return nbytes
+
     @property
     def max(self):
         """Get max value of tensor."""
-        return self._max
+        return self.stats.max
 
     @property
     def min(self):
         """Get min value of tensor."""
-        return self._min
+        return self.stats.min
 
     @property
     def stats(self):
         """Get statistics data of tensor."""
+        if self._stats is None:
+            self._stats = TensorUtils.get_statistics_from_tensor(self._widen_buffer())
         return self._stats
 
     @property
     def count(self):
         """Get count value of tensor."""
+        if self._count is None:
+            _ = self.histogram
         return self._count
 
     @property
     def histogram(self):
         """Get histogram data."""
+        if self._histogram is None:
+            np_array = self._widen_buffer()
+            if self._stats is None:
+                self._stats = TensorUtils.get_statistics_from_tensor(np_array)
+            stats = self._stats
+            original_buckets = calc_original_buckets(np_array, stats)
+            self._count = sum(bucket.count for bucket in original_buckets)
+            self._histogram = Histogram(tuple(original_buckets), stats.max, stats.min, self._count)
         return self._histogram
 
     def buckets(self):
         """Get histogram buckets."""
-        return self._histogram.buckets()
+        return self.histogram.buckets()
 
-    def get_ndarray(self, tensor):
+    def get_ndarray(self, tensor, dtype=np.float64):
         """
         Get ndarray of tensor.
 
         Args:
             tensor (mindinsight_anf_ir.proto.DataType): tensor data.
+            dtype (type): The dtype of ndarray. Default: numpy.float64.
 
         Returns:
             numpy.ndarray, ndarray of tensor.
         """
-        return np.array(tuple(tensor)).reshape(self.dims)
+        np_array = np.fromiter(tensor, dtype=dtype, count=len(tensor))
+        if np_array.size != self._size:
+            raise ParamValueError("The size of tensor data {} does not match dims {}.".format(
+                np_array.size, self._dims))
+        return np_array.reshape(self.dims)
@@ -13,6 +13,7 @@
 # limitations under the License.
 # ============================================================================
 """Base processor, and init data manager parameter."""
+from mindinsight.utils.exceptions import MindInsightException
 
 
 class BaseProcessor:
@@ -26,3 +27,19 @@ class BaseProcessor:
             data_manager (DataManager): A DataManager instance.
         """
         self._data_manager = data_manager
+
+    def get_data_version(self, train_id, tag):
+        """
+        Get the version of the data of the train job and tag, which changes whenever the data changes.
+
+        Args:
+            train_id (str): The ID of the events data.
+            tag (str): The name of the tag.
+
+        Returns:
+            Union[int, None], the version of the data, or None if the data can not be found.
+        """
+        try:
+            return self._data_manager.get_reservoir_version(train_id, tag)
+        except MindInsightException:
+            return None
@@ -63,7 +63,7 @@ class ImageProcessor(BaseProcessor):
             })
         return dict(metadatas=result)
 
-    def get_single_image(self, train_id, tag, step):
+    def get_single_image(self, train_id, tag, step, thumbnail=False):
         """
         Returns the actual image bytes for a given image.
 
@@ -71,11 +71,30 @@ class ImageProcessor(BaseProcessor):
             train_id (str): The ID of the events data the image belongs to.
             tag (str): The name of the tag the images belongs to.
             step (int): The step of the image in the current reservoir.
+            thumbnail (bool): If True, the thumbnail of the image is returned, or the image if it has no
+                thumbnail. Default: False.
 
         Returns:
             bytes, a byte string of the raw image bytes.
 
         """
+        image, _ = self.get_single_image_with_digest(train_id, tag, step, thumbnail)
+        return image
+
+    def get_single_image_with_digest(self, train_id, tag, step, thumbnail=False):
+        """
+        Returns the actual image bytes and the SHA-256 digest of them for a given image.
+
+        Args:
+            train_id (str): The ID of the events data the image belongs to.
+            tag (str): The name of the tag the images belongs to.
+            step (int): The step of the image in the current reservoir.
+            thumbnail (bool): If True, the thumbnail of the image is returned, or the image if it has no
+                thumbnail. Default: False.
+
+        Returns:
+            tuple[bytes, str], a byte string of the raw image bytes and its hex digest.
+        """
         Validation.check_param_empty(train_id=train_id, tag=tag, step=step)
         step = to_int(step, "step")
 
@@ -84,16 +103,14 @@ class ImageProcessor(BaseProcessor):
         except ParamValueError as ex:
             raise ImageNotExistError(ex.message)
 
-        image = None
         for tensor in tensors:
             if tensor.step == step:
                 # Default value for bytes field is empty byte string normally,
                 # see also "Optional Fields And Default Values" in protobuf
                 # documentation.
-                image = tensor.value.encoded_image
-                break
-
-        if image is None:
-            raise ImageNotExistError("Can not find the step with given train job id and tag.")
+                image = tensor.value.thumbnail if thumbnail else tensor.value.encoded_image
+                if image is None:
+                    raise ImageNotExistError("The image has been removed from the image blob store.")
+                return image, tensor.value.get_digest(thumbnail)
 
-        return image
+        raise ImageNotExistError("Can not find the step with given train job id and tag.")
@@ -15,13 +15,16 @@
 """Scalar Processor APIs."""
 from urllib.parse import unquote
 
+import numpy as np
+
 from mindinsight.utils.exceptions import ParamValueError, UrlDecodeError
 from mindinsight.datavisual.common.log import logger
-from mindinsight.datavisual.utils.tools import if_nan_inf_to_none
 from mindinsight.datavisual.common.exceptions import ScalarNotExistError
 from mindinsight.datavisual.common.exceptions import TrainJobNotExistError
+from mindinsight.datavisual.common.enums import DownsampleMethodEnum
 from mindinsight.datavisual.common.validation import Validation
 from mindinsight.datavisual.processors.base_processor import BaseProcessor
+from mindinsight.datavisual.utils.downsample import downsample_indexes
 
 
 class ScalarsProcessor(BaseProcessor):
@@ -39,51 +42,92 @@ class ScalarsProcessor(BaseProcessor):
             list[dict], a list of dictionaries containing the `wall_time`, `step`, `value` for each scalar.
         """
         Validation.check_param_empty(train_id=train_id, tag=tag)
-        job_response = []
         try:
-            tensors = self._data_manager.list_tensors(train_id, tag)
+            columns = self._data_manager.list_scalar_columns(train_id, tag)
         except ParamValueError as ex:
             raise ScalarNotExistError(ex.message)
 
-        for tensor in tensors:
-            job_response.append({
-                'wall_time': tensor.wall_time,
-                'step': tensor.step,
-                'value': tensor.value})
+        job_response = self._columns_to_list(columns.wall_times.tolist(),
+                                             columns.steps.tolist(),
+                                             columns.values.tolist())
         return dict(metadatas=job_response)
 
-    def get_scalars(self, train_ids, tags):
+    def get_scalars(self, train_ids, tags, max_points=None, method=DownsampleMethodEnum.LTTB.value, columnar=False):
         """
         Get scalar data for given train_ids and tags.
 
         Args:
             train_ids (list): Specify list of train job ID.
             tags (list): Specify list of tags.
+            max_points (Optional[int]): The max number of points of each series, series with more points are
+                downsampled. If it is None, all points are returned. Default: None.
+            method (str): The downsampling method, 'lttb' or 'min_max'. Default: 'lttb'.
+            columnar (bool): If True, the `steps`, `wall_times` and `values` of each series are returned as
+                lists instead of a list of dictionaries. Default: False.
 
         Returns:
             list[dict], a list of dictionaries containing the `wall_time`, `step`, `value` for each scalar.
         """
-        for index, train_id in enumerate(train_ids):
-            try:
-                train_id = unquote(train_id, errors='strict')
-            except UnicodeDecodeError:
-                raise UrlDecodeError('Unquote train id error with strict mode')
-            else:
-                train_ids[index] = train_id
+        if max_points is not None:
+            # Validate the downsampling params even if no series needs downsampling.
+            downsample_indexes(np.array([]), np.array([]), max_points, method)
 
         scalars = []
-        for train_id in train_ids:
-            scalars += self._get_train_scalars(train_id, tags)
+        for train_id in self._unquote_train_ids(train_ids):
+            scalars += self._get_train_scalars(train_id, tags, max_points, method, columnar)
 
         return scalars
 
-    def _get_train_scalars(self, train_id, tags):
+    def get_scalars_version(self, train_ids, tags):
+        """
+        Get the version of the scalar data for given train_ids and tags.
+
+        Args:
+            train_ids (list): Specify list of train job ID.
+            tags (list): Specify list of tags.
+
+        Returns:
+            Union[tuple, None], the version of the data of each train job and tag, the version is None if the
+                data can not be found. None is returned if no data can be found.
+        """
+        versions = tuple(self.get_data_version(train_id, tag)
+                         for train_id in self._unquote_train_ids(train_ids) for tag in tags)
+        if all(version is None for version in versions):
+            return None
+        return versions
+
+    @staticmethod
+    def _unquote_train_ids(train_ids):
+        """
+        Unquote the train ids.
+
+        Args:
+            train_ids (list): Specify list of train job ID.
+
+        Returns:
+            list[str], the unquoted train ids.
+
+        Raises:
+            UrlDecodeError: If a train id can not be unquoted.
+        """
+        unquoted_train_ids = []
+        for train_id in train_ids:
+            try:
+                unquoted_train_ids.append(unquote(train_id, errors='strict'))
+            except UnicodeDecodeError:
+                raise UrlDecodeError('Unquote train id error with strict mode')
+        return unquoted_train_ids
+
+    def _get_train_scalars(self, train_id, tags, max_points, method, columnar):
         """
         Get scalar data for given train_id and tags.
 
         Args:
             train_id (str): Specify train job ID.
             tags (list): Specify list of tags.
+            max_points (Union[int, None]): The max number of points of each series.
+            method (str): The downsampling method.
+            columnar (bool): Whether to return the columns of each series.
 
         Returns:
             list[dict], a list of dictionaries containing the `wall_time`, `step`, `value` for each scalar.
@@ -91,26 +135,36 @@ class ScalarsProcessor(BaseProcessor):
         scalars = []
         for tag in tags:
             try:
-                tensors = self._data_manager.list_tensors(train_id, tag)
+                columns = self._data_manager.list_scalar_columns(train_id, tag)
             except ParamValueError:
                 continue
             except TrainJobNotExistError:
                 logger.warning('Can not find the given train job in cache.')
                 return []
 
+            steps, wall_times, values = columns.steps, columns.wall_times, columns.values
+            if max_points is not None and len(steps) > max_points:
+                indexes = downsample_indexes(steps, values, max_points, method)
+                steps, wall_times, values = steps[indexes], wall_times[indexes], values[indexes]
+
+            # Replace NaN and Inf with None for all values at once, since they can not be serialized to JSON.
+            finite_values = values.astype(object)
+            finite_values[~np.isfinite(values)] = None
             scalar = {
                 'train_id': train_id,
-                'tag': tag,
-                'values': [],
+                'tag': tag
             }
-
-            for tensor in tensors:
-                scalar['values'].append({
-                    'wall_time': tensor.wall_time,
-                    'step': tensor.step,
-                    'value': if_nan_inf_to_none('scalar_value', tensor.value),
-                })
+            if columnar:
+                scalar.update(steps=steps.tolist(), wall_times=wall_times.tolist(), values=finite_values.tolist())
+            else:
+                scalar['values'] = self._columns_to_list(wall_times.tolist(), steps.tolist(), finite_values.tolist())
 
             scalars.append(scalar)
 
         return scalars
+
+    @staticmethod
+    def _columns_to_list(wall_times, steps, values):
+        """Convert the columns of scalars to a list of dictionaries."""
+        return [{'wall_time': wall_time, 'step': step, 'value': value}
+                for wall_time, step, value in zip(wall_times, steps, values)]
@@ -200,3 +200,22 @@ class TrainTaskManager(BaseProcessor):
             ))
 
         return cache_result
+
+    def query_loading_queue(self):
+        """
+        Query status of the loading queue of train jobs.
+
+        Returns:
+            dict, including the queue depth, the number of pending requests and the status of each train job in the
+                loading order.
+        """
+        return self._data_manager.get_loading_queue_status()
+
+    def query_cache_memory_usage(self):
+        """
+        Query the memory usage of the data loaded in detail cache.
+
+        Returns:
+            dict, including the memory limit, the total memory and the memory of each train job in bytes.
+        """
+        return self._data_manager.get_detail_cache_memory_usage()
@@ -15,7 +15,7 @@
 """crc32 type stub module."""
 from typing import Union
 
-ByteStr = Union[bytes, str]
+ByteStr = Union[bytes, str, memoryview]
 
 
 def CheckValueAgainstData(crc_value: ByteStr, data: ByteStr, size: int) -> bool:
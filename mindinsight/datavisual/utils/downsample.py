@@ -0,0 +1,142 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Downsampling of series for display.
+
+The functions return the indexes of the points to be kept, so all columns of a series can be downsampled by
+the same indexes.
+"""
+import numpy as np
+
+from mindinsight.datavisual.common.enums import DownsampleMethodEnum
+from mindinsight.utils.exceptions import ParamValueError
+
+# LTTB keeps the first and the last point, and at least one point between them.
+MIN_DOWNSAMPLE_POINTS = 3
+
+
+def lttb_indexes(x, y, max_points):
+    """
+    Downsample the series by Largest-Triangle-Three-Buckets.
+
+    The points except the first and the last are divided into `max_points - 2` buckets, and the point which
+    forms the largest triangle with the point kept in the previous bucket and the average of the next bucket
+    is kept in each bucket.
+
+    Args:
+        x (numpy.ndarray): The x of the points in ascending order.
+        y (numpy.ndarray): The finite y of the points.
+        max_points (int): The max number of points to be kept, it should not be less than 3.
+
+    Returns:
+        numpy.ndarray, the ascending indexes of the points to be kept.
+    """
+    count = len(x)
+    if count <= max_points:
+        return np.arange(count)
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    bucket_count = max_points - 2
+    # The bucket i contains the points in [edges[i], edges[i + 1]), no bucket is empty since count > max_points.
+    edges = np.linspace(1, count - 1, bucket_count + 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+    # The next bucket of the last bucket is the last point.
+    next_starts = np.append(starts[1:], count - 1)
+    next_ends = np.append(ends[1:], count)
+    cum_x = np.concatenate(([0.], np.cumsum(x)))
+    cum_y = np.concatenate(([0.], np.cumsum(y)))
+    next_sizes = next_ends - next_starts
+    avg_x = (cum_x[next_ends] - cum_x[next_starts]) / next_sizes
+    avg_y = (cum_y[next_ends] - cum_y[next_starts]) / next_sizes
+
+    indexes = np.empty(max_points, dtype=np.int64)
+    indexes[0] = 0
+    indexes[-1] = count - 1
+    selected = 0
+    for bucket, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        # Twice the area of the triangle, the factor does not change the largest one.
+        areas = np.abs((x[selected] - avg_x[bucket]) * (y[start:end] - y[selected])
+                       - (x[selected] - x[start:end]) * (avg_y[bucket] - y[selected]))
+        selected = start + int(np.argmax(areas))
+        indexes[bucket + 1] = selected
+    return indexes
+
+
+def min_max_indexes(y, max_points):
+    """
+    Downsample the series by keeping the min and the max point of each bucket.
+
+    The points are divided into `max_points // 2` buckets, so the peaks of the series are always kept.
+
+    Args:
+        y (numpy.ndarray): The finite y of the points.
+        max_points (int): The max number of points to be kept, it should not be less than 2.
+
+    Returns:
+        numpy.ndarray, the ascending indexes of the points to be kept.
+    """
+    count = len(y)
+    if count <= max_points:
+        return np.arange(count)
+
+    bucket_count = max_points // 2
+    edges = np.linspace(0, count, bucket_count + 1).astype(np.int64)
+    starts = edges[:-1]
+    bucket_ids = np.repeat(np.arange(bucket_count), np.diff(edges))
+    mins = np.minimum.reduceat(y, starts)[bucket_ids]
+    maxs = np.maximum.reduceat(y, starts)[bucket_ids]
+
+    # The first min and the first max of each bucket.
+    min_candidates = np.flatnonzero(y == mins)
+    max_candidates = np.flatnonzero(y == maxs)
+    _, first_mins = np.unique(bucket_ids[min_candidates], return_index=True)
+    _, first_maxs = np.unique(bucket_ids[max_candidates], return_index=True)
+    return np.union1d(min_candidates[first_mins], max_candidates[first_maxs])
+
+
+def downsample_indexes(x, y, max_points, method=DownsampleMethodEnum.LTTB.value):
+    """
+    Get the indexes of the points to be kept after downsampling.
+
+    NaN and Inf points are not downsampled and always kept, since they usually mean that the training goes
+    wrong, so the number of indexes may be greater than `max_points` if there are such points.
+
+    Args:
+        x (numpy.ndarray): The x of the points in ascending order.
+        y (numpy.ndarray): The y of the points.
+        max_points (int): The max number of finite points to be kept.
+        method (str): The downsampling method, see `DownsampleMethodEnum`. Default: 'lttb'.
+
+    Returns:
+        numpy.ndarray, the ascending indexes of the points to be kept.
+
+    Raises:
+        ParamValueError: If the method or max points is invalid.
+    """
+    if method not in DownsampleMethodEnum.list_members():
+        raise ParamValueError("'method' only can be one of {}.".format(DownsampleMethodEnum.list_members()))
+    if max_points < MIN_DOWNSAMPLE_POINTS:
+        raise ParamValueError("'max_points' should be greater than or equal to {}.".format(MIN_DOWNSAMPLE_POINTS))
+    if len(y) <= max_points:
+        return np.arange(len(y))
+
+    finite = np.isfinite(y)
+    finite_indexes = np.flatnonzero(finite)
+    if method == DownsampleMethodEnum.LTTB.value:
+        kept = lttb_indexes(x[finite_indexes], y[finite_indexes], max_points)
+    else:
+        kept = min_max_indexes(y[finite_indexes], max_points)
+    return np.union1d(finite_indexes[kept], np.flatnonzero(~finite))
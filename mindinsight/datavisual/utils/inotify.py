@@ -0,0 +1,117 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Minimal non-blocking inotify binding for Linux based on ctypes."""
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+
+# Changes of directory entries and file contents in the watched directory.
+DIRECTORY_CHANGE_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE \
+                        | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+
+_EVENT_HEADER = struct.Struct('iIII')
+_READ_SIZE = 64 * 1024
+
+
+def is_inotify_supported():
+    """Check whether inotify is supported on current platform."""
+    return sys.platform.startswith('linux')
+
+
+class Inotify:
+    """
+    Inotify instance whose events are read without blocking.
+
+    Raises:
+        OSError, if inotify is not supported or can not be initialized.
+    """
+
+    def __init__(self):
+        if not is_inotify_supported():
+            raise OSError("Inotify is only supported on Linux.")
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+    def add_watch(self, path, mask=DIRECTORY_CHANGE_MASK):
+        """
+        Add a watch for the path.
+
+        Args:
+            path (str): The path to be watched.
+            mask (int): The events to be watched. Default: DIRECTORY_CHANGE_MASK.
+
+        Returns:
+            int, the watch descriptor. Adding a watch for the same path again returns the same descriptor.
+
+        Raises:
+            OSError, if the watch can not be added, for example the limit of watches is reached.
+        """
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), ctypes.c_uint32(mask))
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+        return wd
+
+    def remove_watch(self, wd):
+        """
+        Remove the watch, the watch may have been removed by kernel already.
+
+        Args:
+            wd (int): The watch descriptor.
+        """
+        self._libc.inotify_rm_watch(self._fd, wd)
+
+    def read_events(self):
+        """
+        Read all pending events.
+
+        Returns:
+            list[tuple[int, int]], the watch descriptor and mask of each event.
+        """
+        events = []
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return events
+            pos = 0
+            while pos < len(data):
+                wd, mask, _, name_len = _EVENT_HEADER.unpack_from(data, pos)
+                events.append((wd, mask))
+                pos += _EVENT_HEADER.size + name_len
+
+    def close(self):
+        """Close the inotify instance."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
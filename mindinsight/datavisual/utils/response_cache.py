@@ -0,0 +1,141 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Cache of encoded responses of read-only datavisual APIs.
+
+Dashboards poll the same data repeatedly, and most polls get identical data. A response is cached with the
+versions of the reservoirs it is built from, so it is served from the cache until the data changes. Each
+response has an ETag computed from its content, so a client whose copy is still up to date gets `304 Not
+Modified` without the content.
+"""
+import collections
+import hashlib
+import threading
+
+from flask import current_app
+from flask import jsonify
+from flask import request
+
+from mindinsight.conf import settings
+
+
+class ResponseCache:
+    """
+    LRU cache of encoded responses.
+
+    Only the latest version of a key is kept, the response of an old version is replaced when the response of
+    a new version is put.
+
+    Args:
+        max_bytes (int): Max bytes of the cached responses. If it equals 0, no response is cached.
+    """
+
+    def __init__(self, max_bytes):
+        self._max_bytes = max_bytes
+        self._nbytes = 0
+        self._items = collections.OrderedDict()
+        self._mutex = threading.Lock()
+
+    @property
+    def nbytes(self):
+        """Get the bytes of the cached responses."""
+        return self._nbytes
+
+    def get(self, key, version):
+        """
+        Get the cached response of the key and version.
+
+        Args:
+            key (Hashable): The key of the response.
+            version (Hashable): The version of the data which the response is built from.
+
+        Returns:
+            Union[tuple[str, bytes], None], the ETag and content of the response, or None if it is not cached.
+        """
+        with self._mutex:
+            item = self._items.get(key)
+            if item is None or item[0] != version:
+                return None
+            self._items.move_to_end(key)
+            return item[1], item[2]
+
+    def put(self, key, version, content):
+        """
+        Put the response of the key and version into the cache.
+
+        Args:
+            key (Hashable): The key of the response.
+            version (Hashable): The version of the data which the response is built from.
+            content (bytes): The encoded content of the response.
+
+        Returns:
+            str, the ETag of the response.
+        """
+        etag = hashlib.sha256(content).hexdigest()
+        if len(content) > self._max_bytes:
+            return etag
+        with self._mutex:
+            old_item = self._items.pop(key, None)
+            if old_item is not None:
+                self._nbytes -= len(old_item[2])
+            self._items[key] = (version, etag, content)
+            self._nbytes += len(content)
+            while self._nbytes > self._max_bytes:
+                _, (_, _, evicted_content) = self._items.popitem(last=False)
+                self._nbytes -= len(evicted_content)
+        return etag
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._mutex:
+            self._items.clear()
+            self._nbytes = 0
+
+
+RESPONSE_CACHE = ResponseCache(settings.RESPONSE_CACHE_MEMORY_LIMIT * 1024 * 1024)
+
+
+def get_cached_json_response(key, version, build_content):
+    """
+    Get the JSON response from the cache, or build it and put it into the cache.
+
+    The response is `304 Not Modified` if the ETag in the `If-None-Match` header of the request matches.
+
+    Args:
+        key (Hashable): The key of the response, which should contain the API and its parameters.
+        version (Hashable): The version of the data which the response is built from. It must be got before the
+            data is read, so a response is never cached with a version newer than its data. If it is None, the
+            response is not cached.
+        build_content (Callable[[], Any]): The function to build the JSON-serializable content of the response.
+
+    Returns:
+        Response, the JSON response with ETag.
+    """
+    cached = None if version is None else RESPONSE_CACHE.get(key, version)
+    if cached is not None:
+        etag, content = cached
+    else:
+        content = jsonify(build_content()).get_data()
+        if version is None:
+            etag = hashlib.sha256(content).hexdigest()
+        else:
+            etag = RESPONSE_CACHE.put(key, version, content)
+
+    response = current_app.response_class(mimetype='application/json')
+    response.set_data(content)
+    response.set_etag(etag)
+    # Let the client cache the response, but revalidate it with the ETag on every request.
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
@@ -122,3 +122,14 @@ class DebuggerGraphNotExistError(MindInsightException):
             error=DebuggerErrors.GRAPH_NOT_EXIST_ERROR,
             message=DebuggerErrorMsg.GRAPH_NOT_EXIST_ERROR.value
         )
+
+
+class DebuggerTooManyWaitingRequestsError(MindInsightException):
+    """Too many requests are waiting for data, the client should retry later."""
+    def __init__(self, retry_after):
+        super(DebuggerTooManyWaitingRequestsError, self).__init__(
+            error=DebuggerErrors.TOO_MANY_WAITING_REQUESTS_ERROR,
+            message=DebuggerErrorMsg.TOO_MANY_WAITING_REQUESTS_ERROR.value.format(retry_after),
+            http_code=429
+        )
+        self.retry_after = retry_after
@@ -25,7 +25,7 @@ from mindinsight.debugger.stream_cache.debugger_graph import NodeTypeEnum
 
 # translate the MindSpore type to numpy type.
 NUMPY_TYPE_MAP = {
-    'DT_BOOL': np.bool,
+    'DT_BOOL': np.bool_,
 
     'DT_INT8': np.int8,
     'DT_INT16': np.int16,
@@ -41,7 +41,7 @@ NUMPY_TYPE_MAP = {
     'DT_FLOAT32': np.float32,
     'DT_FLOAT64': np.float64,
 
-    'DT_STRING': np.str
+    'DT_STRING': np.str_
 }
 
 
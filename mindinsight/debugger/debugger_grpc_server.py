@@ -13,6 +13,7 @@
 # limitations under the License.
 # ============================================================================
 """Implement the debugger grpc server."""
+import time
 from functools import wraps
 
 from mindinsight.debugger.common.log import logger as log
@@ -241,10 +242,14 @@ class DebuggerGrpcServer(grpc_server_base.EventListenerServicer):
     def SendGraph(self, request_iterator, context):
         """Send graph into DebuggerCache."""
         log.info("Received graph.")
-        serial_graph = b""
-        for chunk in request_iterator:
-            serial_graph += chunk.buffer
+        start_time = time.time()
+        # join the chunks once, appending them to bytes one by one is quadratic in the number of chunks.
+        chunks = [chunk.buffer for chunk in request_iterator]
+        serial_graph = b"".join(chunks)
+        receive_time = time.time()
         graph = GraphProto.FromString(serial_graph)
+        log.info("Receive the graph of %d bytes in %d chunks in %.3f s, deserialize it in %.3f s.",
+                 len(serial_graph), len(chunks), receive_time - start_time, time.time() - receive_time)
         log.debug("Deserialize the graph. Receive %s nodes", len(graph.node))
         self._cache_store.get_stream_handler(Streams.GRAPH).put(graph)
         self._cache_store.get_stream_handler(Streams.TENSOR).put_const_vals(graph.const_vals)
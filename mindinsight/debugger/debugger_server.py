@@ -302,13 +302,14 @@ class DebuggerServer:
     def retrieve_tensor_value(self, name, detail, shape):
         """Retrieve the tensor value."""
         log.info("Retrieve tensor value: name: %s, detail: %s, shape: %s", name, detail, shape)
-        self.validate_tensor_param(name, detail)
+        self.validate_tensor_param(name, detail, valid_details=('data', 'overview'))
         parsed_shape = self.parse_shape(shape)
         node_type, tensor_name = self._get_tensor_name_and_type_by_ui_name(name)
         reply = self.cache_store.get_stream_handler(Streams.TENSOR).get(
             {'name': tensor_name,
              'node_type': node_type,
-             'shape': parsed_shape}
+             'shape': parsed_shape,
+             'detail': detail}
         )
         reply['tensor_value']['name'] = name
 
@@ -333,14 +334,14 @@ class DebuggerServer:
         return node_type, tensor_name
 
     @staticmethod
-    def validate_tensor_param(name, detail):
+    def validate_tensor_param(name, detail, valid_details=('data',)):
         """Validate params for retrieve tensor request."""
         # validate name
         if not isinstance(name, str) or ':' not in name:
             log.error("Invalid tensor name. Received: %s", name)
             raise DebuggerParamValueError("Invalid tensor name.")
         # validate data
-        if detail != 'data':
+        if detail not in valid_details:
             log.error("Invalid detail value. Received: %s", detail)
             raise DebuggerParamValueError("Invalid detail value.")
 
@@ -226,12 +226,13 @@ class DebuggerGraph(MSGraph):
         log.info('Randomly choose node %s as root to do BFS.', root.name)
 
         bfs_order = []
-        self.get_bfs_graph(root.name, bfs_order)
+        visited = set()
+        self.get_bfs_graph(root.name, bfs_order, visited)
         length = len(self._leaf_nodes.keys())
         # Find rest un-traversed nodes
-        for node_name, _ in self._leaf_nodes.items():
-            if node_name not in bfs_order:
-                self.get_bfs_graph(node_name, bfs_order)
+        for node_name in self._leaf_nodes:
+            if node_name not in visited:
+                self.get_bfs_graph(node_name, bfs_order, visited)
 
         if len(bfs_order) != length:
             log.error("The length of bfs and leaf nodes are not equal.")
@@ -240,15 +241,21 @@ class DebuggerGraph(MSGraph):
 
         return bfs_order
 
-    def get_bfs_graph(self, node_name, bfs_order):
+    def get_bfs_graph(self, node_name, bfs_order, visited=None):
         """
         Traverse the graph in order of breath-first search.
 
-        Returns:
-            list, including the leaf nodes arranged in BFS order.
+        Args:
+            node_name (str): The name of the node to start from.
+            bfs_order (list[str]): The list to which the traversed leaf nodes are appended.
+            visited (Optional[set[str]]): The names of the nodes which have been traversed or queued, it is
+                updated in place. If it is None, the nodes in `bfs_order` are regarded as visited. Default: None.
         """
+        if visited is None:
+            visited = set(bfs_order)
         temp_list = deque()
         temp_list.append(node_name)
+        visited.add(node_name)
         while temp_list:
             node_name = temp_list.popleft()
             node = self._leaf_nodes.get(node_name)
@@ -258,13 +265,10 @@ class DebuggerGraph(MSGraph):
                 continue
 
             bfs_order.append(node_name)
-            if node.input:
-                for name in node.input.keys():
-                    if name not in temp_list and name not in bfs_order:
-                        temp_list.append(name)
-            if node.output:
-                for name in node.output.keys():
-                    if name not in temp_list and name not in bfs_order:
+            for names in (node.input, node.output):
+                for name in names:
+                    if name not in visited:
+                        visited.add(name)
                         temp_list.append(name)
 
     def get_default_root(self):
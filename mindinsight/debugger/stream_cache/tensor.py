@@ -13,10 +13,13 @@
 # limitations under the License.
 # ============================================================================
 """The definition of tensor stream."""
+import os
+import threading
 from abc import abstractmethod, ABC
 
 import numpy as np
 
+from mindinsight.datavisual.data_transform.tensor_container import calc_original_buckets
 from mindinsight.utils.tensor import TensorUtils
 from mindinsight.debugger.common.exceptions.exceptions import DebuggerParamValueError
 from mindinsight.debugger.common.log import logger as log
@@ -82,16 +85,30 @@ class BaseTensor(ABC):
         res.update(value_info)
         return res
 
+    def get_overview_info(self):
+        """Get tensor info with the overview of value."""
+        return self.get_full_info()
+
 
 class OpTensor(BaseTensor):
-    """Tensor data structure for operator Node."""
+    """
+    Tensor data structure for operator Node.
+
+    The summary of tensor value, including statistics, histogram and min/max pyramid, is calculated once and
+    cached, so overview requests do not read the whole value again.
+    """
     max_number_data_show_on_ui = 100000
+    max_number_pyramid_points = 1024
 
-    def __init__(self, tensor_proto, step=0):
+    def __init__(self, tensor_proto, step=0, tensor_content=None):
         # the type of tensor_proto is TensorProto
         super(OpTensor, self).__init__(step)
         self._tensor_proto = tensor_proto
-        self._value = self.generate_value(tensor_proto)
+        if tensor_content is None:
+            tensor_content = tensor_proto.tensor_content
+        self._value = self.generate_value(tensor_content)
+        self._summary = None
+        self._summary_lock = threading.Lock()
 
     @property
     def name(self):
@@ -126,13 +143,50 @@ class OpTensor(BaseTensor):
         """The property of tensor value in numpy type."""
         return self._value
 
-    def generate_value(self, tensor_proto):
-        """Generate tensor value from proto."""
+    @property
+    def nbytes(self):
+        """The memory(Bytes) of tensor value, it is 0 if the value has been spilled to disk."""
+        if self._value is None or isinstance(self._value, np.memmap):
+            return 0
+        return self._value.nbytes
+
+    def spill(self, file_path):
+        """
+        Save the tensor value into the file and replace the value with the memory-mapped file.
+
+        The memory-mapped value can be read in the same way as the value in memory, and its pages are loaded
+        only when they are read.
+
+        Args:
+            file_path (str): The path of the `.npy` file.
+
+        Returns:
+            int, the size(Bytes) of the file.
+
+        Raises:
+            OSError: If the file can not be written.
+            ValueError: If the value can not be saved without pickle.
+        """
+        np.save(file_path, self._value, allow_pickle=False)
+        self._value = np.load(file_path, mmap_mode='r')
+        return os.path.getsize(file_path)
+
+    def generate_value(self, tensor_content):
+        """
+        Generate tensor value from tensor content.
+
+        The value shares the memory of the tensor content without copying it.
+
+        Args:
+            tensor_content (bytes): The tensor content.
+
+        Returns:
+            Union[numpy.ndarray, None], the tensor value, or None if the tensor content is empty.
+        """
         tensor_value = None
-        if tensor_proto.tensor_content:
-            tensor_value = tensor_proto.tensor_content
+        if tensor_content:
             np_type = NUMPY_TYPE_MAP.get(self.dtype)
-            tensor_value = np.frombuffer(tensor_value, dtype=np_type)
+            tensor_value = np.frombuffer(tensor_content, dtype=np_type)
             tensor_value = tensor_value.reshape(self.shape)
         return tensor_value
 
@@ -150,14 +204,63 @@ class OpTensor(BaseTensor):
         res = {}
         # the type of tensor_value is one of None, np.ndarray or str
         if isinstance(tensor_value, np.ndarray):
-            statistics = TensorUtils.get_statistics_from_tensor(tensor_value)
-            res['statistics'] = TensorUtils.get_statistics_dict(statistics)
+            if tensor_value.size == self._value.size:
+                # the statistics of the whole tensor is cached in summary.
+                res['statistics'] = self.get_summary().get('statistics')
+            else:
+                statistics = TensorUtils.get_statistics_from_tensor(tensor_value)
+                res['statistics'] = TensorUtils.get_statistics_dict(statistics)
             res['value'] = tensor_value.tolist()
         elif isinstance(tensor_value, str):
             res['value'] = tensor_value
 
         return res
 
+    def get_summary(self):
+        """
+        Get the summary of tensor value, it is calculated at the first call.
+
+        Returns:
+            dict, the summary of tensor value, it is empty if the tensor has no value yet.
+
+                - statistics (dict): The statistics of tensor value.
+
+                - histogram (list[list]): The left edge, width and count of histogram buckets.
+
+                - pyramid (list[dict]): The block size, mins and maxes of each level of the min/max pyramid of
+                  the flattened value, from the coarsest level to the finest level.
+        """
+        with self._summary_lock:
+            if self._summary is None:
+                self._summary = self._calc_summary()
+            return self._summary
+
+    def _calc_summary(self):
+        """Calculate the summary of tensor value."""
+        value = self._value
+        if value is None:
+            return {}
+        stats = TensorUtils.get_statistics_from_tensor(value)
+        histogram = []
+        if value.dtype.kind in ('i', 'u', 'f'):
+            buckets = calc_original_buckets(value, stats)
+            histogram = [[float(bucket.left), float(bucket.width), int(bucket.count)] for bucket in buckets]
+        pyramid = [
+            {'block_size': block_size, 'min': mins.tolist(), 'max': maxes.tolist()}
+            for block_size, mins, maxes in TensorUtils.get_min_max_pyramid(value, self.max_number_pyramid_points)
+        ]
+        return {
+            'statistics': TensorUtils.get_statistics_dict(stats),
+            'histogram': histogram,
+            'pyramid': pyramid
+        }
+
+    def get_overview_info(self):
+        """Get tensor info with the summary of value instead of the value."""
+        res = self._to_dict()
+        res.update(self.get_summary())
+        return res
+
     def get_tensor_value_by_shape(self, shape=None):
         """
         Get tensor value by shape.
@@ -0,0 +1,245 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Bounded store of the tensors received by debugger.
+
+Tensors read recently are kept in memory as numpy arrays. When the memory limit is exceeded, the tensors read
+least recently are spilled to `.npy` files in a scratch directory of workspace and replaced by memory-mapped
+arrays, so they are still read in the same way. When the disk limit is exceeded, the spilled tensors read least
+recently are removed, and they will be queried from the client again like the tensors never received.
+
+The scratch directory is named with the process ID. It is removed when the store is cleared or the process
+exits, and the ones left by the processes which no longer exist are removed before a new one is created.
+"""
+import atexit
+import collections
+import itertools
+import os
+import shutil
+import tempfile
+import threading
+
+from mindinsight.conf import settings
+from mindinsight.debugger.common.log import logger as log
+
+
+class TensorStore:
+    """
+    Store of tensors by tensor name and step.
+
+    Args:
+        memory_limit (Optional[int]): Max memory(Bytes) of the tensor values in memory. If it is None,
+            `DEBUGGER_TENSOR_MEMORY_LIMIT` in settings will be used. Default: None.
+        disk_limit (Optional[int]): Max disk usage(Bytes) of the spilled tensor values. If it is None,
+            `DEBUGGER_TENSOR_DISK_LIMIT` in settings will be used. If it equals 0, tensors are removed
+            instead of spilled. Default: None.
+        store_dir (Optional[str]): The directory in which the scratch directory is created. If it is None,
+            the `debugger_tensor` directory in workspace will be used. Default: None.
+    """
+
+    def __init__(self, memory_limit=None, disk_limit=None, store_dir=None):
+        self._memory_limit = memory_limit
+        self._disk_limit = disk_limit
+        self._store_dir = store_dir
+        self._scratch_dir = None
+        # (tensor_name, step) -> tensor, in the order of being read.
+        self._tensors = collections.OrderedDict()
+        # (tensor_name, step) -> (file path, file size) of the spilled tensors.
+        self._spilled = {}
+        self._file_ids = itertools.count()
+        self._nbytes = 0
+        self._disk_usage = 0
+        self._lock = threading.Lock()
+        self._exit_cleanup_registered = False
+
+    @property
+    def memory_limit(self):
+        """Get the max memory(Bytes) of the tensor values in memory."""
+        if self._memory_limit is not None:
+            return self._memory_limit
+        return settings.DEBUGGER_TENSOR_MEMORY_LIMIT * 1024 * 1024
+
+    @property
+    def disk_limit(self):
+        """Get the max disk usage(Bytes) of the spilled tensor values."""
+        if self._disk_limit is not None:
+            return self._disk_limit
+        return settings.DEBUGGER_TENSOR_DISK_LIMIT * 1024 * 1024
+
+    @property
+    def nbytes(self):
+        """Get the memory(Bytes) of the tensor values in memory."""
+        return self._nbytes
+
+    @property
+    def disk_usage(self):
+        """Get the disk usage(Bytes) of the spilled tensor values."""
+        return self._disk_usage
+
+    def put(self, tensor_name, step, tensor):
+        """
+        Put the tensor into the store, the tensor of the same name and step is replaced.
+
+        Args:
+            tensor_name (str): The name of the tensor.
+            step (int): The step of the tensor.
+            tensor (OpTensor): The tensor.
+        """
+        key = (tensor_name, step)
+        with self._lock:
+            self._remove(key)
+            self._tensors[key] = tensor
+            self._nbytes += tensor.nbytes
+            self._limit_memory()
+
+    def get(self, tensor_name, step):
+        """
+        Get the tensor of the name and step.
+
+        Args:
+            tensor_name (str): The name of the tensor.
+            step (int): The step of the tensor.
+
+        Returns:
+            Union[OpTensor, None], the tensor, or None if it is not in the store.
+        """
+        key = (tensor_name, step)
+        with self._lock:
+            tensor = self._tensors.get(key)
+            if tensor is not None:
+                self._tensors.move_to_end(key)
+            return tensor
+
+    def clear(self):
+        """Remove all tensors and their spilled files."""
+        with self._lock:
+            self._tensors.clear()
+            self._spilled.clear()
+            self._nbytes = 0
+            self._disk_usage = 0
+            self._remove_scratch_dir()
+
+    def _remove(self, key):
+        """Remove the tensor of the key. Call this function with the lock acquired."""
+        tensor = self._tensors.pop(key, None)
+        if tensor is None:
+            return
+        self._nbytes -= tensor.nbytes
+        spilled = self._spilled.pop(key, None)
+        if spilled is not None:
+            file_path, file_size = spilled
+            self._disk_usage -= file_size
+            try:
+                os.remove(file_path)
+            except OSError as ex:
+                log.warning("Remove spilled tensor file failed, detail: %r.", str(ex))
+
+    def _limit_memory(self):
+        """Spill the tensors read least recently until the memory limit is met. Call it with the lock."""
+        if self._nbytes <= self.memory_limit:
+            return
+        for key, tensor in list(self._tensors.items()):
+            if self._nbytes <= self.memory_limit:
+                break
+            nbytes = tensor.nbytes
+            if not nbytes:
+                continue
+            if nbytes > self.disk_limit or not self._spill(key, tensor):
+                log.info("Remove tensor %s of step %d to limit the memory.", key[0], key[1])
+                self._remove(key)
+                continue
+            self._nbytes -= nbytes
+        self._limit_disk()
+
+    def _spill(self, key, tensor):
+        """
+        Spill the tensor to a file in the scratch directory. Call this function with the lock acquired.
+
+        Returns:
+            bool, whether the tensor is spilled.
+        """
+        file_path = None
+        try:
+            if self._scratch_dir is None:
+                self._make_scratch_dir()
+            file_path = os.path.join(self._scratch_dir, '{}.npy'.format(next(self._file_ids)))
+            file_size = tensor.spill(file_path)
+        except (OSError, ValueError) as ex:
+            log.warning("Spill tensor %s of step %d failed, detail: %r.", key[0], key[1], str(ex))
+            if file_path is not None and os.path.exists(file_path):
+                os.remove(file_path)
+            return False
+        self._spilled[key] = (file_path, file_size)
+        self._disk_usage += file_size
+        log.debug("Spill tensor %s of step %d into %s.", key[0], key[1], file_path)
+        return True
+
+    def _make_scratch_dir(self):
+        """Create the scratch directory after removing the stale ones. Call this function with the lock acquired."""
+        store_dir = self._store_dir or os.path.join(settings.WORKSPACE, 'debugger_tensor')
+        os.makedirs(store_dir, mode=0o700, exist_ok=True)
+        _remove_stale_scratch_dirs(store_dir)
+        self._scratch_dir = tempfile.mkdtemp(prefix='{}-'.format(os.getpid()), dir=store_dir)
+        if not self._exit_cleanup_registered:
+            # The lock is not acquired at exit, since it may be held by a daemon thread which never releases it.
+            atexit.register(self._remove_scratch_dir)
+            self._exit_cleanup_registered = True
+
+    def _remove_scratch_dir(self):
+        """Remove the scratch directory and the spilled files in it."""
+        if self._scratch_dir is not None:
+            shutil.rmtree(self._scratch_dir, ignore_errors=True)
+            self._scratch_dir = None
+
+    def _limit_disk(self):
+        """Remove the spilled tensors read least recently until the disk limit is met. Call it with the lock."""
+        for key in list(self._tensors.keys()):
+            if self._disk_usage <= self.disk_limit:
+                break
+            if key in self._spilled:
+                log.info("Remove spilled tensor %s of step %d to limit the disk usage.", key[0], key[1])
+                self._remove(key)
+
+
+def _is_process_alive(pid):
+    """Check whether the process of the pid exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but belongs to another user.
+        return True
+    return True
+
+
+def _remove_stale_scratch_dirs(store_dir):
+    """
+    Remove the scratch directories left by the processes which no longer exist, e.g. killed ones.
+
+    Args:
+        store_dir (str): The directory in which the scratch directories are created.
+    """
+    for dir_name in os.listdir(store_dir):
+        pid, sep, _ = dir_name.partition('-')
+        if not sep or not pid.isdigit():
+            continue
+        pid = int(pid)
+        if pid == os.getpid() or _is_process_alive(pid):
+            continue
+        dir_path = os.path.join(store_dir, dir_name)
+        if os.path.isdir(dir_path):
+            log.info("Remove stale tensor scratch directory %s.", dir_path)
+            shutil.rmtree(dir_path, ignore_errors=True)
@@ -13,27 +13,40 @@
 # limitations under the License.
 # ============================================================================
 """Define the message handler."""
+import time
 import uuid
-from queue import Queue, Empty
-from threading import Lock
+from threading import Condition
 
-from mindinsight.debugger.common.exceptions.exceptions import DebuggerParamValueError
+from mindinsight.debugger.common.exceptions.exceptions import DebuggerParamValueError, \
+    DebuggerTooManyWaitingRequestsError
 from mindinsight.debugger.common.log import logger as log
 from mindinsight.debugger.stream_handler.base_handler import StreamHandlerBase
 
 
 class EventHandler(StreamHandlerBase):
-    """Message Handler."""
+    """
+    Message Handler.
+
+    Requests waiting for new events share one condition instead of a queue each, and all of them are woken
+    by `put`. The number of waiting requests is limited, so they can not occupy all threads of the web
+    service. The requests beyond the limit are rejected, and the clients retry after `retry_after` seconds.
+    """
 
     max_limit = 1000  # the max number of items in cache
+    max_waiting = 10  # the max number of requests waiting for events at the same time
+    wait_timeout = 25  # less than the timeout limit from UI
+    retry_after = 5  # the seconds to wait before retrying the rejected requests
 
     def __init__(self):
         self._prev_flag = str(uuid.uuid4())
         self._cur_flag = str(uuid.uuid4())
         self._next_idx = 0
         self._event_cache = [None] * self.max_limit
-        self._pending_requests = {}
-        self._lock = Lock()
+        # The number of events put and the number of cleans, waiting requests use them to find updates.
+        self._put_count = 0
+        self._clean_count = 0
+        self._waiting_count = 0
+        self._condition = Condition()
 
     @property
     def next_pos(self):
@@ -53,14 +66,14 @@ class EventHandler(StreamHandlerBase):
 
     def clean(self):
         """Clean event cache."""
-        with self._lock:
+        with self._condition:
             self._prev_flag = str(uuid.uuid4())
             self._cur_flag = str(uuid.uuid4())
             self._next_idx = 0
             self._event_cache = [None] * self.max_limit
-            value = {'metadata': {'pos': '0'}}
-            self.clean_pending_requests(value)
-            log.debug("Clean event cache. %d request is waiting.", len(self._pending_requests))
+            self._clean_count += 1
+            self._condition.notify_all()
+            log.debug("Clean event cache. %d request is waiting.", self._waiting_count)
 
     def put(self, value):
         """
@@ -73,9 +86,9 @@ class EventHandler(StreamHandlerBase):
             log.error("Dict type required when put event message.")
             raise DebuggerParamValueError("Dict type required when put event message.")
 
-        with self._lock:
+        with self._condition:
             log.debug("Put the %d-th message into queue. \n %d requests is waiting.",
-                      self._next_idx, len(self._pending_requests))
+                      self._next_idx, self._waiting_count)
             cur_pos = self._next_idx
             # update next pos
             self._next_idx += 1
@@ -88,14 +101,9 @@ class EventHandler(StreamHandlerBase):
                 value['metadata'] = {}
             value['metadata']['pos'] = self.next_pos
             self._event_cache[cur_pos] = value
-            # feed the value for pending requests
-            self.clean_pending_requests(value)
-
-    def clean_pending_requests(self, value):
-        """Clean pending requests."""
-        for _, request in self._pending_requests.items():
-            request.put(value)
-        self._pending_requests = {}
+            self._put_count += 1
+            # feed the value for waiting requests
+            self._condition.notify_all()
 
     def get(self, filter_condition=None):
         """
@@ -106,24 +114,63 @@ class EventHandler(StreamHandlerBase):
 
         Returns:
             object, the pos-th event.
+
+        Raises:
+            DebuggerTooManyWaitingRequestsError: If there is no event and too many requests are waiting.
         """
         flag, idx = self._parse_pos(filter_condition)
-        cur_id = str(uuid.uuid4())
-        with self._lock:
+        with self._condition:
             # reset the pos after the cache is re-initialized.
             if not flag or flag not in [self._cur_flag, self._prev_flag]:
                 idx = 0
-            # get event from cache immediately
-            if idx != self._next_idx and self._event_cache[idx]:
+            # get event from cache immediately, the event at next pos of previous round is not overwritten yet.
+            if (idx != self._next_idx or flag == self._prev_flag) and self._event_cache[idx]:
                 return self._event_cache[idx]
             # wait for the event
-            cur_queue = Queue(maxsize=1)
-            self._pending_requests[cur_id] = cur_queue
-        # block until event has been received
-        event = self._wait_for_event(cur_id, cur_queue, filter_condition)
+            if not self._can_wait():
+                raise DebuggerTooManyWaitingRequestsError(self.retry_after)
+            event = self._wait_for_event(self.wait_timeout)
 
+        if event is None:
+            event = {'metadata': {'pos': filter_condition}}
         return event
 
+    def _can_wait(self):
+        """Check whether a request can wait for events. Call this function with the condition acquired."""
+        if self._waiting_count >= self.max_waiting:
+            log.warning("Too many requests are waiting for events, %d upper limit reached.", self.max_waiting)
+            return False
+        return True
+
+    def _wait_for_event(self, timeout):
+        """
+        Wait for the next event. Call this function with the condition acquired.
+
+        Args:
+            timeout (float): The max seconds to wait.
+
+        Returns:
+            Union[dict, None], the next event, the reset event if the cache is cleaned, or None if it times out.
+        """
+        cur_idx = self._next_idx
+        put_count = self._put_count
+        clean_count = self._clean_count
+        deadline = time.monotonic() + timeout
+        self._waiting_count += 1
+        try:
+            while True:
+                if self._clean_count != clean_count:
+                    return {'metadata': {'pos': '0'}}
+                if self._put_count != put_count:
+                    return self._event_cache[cur_idx]
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    log.debug("Clean timeout request. Left waiting requests: %d", self._waiting_count - 1)
+                    return None
+                self._condition.wait(remaining)
+        finally:
+            self._waiting_count -= 1
+
     def _parse_pos(self, pos):
         """Get next pos according to input position."""
         elements = pos.split(':')
@@ -139,21 +186,3 @@ class EventHandler(StreamHandlerBase):
         flag = elements[0] if len(elements) == 2 else ''
 
         return flag, idx
-
-    def _wait_for_event(self, cur_id, cur_queue, pos):
-        """Wait for the pos-th event."""
-        try:
-            # set the timeout to 25 seconds which is less the the timeout limit from UI
-            event = cur_queue.get(timeout=25)
-        except Empty:
-            event = None
-
-        if event is None:
-            with self._lock:
-                if self._pending_requests.get(cur_id):
-                    self._pending_requests.pop(cur_id)
-                log.debug("Clean timeout request. Left pending requests: %d",
-                          len(self._pending_requests))
-            event = {'metadata': {'pos': pos}}
-
-        return event
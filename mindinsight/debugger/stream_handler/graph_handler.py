@@ -28,6 +28,8 @@ class GraphHandler(StreamHandlerBase):
         self._graph = None
         self._searched_node_list = []
         self.bfs_order = []
+        # The position of each leaf node in BFS order.
+        self._bfs_index = {}
 
     @property
     def graph(self):
@@ -49,6 +51,7 @@ class GraphHandler(StreamHandlerBase):
         graph.build_graph(value)
         self._graph = graph
         self.bfs_order = self._graph.get_bfs_order()
+        self._bfs_index = {node_name: index for index, node_name in enumerate(self.bfs_order)}
 
     def get(self, filter_condition=None):
         """
@@ -251,15 +254,15 @@ class GraphHandler(StreamHandlerBase):
             else:
                 next_node = bfs_order[0]
         else:
-            try:
-                index = bfs_order.index(node_name)
-                log.debug("The index of the node in BFS list is: %d", index)
-            except ValueError as err:
+            index = self._bfs_index.get(node_name)
+            if index is None:
+                err = f'{node_name!r} is not in list'
                 log.error('Cannot find the node: %s. Please check '
                           'the node name: %s', node_name, err)
                 msg = f'Cannot find the node: {node_name}. ' \
                       f'Please check the node name {err}.'
                 raise DebuggerParamValueError(msg)
+            log.debug("The index of the node in BFS list is: %d", index)
 
             next_node = self.get_next_node_in_bfs(index, length, ascend)
 
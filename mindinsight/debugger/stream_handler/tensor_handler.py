@@ -13,6 +13,11 @@
 # limitations under the License.
 # ============================================================================
 """Define the tensor stream handler."""
+import collections
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from mindinsight.datavisual.data_transform.graph.node import NodeTypeEnum
@@ -20,17 +25,30 @@ from mindinsight.debugger.common.exceptions.exceptions import DebuggerParamValue
 from mindinsight.debugger.common.log import logger as log
 from mindinsight.debugger.proto.ms_graph_pb2 import DataType
 from mindinsight.debugger.stream_cache.tensor import OpTensor, ConstTensor
+from mindinsight.debugger.stream_cache.tensor_store import TensorStore
 from mindinsight.debugger.stream_handler.base_handler import StreamHandlerBase
 from mindinsight.utils.tensor import TensorUtils
 
 
 class TensorHandler(StreamHandlerBase):
-    """Metadata Handler."""
+    """
+    Metadata Handler.
+
+    The summary of each received tensor is calculated by a background worker, so it is ready when the tensor
+    is viewed. The replies of tensor comparisons are cached until the tensors are updated.
+    """
+    max_diff_cache_size = 4
 
     def __init__(self):
         self._const_vals = {}
-        self._tensors = {}
+        self._tensors = TensorStore()
         self._cur_step = 0
+        self._summary_executor = ThreadPoolExecutor(max_workers=1)
+        # The cache is cleared by the grpc server and read by the web server, so it is guarded by the lock.
+        self._diff_cache = collections.OrderedDict()
+        self._diff_cache_lock = threading.Lock()
+        # It is increased whenever the cache is cleared, so the replies calculated before are not cached.
+        self._diff_cache_version = 0
 
     def put(self, value):
         """
@@ -43,39 +61,57 @@ class TensorHandler(StreamHandlerBase):
 
                 - tensor_protos (list[TensorProto]): The tensor proto.
         """
+        start_time = time.time()
         tensor_protos = value.get('tensor_protos')
-        merged_tensor = self._get_merged_tensor(tensor_protos)
+        merged_tensor, tensor_content = self._get_merged_tensor(tensor_protos)
         step = value.get('step', 0)
         if merged_tensor.iter and step > 0:
             log.debug("Received previous tensor.")
             step -= 1
-        tensor = OpTensor(merged_tensor, step)
+        tensor = OpTensor(merged_tensor, step, tensor_content)
         self._put_tensor_into_cache(tensor, step)
-        log.info("Put tensor %s of step: %d, into cache", tensor.name, step)
+        self._summary_executor.submit(self._calc_tensor_summary, tensor)
+        log.info("Put tensor %s of step: %d, into cache. Merge %d bytes in %d chunks in %.3f s.",
+                 tensor.name, step, len(tensor_content), len(tensor_protos), time.time() - start_time)
 
     @staticmethod
     def _get_merged_tensor(tensor_protos):
         """
         Merged list of parsed tensor value into one.
 
+        The tensor content is taken out of the tensor protos, so it is not kept twice in memory.
+
         Args:
             tensor_protos (list[TensorProto]): List of tensor proto.
 
         Returns:
-            TensorProto, merged tensor proto.
+            tuple[TensorProto, bytes], merged tensor proto without tensor content, and the merged tensor content.
         """
         merged_tensor = tensor_protos[-1]
         if len(tensor_protos) > 1:
-            tensor_value = bytes()
+            chunks = []
             for tensor_proto in tensor_protos:
                 if not tensor_proto.tensor_content:
                     log.warning("Doesn't find tensor value for %s:%s",
                                 tensor_proto.node_name, tensor_proto.slot)
                     break
-                tensor_value += tensor_proto.tensor_content
-            merged_tensor.tensor_content = tensor_value
+                chunks.append(tensor_proto.tensor_content)
+                tensor_proto.ClearField('tensor_content')
+            # join the chunks once, appending them to bytes one by one is quadratic in the number of chunks.
+            tensor_content = b"".join(chunks)
             log.debug("Merge multi tensor values into one.")
-        return merged_tensor
+        else:
+            tensor_content = merged_tensor.tensor_content
+        merged_tensor.ClearField('tensor_content')
+        return merged_tensor, tensor_content
+
+    @staticmethod
+    def _calc_tensor_summary(tensor):
+        """Calculate the summary of tensor in background."""
+        try:
+            tensor.get_summary()
+        except Exception as err:
+            log.exception(err)
 
     def _put_tensor_into_cache(self, tensor, step):
         """
@@ -84,11 +120,8 @@ class TensorHandler(StreamHandlerBase):
         Args:
             tensor (OpTensor): The tensor value.
         """
-        cache_tensor = self._tensors.get(tensor.name)
-        if cache_tensor is None:
-            cache_tensor = {}
-            self._tensors[tensor.name] = cache_tensor
-        cache_tensor[step] = tensor
+        self._tensors.put(tensor.name, step, tensor)
+        self._clear_diff_cache()
 
     def put_const_vals(self, const_vals):
         """
@@ -120,17 +153,26 @@ class TensorHandler(StreamHandlerBase):
 
                 - node_type (str): The type of the node.
 
+                - shape (tuple): The specified range of tensor value.
+
+                - detail (str): The detail to be got, 'data' means the tensor value, and 'overview' means the
+                  statistics, histogram and min/max pyramid instead of the tensor value. Default: 'data'.
+
         Returns:
             dict, the tensor_value.
         """
         name = filter_condition.get('name')
         node_type = filter_condition.get('node_type')
         shape = filter_condition.get('shape')
+        detail = filter_condition.get('detail', 'data')
         tensor = self._get_tensor(name, node_type)
         if not tensor:
             log.error("No tensor named %s", name)
             raise DebuggerParamValueError("No tensor named {}".format(name))
-        tensor_info = tensor.get_full_info(shape)
+        if detail == 'overview':
+            tensor_info = tensor.get_overview_info()
+        else:
+            tensor_info = tensor.get_full_info(shape)
         self._update_has_prev_step_field(tensor_info, name, node_type)
         return {'tensor_value': tensor_info}
 
@@ -148,11 +190,11 @@ class TensorHandler(StreamHandlerBase):
         """
         if step is None:
             step = self._cur_step
-        tensor = self._tensors.get(tensor_name, {}).get(step)
+        tensor = self._tensors.get(tensor_name, step)
         if not tensor and node_type == NodeTypeEnum.CONST.value:
+            # const values are kept with the graph, they are not put into the bounded tensor store.
             const_name = tensor_name.rsplit('/', 1)[-1]
             tensor = self._const_vals.get(const_name)
-            self._tensors[tensor_name] = {step: tensor}
 
         return tensor
 
@@ -240,16 +282,14 @@ class TensorHandler(StreamHandlerBase):
     def clean_tensors(self, cur_step):
         """Clean the tensor cache."""
         self._cur_step = cur_step
-        expired_tensor = []
-        for tensor_name, tensor in self._tensors.items():
-            expired_step = [step for step in tensor.keys() if step <= cur_step - 2]
-            for step in expired_step:
-                tensor.pop(step)
-            if not tensor:
-                expired_tensor.append(tensor_name)
-        for tensor_name in expired_tensor:
-            self._tensors.pop(tensor_name)
-        self._tensors = {}
+        self._tensors.clear()
+        self._clear_diff_cache()
+
+    def _clear_diff_cache(self):
+        """Clear the cached replies of tensor comparisons."""
+        with self._diff_cache_lock:
+            self._diff_cache.clear()
+            self._diff_cache_version += 1
 
     def get_tensors_diff(self, tensor_name, shape, tolerance=0):
         """
@@ -271,6 +311,24 @@ class TensorHandler(StreamHandlerBase):
         Returns:
             dict, the retrieved data.
         """
+        # slices in shape are not hashable, so the shape is converted to str.
+        cache_key = (tensor_name, self._cur_step, str(shape), tolerance)
+        with self._diff_cache_lock:
+            reply = self._diff_cache.get(cache_key)
+            version = self._diff_cache_version
+        if reply is not None:
+            return reply
+        reply = self._calc_tensors_diff(tensor_name, shape, tolerance)
+        with self._diff_cache_lock:
+            # the tensors may be updated during calculation, then the reply is out of date.
+            if version == self._diff_cache_version:
+                self._diff_cache[cache_key] = reply
+                while len(self._diff_cache) > self.max_diff_cache_size:
+                    self._diff_cache.popitem(last=False)
+        return reply
+
+    def _calc_tensors_diff(self, tensor_name, shape, tolerance):
+        """Calculate tensor comparisons data, see `get_tensors_diff`."""
         curr_tensor = self.get_tensor_value_by_name(tensor_name)
         prev_tensor = self.get_tensor_value_by_name(tensor_name, prev=True)
         if not (curr_tensor and prev_tensor):
@@ -65,9 +65,7 @@ class AicoreTypeAnalyser(BaseAnalyser):
         Args:
             filter_condition (dict): The filter condition.
         """
-        def _inner_filter(item: list):
-            return self._default_filter(item, filter_condition)
-        self._result = list(filter(_inner_filter, self._data))
+        self._result = self._filter_data(filter_condition)
 
     def _organize_query_result(self):
         """
@@ -206,9 +204,6 @@ class AicoreDetailAnalyser(BaseAnalyser):
         Args:
             filter_condition (dict): The filter condition.
         """
-        def _inner_filter(item: list):
-            return self._default_filter(item, filter_condition)
-
         def _inner_map(item: list):
             inner_item = item[0:4]
             if is_display_full_op_name:
@@ -222,12 +217,9 @@ class AicoreDetailAnalyser(BaseAnalyser):
             'is_display_full_op_name', True
         )
         self._set_display_col_name(is_display_detail, is_display_full_op_name)
-        if is_display_detail and is_display_full_op_name:
-            self._result = list(filter(_inner_filter, self._data))
-        else:
-            self._result = list(
-                map(_inner_map, filter(_inner_filter, self._data))
-            )
+        self._result = self._filter_data(filter_condition)
+        if not is_display_detail or not is_display_full_op_name:
+            self._result = list(map(_inner_map, self._result))
 
     def _set_display_col_name(self, is_display_detail, is_display_full_op_name):
         """
@@ -340,9 +332,7 @@ class AicpuTypeAnalyser(BaseAnalyser):
         Args:
             filter_condition (dict): The filter condition.
         """
-        def _inner_filter(item: list):
-            return self._default_filter(item, filter_condition)
-        self._result = list(filter(_inner_filter, self._data))
+        self._result = self._filter_data(filter_condition)
 
 
 class AicpuDetailAnalyser(BaseAnalyser):
@@ -388,9 +378,7 @@ class AicpuDetailAnalyser(BaseAnalyser):
         Args:
             filter_condition (dict): The filter condition.
         """
-        def _inner_filter(item: list):
-            return self._default_filter(item, filter_condition)
-        self._result = list(filter(_inner_filter, self._data))
+        self._result = self._filter_data(filter_condition)
 
     def _convert_field_type(self, row):
         """
@@ -13,11 +13,89 @@
 # limitations under the License.
 # ============================================================================
 """The analyser factory."""
+import collections
+import os
 import threading
 
 from mindinsight.profiler import analyser as analyser_module
 from mindinsight.profiler.common.exceptions.exceptions import \
     ProfilerAnalyserNotExistException
+from mindinsight.profiler.common.log import logger
+
+
+class _AnalyserCache:
+    """
+    A bounded LRU cache of loaded analysers.
+
+    The cache stores the attributes of analysers after loading. The key contains the
+    modification time and size of all files in the profiling dir, so the analyser is
+    loaded again if any parsed profiling file changes.
+
+    Args:
+        max_size (int): The max number of cached analysers.
+    """
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._states = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_files_signature(profiling_dir):
+        """
+        Get the signature of the files in the profiling dir.
+
+        Args:
+            profiling_dir (str): The directory where the parsed profiling files are located.
+
+        Returns:
+            Union[tuple, None], the names, modification times and sizes of the files, or
+                None if the directory can not be listed.
+        """
+        try:
+            with os.scandir(profiling_dir) as entries:
+                signature = []
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        signature.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            return None
+        return tuple(sorted(signature))
+
+    def get(self, key):
+        """
+        Get the cached analyser state.
+
+        Args:
+            key (tuple): The cache key.
+
+        Returns:
+            Union[dict, None], the attributes of the analyser, or None if it is not cached.
+        """
+        with self._lock:
+            state = self._states.get(key)
+            if state is not None:
+                self._states.move_to_end(key)
+            return state
+
+    def put(self, key, state):
+        """
+        Put the analyser state into the cache, the least recently used one is removed if the cache is full.
+
+        Args:
+            key (tuple): The cache key.
+            state (dict): The attributes of the analyser.
+        """
+        with self._lock:
+            self._states[key] = state
+            self._states.move_to_end(key)
+            while len(self._states) > self._max_size:
+                self._states.popitem(last=False)
+
+    def clear(self):
+        """Clear the cache."""
+        with self._lock:
+            self._states.clear()
 
 
 class AnalyserFactory:
@@ -35,6 +113,9 @@ class AnalyserFactory:
     """
     _lock = threading.Lock()
     _instance = None
+    # The max number of cached analysers.
+    _MAX_CACHED_ANALYSERS = 64
+    _cache = _AnalyserCache(_MAX_CACHED_ANALYSERS)
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -54,6 +135,10 @@ class AnalyserFactory:
         """
         Get the specified analyser according to the analyser type.
 
+        The loaded data of analysers is cached, so the parsed profiling files are not read
+        again until they are changed. A new analyser instance sharing the loaded data is
+        returned every time, so the query state is not shared between requests.
+
         Args:
             analyser_type (str): The analyser type.
             args (list): The parameters required for the specific analyser class.
@@ -61,6 +146,37 @@ class AnalyserFactory:
         Returns:
             BaseAnalyser, the specified analyser instance.
 
+        Raises:
+            ProfilerAnalyserNotExistException: If the analyser type does not exist.
+        """
+        analyser_class = self._get_analyser_class(analyser_type)
+        signature = _AnalyserCache.get_files_signature(args[0]) if args and isinstance(args[0], str) else None
+        if signature is None:
+            return analyser_class(*args)
+
+        key = (analyser_class, args, signature)
+        state = self._cache.get(key)
+        if state is not None:
+            logger.debug('Get analyser %s from cache.', analyser_class.__name__)
+            analyser = analyser_class.__new__(analyser_class)
+            analyser.__dict__.update(state)
+            return analyser
+
+        analyser = analyser_class(*args)
+        self._cache.put(key, dict(analyser.__dict__))
+        return analyser
+
+    @staticmethod
+    def _get_analyser_class(analyser_type):
+        """
+        Get the analyser class according to the analyser type.
+
+        Args:
+            analyser_type (str): The analyser type.
+
+        Returns:
+            type, the analyser class.
+
         Raises:
             ProfilerAnalyserNotExistException: If the analyser type does not exist.
         """
@@ -73,5 +189,5 @@ class AnalyserFactory:
             if sub_module.endswith('analyser') and sub_module != 'base_analyser':
                 analyser_sub_module = getattr(analyser_module, sub_module)
                 if hasattr(analyser_sub_module, analyser_class_name):
-                    return getattr(analyser_sub_module, analyser_class_name)(*args)
+                    return getattr(analyser_sub_module, analyser_class_name)
         raise ProfilerAnalyserNotExistException(analyser_type)
@@ -16,6 +16,7 @@
 import functools
 from abc import ABC, abstractmethod
 
+import numpy as np
 from marshmallow import ValidationError
 
 from mindinsight.profiler.common.exceptions.exceptions import \
@@ -35,6 +36,9 @@ class BaseAnalyser(ABC):
     need to implement `_load`, `_filter`, `_sort` and `_group`. The condition
     defines the rules for filtering, sorting and grouping.
 
+    The rows of loaded data are converted to typed columns on demand, so the
+    default filter, sort and group are computed with vectorized operations.
+
     Args:
         profiling_dir (str): The directory where the parsed profiling files
             are located.
@@ -54,6 +58,10 @@ class BaseAnalyser(ABC):
         self._size = 0
         self._none_filter_condition_key = []
         self._none_sort_col_names = []
+        # The columns are built from the loaded data on demand, key is the column index.
+        self._columns = {}
+        # The indexes in data of the rows in result, it is None if the rows are not taken from data in order.
+        self._result_indexes = None
 
         try:
             self._load()
@@ -90,11 +98,12 @@ class BaseAnalyser(ABC):
         group_condition = condition.get('group_condition')
 
         self._result = []
+        self._result_indexes = None
         self._display_col_names = self._col_names[:]
         self._filter(filter_condition)
         self._size = len(self._result)
         if sort_condition:
-            self._sort(sort_condition)
+            self._sort(sort_condition, self._get_group_end(group_condition))
         if group_condition:
             self._group(group_condition)
         return self._organize_query_result()
@@ -112,12 +121,18 @@ class BaseAnalyser(ABC):
             filter_condition (dict): The filter condition.
         """
 
-    def _sort(self, sort_condition: dict):
+    def _sort(self, sort_condition: dict, top_k=None):
         """
         Sort the profiling data according to the filter condition.
 
+        If the result is taken from data in order and the sort column is numeric
+        or string, the result is sorted by the column with stable argsort. Only the
+        top k rows are sorted and kept if `top_k` is given and the column is numeric.
+
         Args:
             sort_condition (dict): The sort condition.
+            top_k (Optional[int]): The number of rows needed from the beginning of the
+                sorted result. If it is None, all rows are needed. Default: None.
 
         Raises:
             ProfilerColumnNotExistException: If the sort name does not exist.
@@ -152,8 +167,72 @@ class BaseAnalyser(ABC):
             raise ProfilerColumnNotExistException(sort_name)
         if self._none_sort_col_names and sort_name in self._none_sort_col_names:
             raise ProfilerColumnNotSupportSortException(sort_name)
+
+        if self._result_indexes is not None:
+            column = self._get_column(index)
+            if column.dtype != object or self._is_str_column(index):
+                order = self._argsort(column[self._result_indexes], reverse, top_k)
+                self._result = [self._result[position] for position in order.tolist()]
+                self._result_indexes = self._result_indexes[order]
+                return
         self._result.sort(key=functools.cmp_to_key(_cmp), reverse=reverse)
 
+    @staticmethod
+    def _argsort(values, reverse, top_k=None):
+        """
+        Get the stable sorting order of the values.
+
+        Equal values keep their original order in both ascending and descending order,
+        which is the same as `list.sort`.
+
+        Args:
+            values (numpy.ndarray): The numeric or string values.
+            reverse (bool): Whether to sort in descending order.
+            top_k (Optional[int]): If it is given, only the order of the top k values is returned.
+
+        Returns:
+            numpy.ndarray, the positions of the values in sorted order.
+        """
+        if values.dtype == object:
+            if not reverse:
+                return np.argsort(values, kind='stable')
+            # Sort the reversed values, so equal values keep their original order after reversing the order back.
+            reversed_order = np.argsort(values[::-1], kind='stable')
+            return (len(values) - 1 - reversed_order)[::-1]
+
+        keys = -values if reverse else values
+        if top_k is None or top_k >= len(keys) or np.isnan(keys).any():
+            return np.argsort(keys, kind='stable')
+        if top_k <= 0:
+            return np.array([], dtype=np.int64)
+        # All values equal to the k-th value are candidates, so ties are ordered as a full stable sort does.
+        threshold = np.partition(keys, top_k - 1)[top_k - 1]
+        candidates = np.flatnonzero(keys <= threshold)
+        return candidates[np.argsort(keys[candidates], kind='stable')][:top_k]
+
+    @staticmethod
+    def _get_group_end(group_condition):
+        """
+        Get the end position of the rows selected by the group condition.
+
+        Args:
+            group_condition (dict): The group condition.
+
+        Returns:
+            Union[int, None], the end position, or None if all rows are selected.
+        """
+        if not group_condition:
+            return None
+        limit = group_condition.get('limit')
+        offset = group_condition.get('offset')
+        if limit is None and offset is None:
+            return None
+        if limit is None:
+            limit = 10
+        if offset is None:
+            offset = 0
+        return limit * (offset + 1)
+
     def _group(self, group_condition: dict):
         """
         Group the profiling data according to the group condition.
@@ -170,57 +249,143 @@ class BaseAnalyser(ABC):
         if offset is None:
             offset = 0
         self._result = self._result[limit * offset: limit * (offset + 1)]
+        if self._result_indexes is not None:
+            self._result_indexes = self._result_indexes[limit * offset: limit * (offset + 1)]
 
-    def _default_filter(self, item, condition):
+    def _default_filter(self, condition):
         """
         The default filter method.
 
+        Each condition is compiled into a vectorized mask over the column.
+
         Args:
-            item (list[Union[str, float, int]]): A piece of data to be filtered.
             condition (dict): The filter condition.
 
         Returns:
-            bool, `True` if the item is satisfied.
+            numpy.ndarray, the indexes of the satisfied rows in data.
         """
+        mask = np.ones(len(self._data), dtype=bool)
         for condition_key, condition_value in condition.items():
             if condition_key in self._none_filter_condition_key:
                 continue
             if condition_key in self._col_names:
                 index = self._col_names.index(condition_key)
-                actual_value = item[index]
                 for exp_key, exp_value in condition_value.items():
-                    if not self._is_match_condition(
-                            exp_key, exp_value, actual_value):
-                        return False
-        return True
+                    mask &= self._get_condition_mask(index, exp_key, exp_value)
+        return np.flatnonzero(mask)
+
+    def _filter_data(self, condition):
+        """
+        Filter the data with the default filter method.
+
+        Args:
+            condition (dict): The filter condition.
+
+        Returns:
+            list[list], the satisfied rows in data.
+        """
+        self._result_indexes = self._default_filter(condition)
+        return [self._data[index] for index in self._result_indexes.tolist()]
 
-    def _is_match_condition(self, exp_key, exp_value, actual_value):
+    def _get_condition_mask(self, index, exp_key, exp_value):
         """
-        Check whether the actual value meets the expect condition.
+        Get the mask of the rows whose values of the column meet the expect condition.
 
         Args:
-            exp_key (str): Expect key of the condition.
-            exp_value (str): Expect value.
-            actual_value (str): Actual value.
+            index (int): The column index.
+            exp_key (str): Expect key of the condition, it should be `in`, `not_in`,
+                `partial_match_str_in` or `range`.
+            exp_value (list): Expect value. The value of `range` is the inclusive lower
+                and upper bounds.
 
         Returns:
-            bool, `True` if the actual meets the expect condition, else `False`.
+            numpy.ndarray, the mask of the rows.
         """
+        column = self._get_column(index)
         if exp_key == 'in':
-            if actual_value not in exp_value:
-                return False
-        elif exp_key == 'not_in':
-            if actual_value in exp_value:
-                return False
-        elif exp_key == 'partial_match_str_in':
-            for partial_match_str in exp_value:
-                if partial_match_str.lower() in actual_value.lower():
-                    return True
-            return False
-        else:
+            return self._isin(column, exp_value)
+        if exp_key == 'not_in':
+            return ~self._isin(column, exp_value)
+        if exp_key == 'partial_match_str_in':
+            return self._partial_match(index, exp_value)
+        if exp_key == 'range':
+            low, high = exp_value
+            if column.dtype != object:
+                return (column >= low) & (column <= high)
+            return np.fromiter((self._in_range(value, low, high) for value in column), dtype=bool, count=len(column))
+        return np.zeros(len(column), dtype=bool)
+
+    @staticmethod
+    def _in_range(value, low, high):
+        """Check whether the value is in the inclusive range, the values not comparable with numbers do not match."""
+        try:
+            return low <= value <= high
+        except TypeError:
             return False
 
-        return True
+    @staticmethod
+    def _isin(column, exp_value):
+        """Get the mask of the values which are in the expect values."""
+        if column.dtype != object and all(isinstance(value, (int, float)) for value in exp_value):
+            return np.isin(column, exp_value)
+        try:
+            exp_value = set(exp_value)
+        except TypeError:
+            pass
+        return np.fromiter((value in exp_value for value in column), dtype=bool, count=len(column))
+
+    def _partial_match(self, index, exp_value):
+        """Get the mask of the string values which contain any of the expect strings case-insensitively."""
+        if not self._is_str_column(index):
+            column = self._get_column(index)
+            return np.fromiter(
+                (any(match_str.lower() in value.lower() for match_str in exp_value) for value in column),
+                dtype=bool, count=len(column))
+
+        lower_column = self._columns.get(('lower', index))
+        if lower_column is None:
+            lower_column = np.char.lower(self._get_column(index).astype(str))
+            self._columns[('lower', index)] = lower_column
+        mask = np.zeros(len(lower_column), dtype=bool)
+        for match_str in exp_value:
+            mask |= np.char.find(lower_column, match_str.lower()) >= 0
+        return mask
+
+    def _get_column(self, index):
+        """
+        Get the column of the loaded data.
+
+        The column is an integer or float array if all values are numbers, else it is an object array.
+
+        Args:
+            index (int): The column index.
+
+        Returns:
+            numpy.ndarray, the column.
+        """
+        column = self._columns.get(index)
+        if column is not None:
+            return column
+
+        values = [row[index] for row in self._data]
+        if values and all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+            column = np.array(values, dtype=np.int64)
+        elif values and all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+            column = np.array(values, dtype=np.float64)
+        else:
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+        self._columns[index] = column
+        return column
+
+    def _is_str_column(self, index):
+        """Check whether all values of the column are strings."""
+        is_str = self._columns.get(('is_str', index))
+        if is_str is None:
+            column = self._get_column(index)
+            is_str = column.dtype == object and all(isinstance(value, str) for value in column)
+            self._columns[('is_str', index)] = is_str
+        return is_str
 
     def _normalize_profiling_dir(self, profiling_dir):
         """
@@ -0,0 +1,250 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""The analyser for analysing the step trace of all devices in a profiler dir."""
+import csv
+import os
+import re
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from mindinsight.conf import settings
+from mindinsight.profiler.analyser.base_analyser import BaseAnalyser
+from mindinsight.profiler.common.log import logger
+from mindinsight.profiler.common.util import analyse_device_list_from_profiler_dir, \
+    query_latest_trace_time_file, to_millisecond
+from mindinsight.utils.computing_resource_mgr import ComputingResourceManager
+
+_STEP_TRACE_FILE_PATTERN = re.compile(r'^step_trace_raw_(\d+)_detail_time\.csv$')
+_STEP_FIELDS = ['total', 'iteration_interval', 'fp_and_bp', 'tail']
+
+
+def analyse_device_step_trace(profiling_dir, device_id):
+    """
+    Analyse the step trace of a device.
+
+    The function runs in a worker process, so it only reads the parsed step trace file and returns
+    plain data.
+
+    Args:
+        profiling_dir (str): The directory where the parsed profiling files are located.
+        device_id (str): The device ID.
+
+    Returns:
+        Union[dict, None], the time of each step and the start offset and duration of each all reduce
+            in each step in system count, or None if there is no step trace file of the device.
+    """
+    file_path = query_latest_trace_time_file(profiling_dir, device_id)
+    if not file_path:
+        return None
+    with open(file_path, 'r') as handle:
+        csv_reader = csv.reader(handle)
+        header = next(csv_reader)
+        # The last row is the average of all steps.
+        rows = list(csv_reader)[:-1]
+
+    values = np.array([[int(value) if value else 0 for value in row[1:]] for row in rows],
+                      dtype=np.int64).reshape(len(rows), len(header) - 1)
+    columns = {name: values[:, index] for index, name in enumerate(header[1:])}
+    start_points = columns.get('start_point', np.zeros(len(rows), dtype=np.int64))
+
+    reduces = {}
+    for name in header:
+        if name.startswith('stream_') and not name.endswith('point'):
+            reduces[name] = {
+                'offset': (columns.get(name + '_start_point', start_points) - start_points).tolist(),
+                'duration': columns[name].tolist()
+            }
+    return {
+        'device_id': device_id,
+        'steps': {name: columns[name].tolist() for name in _STEP_FIELDS if name in columns},
+        'reduces': reduces
+    }
+
+
+class ClusterAnalyser(BaseAnalyser):
+    """
+    The analyser for analysing the step trace of all devices in a profiler dir.
+
+    The step trace of devices is analysed in parallel by processes if there are many devices. Each row of the data is the
+    average step time of a device, and the cross-device results contain the slowest device of
+    each step and the skew of each all reduce among devices.
+
+    Args:
+        profiling_dir (str): The directory where the parsed profiling files are located.
+        device_id (Optional[str]): Not used, all devices in the profiling dir are analysed. Default: None.
+    """
+    _col_names = ['device_id', 'step_count', 'total', 'iteration_interval', 'fp_and_bp', 'tail',
+                  'slowest_step_count']
+
+    def __init__(self, profiling_dir, device_id=None):
+        super().__init__(profiling_dir, device_id)
+
+    @property
+    def step_skew(self):
+        """The slowest and fastest device of each step."""
+        return self._step_skew
+
+    @property
+    def all_reduce_skew(self):
+        """The skew of each all reduce among devices."""
+        return self._all_reduce_skew
+
+    def _load(self):
+        """Load the step trace of all devices in parallel."""
+        self._step_skew = []
+        self._all_reduce_skew = []
+        device_results = self._analyse_devices(self._get_device_ids())
+        if not device_results:
+            return
+
+        step_count = min(len(result['steps']['total']) for result in device_results)
+        device_ids = [result['device_id'] for result in device_results]
+        # Rows are devices and columns are steps.
+        totals = np.array([result['steps']['total'][:step_count] for result in device_results], dtype=np.int64)
+        slowest = np.argmax(totals, axis=0) if step_count else np.array([], dtype=np.int64)
+        fastest = np.argmin(totals, axis=0) if step_count else np.array([], dtype=np.int64)
+        for step in range(step_count):
+            slowest_index = int(slowest[step])
+            fastest_index = int(fastest[step])
+            self._step_skew.append({
+                'step_num': step + 1,
+                'slowest_device_id': device_ids[slowest_index],
+                'slowest_time': to_millisecond(int(totals[slowest_index, step])),
+                'fastest_device_id': device_ids[fastest_index],
+                'fastest_time': to_millisecond(int(totals[fastest_index, step]))
+            })
+
+        slowest_counts = np.bincount(slowest, minlength=len(device_ids))
+        for index, result in enumerate(device_results):
+            row = [result['device_id'], step_count]
+            for name in _STEP_FIELDS:
+                times = np.array(result['steps'].get(name, [])[:step_count], dtype=np.float64)
+                row.append(to_millisecond(float(np.mean(times))) if times.size else 0)
+            row.append(int(slowest_counts[index]))
+            self._data.append(row)
+        self._size = len(self._data)
+
+        self._all_reduce_skew = self._get_all_reduce_skew(device_results, step_count)
+
+    def _filter(self, filter_condition):
+        """
+        Filter the profiling data according to the filter condition.
+
+        Args:
+            filter_condition (dict): The filter condition.
+        """
+        self._result = self._filter_data(filter_condition)
+
+    def _get_device_ids(self):
+        """Get the IDs of devices which have profiling files."""
+        device_ids, _ = analyse_device_list_from_profiler_dir(self._profiling_dir)
+        device_ids = set(device_ids)
+        for filename in os.listdir(self._profiling_dir):
+            match = _STEP_TRACE_FILE_PATTERN.match(filename)
+            if match:
+                device_ids.add(match.group(1))
+        return sorted(device_ids, key=int)
+
+    def _analyse_devices(self, device_ids):
+        """
+        Analyse the step trace of devices, in parallel if there are many devices.
+
+        Args:
+            device_ids (list[str]): The device IDs.
+
+        Returns:
+            list[dict], the results of the devices which have step trace, in the order of device IDs.
+        """
+        device_futures = {}
+        if len(device_ids) >= max(settings.MIN_DEVICE_COUNT_ANALYSED_IN_PROCESSES, 2):
+            self._submit_devices(device_ids, device_futures)
+
+        results = []
+        for device_id in device_ids:
+            try:
+                future = device_futures.get(device_id)
+                result = future.result() if future is not None \
+                    else analyse_device_step_trace(self._profiling_dir, device_id)
+            except BrokenProcessPool:
+                result = analyse_device_step_trace(self._profiling_dir, device_id)
+            except (OSError, ValueError, KeyError, IndexError) as err:
+                logger.warning('Failed to analyse step trace of device %s, detail: %r.', device_id, str(err))
+                continue
+            if result is not None:
+                results.append(result)
+        return results
+
+    def _submit_devices(self, device_ids, device_futures):
+        """
+        Submit the analysis of devices to a process pool and wait for them.
+
+        Args:
+            device_ids (list[str]): The device IDs.
+            device_futures (dict): The futures of the analysis, key is the device ID. The devices are
+                analysed sequentially later if the process pool is broken.
+        """
+        max_processes_cnt = min(len(device_ids), settings.MAX_PROCESSES_COUNT)
+        try:
+            with ComputingResourceManager(executors_cnt=1, max_processes_cnt=max_processes_cnt) as mgr:
+                with mgr.get_executor() as executor:
+                    for device_id in device_ids:
+                        future = executor.submit(analyse_device_step_trace, self._profiling_dir, device_id)
+                        future.add_done_callback(
+                            lambda done_future, device_id=device_id: device_futures.update({device_id: done_future}))
+                    executor.wait_all_tasks_finish()
+        except BrokenProcessPool as err:
+            logger.warning('Process pool is broken, analyse devices sequentially, detail: %r.', str(err))
+            device_futures.clear()
+
+    @staticmethod
+    def _get_all_reduce_skew(device_results, step_count):
+        """
+        Get the skew of each all reduce among devices.
+
+        Args:
+            device_results (list[dict]): The step trace results of devices.
+            step_count (int): The number of steps of all devices.
+
+        Returns:
+            list[dict], the average and max skew of the start offset in step and the duration of
+                each all reduce which all devices have.
+        """
+        if not step_count:
+            return []
+        reduce_names = set(device_results[0]['reduces'])
+        for result in device_results[1:]:
+            reduce_names &= set(result['reduces'])
+
+        all_reduce_skew = []
+        for name in sorted(reduce_names):
+            offsets = np.array([result['reduces'][name]['offset'][:step_count] for result in device_results],
+                               dtype=np.int64)
+            durations = np.array([result['reduces'][name]['duration'][:step_count] for result in device_results],
+                                 dtype=np.int64)
+            offset_skew = np.ptp(offsets, axis=0)
+            duration_skew = np.ptp(durations, axis=0)
+            longest = np.argmax(durations, axis=0)
+            longest_counts = np.bincount(longest, minlength=len(device_results))
+            all_reduce_skew.append({
+                'name': name,
+                'avg_offset_skew': to_millisecond(float(np.mean(offset_skew))),
+                'max_offset_skew': to_millisecond(int(np.max(offset_skew))),
+                'avg_duration_skew': to_millisecond(float(np.mean(duration_skew))),
+                'max_duration_skew': to_millisecond(int(np.max(duration_skew))),
+                'max_duration_skew_step': int(np.argmax(duration_skew)) + 1,
+                'most_longest_device_id': device_results[int(np.argmax(longest_counts))]['device_id']
+            })
+        return all_reduce_skew
@@ -60,10 +60,7 @@ class GpuAnalyser(BaseAnalyser):
         Args:
             filter_condition (dict): The filter condition.
         """
-        def _inner_filter(item: list):
-            return self._default_filter(item, filter_condition)
-
-        self._result = list(filter(_inner_filter, self._data))
+        self._result = self._filter_data(filter_condition)
 
 
 class GpuOpTypeAnalyser(GpuAnalyser):
@@ -15,13 +15,18 @@
 """The integrator for integrating parsed profiling files."""
 import csv
 import os
-from decimal import Decimal
+
+import numpy as np
 
 
 class Integrator:
     """
     The integrator for integrating parsed profiling files.
 
+    Each parsed profiling file is read once in chunks. The execution time of operators is kept in
+    a float64 array and operator types are encoded as categorical codes, so the time of each
+    operator type is aggregated with one vectorized operation.
+
     Args:
         profiling_dir (str): The directory where the parsed profiling files are
             located.
@@ -35,12 +40,15 @@ class Integrator:
     _header_aicore_detail = ['full_op_name', 'execution_time']
     _header_aicpu = ['serial_number', 'op_type', 'total_time', 'dispatch_time',
                      'run_start', 'run_end']
+    # The size hint of lines read from the AICORE operator time file at a time.
+    _read_chunk_size = 4 * 1024 * 1024
 
     def __init__(self, profiling_dir, device_id):
         self._profiling_dir = profiling_dir
         self._device_id = device_id
-        self._op_time_cache = {}
-        self._total_time = Decimal('0.0')
+        self._op_time_names = []
+        self._op_time_values = []
+        self._total_time = 0.0
 
     def integrate(self):
         """Integrate the parsed profiling files."""
@@ -57,22 +65,22 @@ class Integrator:
         if not os.path.isfile(framework_file):
             return
 
-        op_name_type_cache = {}
         with open(framework_file, 'r') as src_file:
             csv_reader = csv.reader(src_file)
             _ = next(csv_reader)
-
-            for row in csv_reader:
-                op_name_type_cache[row[3]] = row[5]
-
-        op_type_time_cache = {}
-        for full_op_name, op_time in self._op_time_cache.items():
-            op_type = op_name_type_cache.get(full_op_name)
-            if op_type_time_cache.get(op_type) is None:
-                op_type_time_cache[op_type] = [op_time, 1]
-            else:
-                op_type_time_cache[op_type][0] += op_time
-                op_type_time_cache[op_type][1] += 1
+            op_name_type_cache = {row[3]: row[5] for row in csv_reader}
+
+        # The time of an op executed again overrides the previous one, and the ops are kept in
+        # order of their first execution.
+        op_indexes = dict(zip(self._op_time_names, range(len(self._op_time_names))))
+        op_times = np.array(self._op_time_values, dtype=np.float64)[np.fromiter(
+            op_indexes.values(), dtype=np.int64, count=len(op_indexes))] if op_indexes else np.zeros(0)
+        op_types = list(map(op_name_type_cache.get, op_indexes))
+        # The op types are coded in order of their first executed op.
+        type_codes = {op_type: code for code, op_type in enumerate(dict.fromkeys(op_types))}
+        op_type_codes = np.fromiter(map(type_codes.__getitem__, op_types), dtype=np.int64, count=len(op_types))
+        type_times = np.bincount(op_type_codes, weights=op_times, minlength=len(type_codes))
+        type_counts = np.bincount(op_type_codes, minlength=len(type_codes))
 
         op_type_file_name = 'aicore_intermediate_' + self._device_id + '_type.csv'
         op_type_file_path = os.path.join(self._profiling_dir, op_type_file_name)
@@ -80,12 +88,10 @@ class Integrator:
             csv_writer = csv.writer(type_file)
             csv_writer.writerow(self._header_aicore_type)
 
-            for op_type, op_type_time_info in op_type_time_cache.items():
-                type_info = [
-                    op_type, op_type_time_info[0], op_type_time_info[1],
-                    round((op_type_time_info[0] / self._total_time) * 100, 2)
-                ]
-                csv_writer.writerow(type_info)
+            for op_type, code in type_codes.items():
+                type_time = float(type_times[code])
+                percent = type_time / self._total_time * 100 if self._total_time else 0
+                csv_writer.writerow([op_type, type_time, int(type_counts[code]), '{:.2f}'.format(percent)])
 
     def _parse_aicore_detail_time(self):
         """Parse the parsed AICORE operator time file."""
@@ -115,16 +121,55 @@ class Integrator:
                 csv_writer.writerow(self._header_aicore_detail)
 
                 while True:
-                    row = src_file.readline()
-                    if not row:
+                    lines = src_file.readlines(self._read_chunk_size)
+                    if not lines:
                         break
-
-                    op_infos = row.split()
-                    if op_infos[0] == 'total':
-                        self._total_time = Decimal(op_infos[2])
-                        continue
-                    self._op_time_cache[op_infos[0]] = Decimal(op_infos[1])
-                    csv_writer.writerow([op_infos[0], op_infos[1]])
+                    op_names, op_times = self._split_op_times(lines)
+                    self._write_detail_rows(detail_file, csv_writer, op_names, op_times)
+                    self._op_time_names.extend(op_names)
+                    self._op_time_values.append(np.array(op_times, dtype=np.float64))
+        self._op_time_values = np.concatenate(self._op_time_values) if self._op_time_values else []
+
+    @staticmethod
+    def _write_detail_rows(detail_file, csv_writer, op_names, op_times):
+        """
+        Write the rows of the AICORE operator detail file.
+
+        The rows are joined into one string unless a field needs to be quoted in csv.
+
+        Args:
+            detail_file (IO[str]): The detail file.
+            csv_writer (csv.writer): The csv writer of the detail file.
+            op_names (list[str]): The full op names.
+            op_times (list[str]): The execution time of operators.
+        """
+        # The execution time is a number, only op names may need to be quoted.
+        if any(',' in op_name or '"' in op_name for op_name in op_names):
+            csv_writer.writerows(zip(op_names, op_times))
+            return
+        detail_file.write(''.join(map('{},{}\r\n'.format, op_names, op_times)))
+
+    def _split_op_times(self, lines):
+        """
+        Split the lines of the AICORE operator time file.
+
+        Args:
+            lines (list[str]): The lines of the file.
+
+        Returns:
+            tuple[list[str], list[str]], the full op names and execution time of operators.
+        """
+        op_infos = [line.split() for line in lines]
+        op_names = [infos[0] for infos in op_infos if infos]
+        if 'total' not in op_names:
+            return op_names, [infos[1] for infos in op_infos if infos]
+
+        op_infos = [infos for infos in op_infos if infos]
+        for infos in op_infos:
+            if infos[0] == 'total':
+                self._total_time = float(infos[2])
+        op_infos = [infos for infos in op_infos if infos[0] != 'total']
+        return [infos[0] for infos in op_infos], [infos[1] for infos in op_infos]
 
     def _parse_aicpu_time(self):
         """Parse the parsed AICPU operator time file."""
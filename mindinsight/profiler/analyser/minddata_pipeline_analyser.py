@@ -133,9 +133,6 @@ class MinddataPipelineAnalyser(BaseAnalyser):
         Args:
             filter_condition (dict): The filter condition.
         """
-        def _inner_filter(item: list):
-            return self._default_filter(item, filter_condition)
-
         def _inner_map(item: list):
             inner_item = item[0:2]
             inner_item.extend(item[4:])
@@ -147,8 +144,9 @@ class MinddataPipelineAnalyser(BaseAnalyser):
         )
         self._set_display_col_name(is_display_op_detail)
 
-        filter_result = list(filter(_inner_filter, self._data))
+        filter_result = self._filter_data(filter_condition)
         if threshold:
+            self._result_indexes = None
             low_threshold = threshold[1]
             high_threshold = threshold[0]
             filter_result = self._filter_outside_threshold(
@@ -17,17 +17,27 @@ import csv
 import json
 import os
 
-from mindinsight.datavisual.utils.tools import to_int
+import numpy as np
+
 from mindinsight.profiler.analyser.base_analyser import BaseAnalyser
 from mindinsight.profiler.common.exceptions.exceptions import ProfilerParamValueErrorException, \
     ProfilerFileNotFoundException, StepNumNotSupportedException, ProfilerRawFileException
 from mindinsight.profiler.common.log import logger as log
-from mindinsight.profiler.common.util import query_latest_trace_time_file, get_field_value, \
-    get_summary_for_step_trace, to_millisecond
+from mindinsight.profiler.common.util import query_latest_trace_time_file, \
+    get_summary_for_step_trace, to_millisecond, PER_MS_SYSCNT
+
+_PERCENTILES = [50, 90, 99]
 
 
 class StepTraceAnalyser(BaseAnalyser):
-    """The analyser for analyzing training steps."""
+    """
+    The analyser for analyzing training steps.
+
+    The step trace is loaded once into a NumPy structured array, the last row of which is the
+    average of all steps. The summary, the reduce fields of each stream and the statistics of each
+    field are computed when loading, and the graph of each step and the values of each field are
+    cached after the first query, so repeated queries are lookups.
+    """
 
     _col_names = []
     _attr_ui_name = 'name'
@@ -38,11 +48,15 @@ class StepTraceAnalyser(BaseAnalyser):
     @property
     def summary(self):
         """The property of summary info."""
-
-        summary = get_summary_for_step_trace(self._data[-1], self.__column__)
+        summary = dict(self._summary)
         summary['total_steps'] = self._size
         return summary
 
+    @property
+    def statistics(self):
+        """The property of the statistics of each field over all steps in millisecond."""
+        return self._statistics
+
     @property
     def point_info(self):
         """The property of point info."""
@@ -79,8 +93,8 @@ class StepTraceAnalyser(BaseAnalyser):
             {stream_id: List[Tuple(start_point, end_point, duration, field_name)]}.
         """
         reduce_infos = []
-        for row_info in self._data[:-1]:
-            row_info_dict = self._get_info_dict_from_row_data(row_info, 'systime')
+        for row_index in range(self._size):
+            row_info_dict = self._get_info_dict_from_row_data(self._data[row_index], 'systime')
             reduce_info = self._sort_reduce_by_time(row_info_dict)
             if reduce_info:
                 reduce_infos.extend(reduce_info)
@@ -96,11 +110,76 @@ class StepTraceAnalyser(BaseAnalyser):
         with open(file_path, 'r') as handle:
             csv_reader = csv.reader(handle)
             self.__column__ = next(csv_reader)
-            self._data = list(csv_reader)
+            rows = list(csv_reader)
+        self._data = self._to_structured_array(rows, self.__column__)
         self._size = len(self._data) - 1
         self._display_col_names = self._col_names[:]
         self._load_point_info()
 
+        # The fields of reduce events, each item is the stream id and the field name.
+        self._reduce_fields = [(field_name.split('_', 2)[1], field_name) for field_name in self.__column__
+                               if field_name.startswith('stream_') and not field_name.endswith('point')]
+        self._summary = get_summary_for_step_trace(self._data[-1].tolist() if len(self._data) else None,
+                                                   self._data.dtype.names)
+        self._statistics = self._get_statistics()
+        # The caches of query results, they are shared by the analysers from the analyser factory.
+        self._step_graphs = {}
+        self._proc_values = {}
+
+    @staticmethod
+    def _to_structured_array(rows, header):
+        """
+        Convert the rows of step trace into a structured array.
+
+        Args:
+            rows (list[list[str]]): The rows of step trace, the step number is ignored.
+            header (list[str]): The field names of the rows.
+
+        Returns:
+            numpy.ndarray, the structured array whose fields are in header except the step number.
+        """
+        field_names = [name for name in header if name != 'step_num']
+        dtype = np.dtype([(name, np.int64) for name in field_names])
+        records = []
+        for row in rows:
+            record = []
+            for name, value in zip(header, row):
+                if name == 'step_num':
+                    continue
+                try:
+                    record.append(int(value) if value else 0)
+                except ValueError:
+                    log.error("Invalid value %r of %s in step trace.", value, name)
+                    raise ProfilerRawFileException('Invalid value in step trace file.')
+            record.extend([0] * (len(field_names) - len(record)))
+            records.append(tuple(record))
+        return np.array(records, dtype=dtype)
+
+    def _get_statistics(self):
+        """
+        Get the statistics of each field over all steps except the average row.
+
+        Returns:
+            dict, the min, max, average and percentiles of each field in millisecond.
+        """
+        statistics = {}
+        if self._size <= 0:
+            return statistics
+        steps = self._data[:-1]
+        for name in self._data.dtype.names:
+            if name.endswith('point'):
+                continue
+            values = steps[name] / PER_MS_SYSCNT
+            field_statistics = {
+                'min': round(float(np.min(values)), 4),
+                'max': round(float(np.max(values)), 4),
+                'avg': round(float(np.mean(values)), 4)
+            }
+            for percentile, value in zip(_PERCENTILES, np.percentile(values, _PERCENTILES)):
+                field_statistics['p{}'.format(percentile)] = round(float(value), 4)
+            statistics[name] = field_statistics
+        return statistics
+
     def _load_point_info(self):
         """Load point info."""
         file_path = os.path.join(self._profiling_dir, 'step_trace_point_info.json')
@@ -166,17 +245,20 @@ class StepTraceAnalyser(BaseAnalyser):
         """
         if step_id is None:
             step_id = 0
-        row_info = self._data[step_id - 1]
-        row_info_dict = self._get_info_dict_from_row_data(row_info, time_type)
-        # first line only contains total time
-        first_line = [self._construct_time_point('', 0, row_info_dict.get('total', 0))]
-        # second line contains iteration_interval, fp_and_bp and tail
-        second_line = self._get_main_proc_points(row_info_dict)
-        # construct reduces lines
-        reduce_lines = self._construct_reduce_lines(row_info_dict)
-
-        graph = [first_line, second_line]
-        graph.extend(reduce_lines)
+        graph = self._step_graphs.get((step_id, time_type))
+        if graph is None:
+            row_info = self._data[step_id - 1]
+            row_info_dict = self._get_info_dict_from_row_data(row_info, time_type)
+            # first line only contains total time
+            first_line = [self._construct_time_point('', 0, row_info_dict.get('total', 0))]
+            # second line contains iteration_interval, fp_and_bp and tail
+            second_line = self._get_main_proc_points(row_info_dict)
+            # construct reduces lines
+            reduce_lines = self._construct_reduce_lines(row_info_dict)
+
+            graph = [first_line, second_line]
+            graph.extend(reduce_lines)
+            self._step_graphs[(step_id, time_type)] = graph
         self._result['training_trace_graph'] = graph
 
     def _get_info_dict_from_row_data(self, row_info, time_type):
@@ -184,19 +266,16 @@ class StepTraceAnalyser(BaseAnalyser):
         Get step info in dict format.
 
         Args:
-            row_info (list[str]): Step info, the value is corresponding to `__column__`.
+            row_info (numpy.void): Step info, a record of the structured array.
             time_type (str): The value type. `systime` keeps the original value.
                 `realtime` transforms the value in millisecond. Default: `realtime`.
 
         Returns:
             dict, step trace information. The key is in `__column__`.
         """
-        row_info_dict = {}
-        for key, value in zip(self.__column__, row_info):
-            if key == 'step_num':
-                continue
-            value = to_int(value, key)
-            row_info_dict[key] = to_millisecond(value) if time_type == 'realtime' else value
+        row_info_dict = dict(zip(self._data.dtype.names, row_info.tolist()))
+        if time_type == 'realtime':
+            row_info_dict = {key: to_millisecond(value) for key, value in row_info_dict.items()}
         return row_info_dict
 
     def _get_main_proc_points(self, row_info_dict):
@@ -233,16 +312,13 @@ class StepTraceAnalyser(BaseAnalyser):
             {stream_id: List[Tuple(start_point, end_point, duration, field_name)]}
         """
         reduce_info = {}
-        reduce_fields = [field_name for field_name in self.__column__
-                         if field_name.startswith('stream_') and not field_name.endswith('point')]
-        for reduce_field in reduce_fields:
+        for cur_stream_id, reduce_field in self._reduce_fields:
             reduce_start = row_info_dict.get(reduce_field + '_start_point', 0)
             reduce_end = row_info_dict.get(reduce_field + '_end_point', 0)
             reduce_duration = row_info_dict.get(reduce_field, 0)
             if not (reduce_start and reduce_end and reduce_duration):
                 log.info("Reduce event missing value.")
                 continue
-            cur_stream_id = reduce_field.split('_', 2)[1]
             cur_stream = reduce_info.get(cur_stream_id)
             if not cur_stream:
                 cur_stream = []
@@ -270,9 +346,7 @@ class StepTraceAnalyser(BaseAnalyser):
         factor = 1e5  # convert time unit from 10ns to 1ms
         reduce_pid = 10000
         reduce_info = []
-        reduce_fields = [field_name for field_name in self.__column__
-                         if field_name.startswith('stream_') and not field_name.endswith('point')]
-        for reduce_field in reduce_fields:
+        for cur_stream_id, reduce_field in self._reduce_fields:
             reduce_start = row_info_dict.get(reduce_field + '_start_point')
             reduce_start = reduce_start / factor \
                 if reduce_start else 0
@@ -281,7 +355,6 @@ class StepTraceAnalyser(BaseAnalyser):
             if not (reduce_start and reduce_duration):
                 log.info("Reduce event missing value.")
                 continue
-            cur_stream_id = reduce_field.split('_', 2)[1]
             reduce_meta = [reduce_field, int(cur_stream_id), reduce_start,
                            reduce_duration, reduce_pid]
             reduce_info.append(reduce_meta)
@@ -354,13 +427,17 @@ class StepTraceAnalyser(BaseAnalyser):
         if proc_name is None:
             log.error('`proc_name` is required for query.')
             raise ProfilerParamValueErrorException('`proc_name` is required for query.')
+        proc_values = self._proc_values.get((proc_name, time_type))
+        if proc_values is None:
+            proc_values = self._data[proc_name].tolist()
+            if time_type == 'realtime':
+                proc_values = [to_millisecond(value) for value in proc_values]
+            self._proc_values[(proc_name, time_type)] = proc_values
+
         if step_id is None:
-            rows_info = self._data[:-1]
+            proc_info = proc_values[:-1]
         else:
-            rows_info = [self._data[step_id - 1]]
-
-        proc_info = [get_field_value(row_info, proc_name, self.__column__, time_type)
-                     for row_info in rows_info]
+            proc_info = [proc_values[step_id - 1]]
         self._result['info'] = {proc_name: proc_info}
 
     def _validate_filter_condition(self, filter_condition):
@@ -372,7 +449,7 @@ class StepTraceAnalyser(BaseAnalyser):
         self._validate_step_id(step_id)
 
         proc_name = filter_condition.get('proc_name')
-        self._validate_str_param(proc_name, self.__column__, 'proc_name')
+        self._validate_str_param(proc_name, self._data.dtype.names, 'proc_name')
 
         time_type = filter_condition.get('time_type', 'realtime')
         self._validate_str_param(time_type, ['realtime', 'systime'], 'time_type')
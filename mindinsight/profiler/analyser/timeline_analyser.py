@@ -13,10 +13,12 @@
 # limitations under the License.
 # ============================================================================
 """The Timeline Analyser."""
+import gzip
 import json
 import os
 
 from mindinsight.profiler.analyser.base_analyser import BaseAnalyser
+from mindinsight.profiler.analyser.timeline_store import TimelineStore
 from mindinsight.profiler.common.exceptions.exceptions import ProfilerFileNotFoundException, \
     ProfilerIOException
 from mindinsight.profiler.common.log import logger
@@ -24,6 +26,49 @@ from mindinsight.profiler.common.validator.validate_path import validate_and_nor
 from mindinsight.utils.exceptions import ParamValueError
 
 SIZE_LIMIT = 20 * 1024 * 1024  # 20MB
+WRITE_CHUNK_SIZE = 1000  # events
+COMPRESSED_SUFFIX = '.gz'
+
+
+def write_timeline_events(file_obj, events, size_limit=None):
+    """
+    Write the timeline events as a json array.
+
+    The events are serialized in chunks to reduce the calls of `json.dumps`, and the size of written content
+    is counted in memory instead of checking the file size. The chunk which makes the size exceed the limit
+    is serialized event by event to find the last event to write.
+
+    Args:
+        file_obj (IO[str]): The file object to write.
+        events (list[dict]): The timeline events.
+        size_limit (Optional[int]): The size limit of the content. The event which makes the size
+            exceed the limit is the last event written. If it is None, all events are written. Default: None.
+
+    Returns:
+        int, the number of written events.
+    """
+    file_obj.write('[')
+    size = 1
+    count = 0
+    for begin in range(0, len(events), WRITE_CHUNK_SIZE):
+        chunk = events[begin:begin + WRITE_CHUNK_SIZE]
+        # Strip the brackets of the serialized chunk, the chunks are joined as the events in a chunk.
+        content = json.dumps(chunk)[1:-1] if not count else ', ' + json.dumps(chunk)[1:-1]
+        if size_limit is None or size + len(content) <= size_limit:
+            file_obj.write(content)
+            size += len(content)
+            count += len(chunk)
+            continue
+        for event in chunk:
+            content = json.dumps(event) if not count else ', ' + json.dumps(event)
+            file_obj.write(content)
+            size += len(content)
+            count += 1
+            if size > size_limit:
+                break
+        break
+    file_obj.write(']')
+    return count
 
 
 class TimelineContainer:
@@ -89,6 +134,8 @@ class TimelineAnalyser(BaseAnalyser):
 
     def _load(self):
         """Load data according to the parsed profiling files."""
+        # The timeline stores are loaded on demand, key is the device type.
+        self._timeline_stores = {}
 
     def _filter(self, filter_condition):
         """
@@ -98,12 +145,15 @@ class TimelineAnalyser(BaseAnalyser):
             filter_condition (dict): The filter condition.
         """
 
-    def get_display_timeline(self, device_type):
+    def _get_display_file_path(self, device_type):
         """
-        Get timeline data for UI display.
+        Get the path of the timeline display file.
+
+        Args:
+            device_type (str): The device type, it should be ascend or gpu.
 
         Returns:
-            json, the content of timeline data.
+            str, the path of the timeline display file.
         """
         if device_type == "ascend":
             display_filename = self._ascend_display_filename.format(self._device_id)
@@ -113,10 +163,19 @@ class TimelineAnalyser(BaseAnalyser):
             logger.info('device type should be ascend or gpu. Please check the device type.')
             raise ParamValueError("Invalid device_type.")
         file_path = os.path.join(self._profiling_dir, display_filename)
-        file_path = validate_and_normalize_path(
+        return validate_and_normalize_path(
             file_path, raise_key='Invalid timeline json path.'
         )
 
+    def get_display_timeline(self, device_type):
+        """
+        Get timeline data for UI display.
+
+        Returns:
+            json, the content of timeline data.
+        """
+        file_path = self._get_display_file_path(device_type)
+
         timeline = []
         if os.path.exists(file_path):
             try:
@@ -130,6 +189,37 @@ class TimelineAnalyser(BaseAnalyser):
 
         return timeline
 
+    def get_display_timeline_window(self, device_type, start_time=None, end_time=None, resolution=None):
+        """
+        Get timeline data in the time window for UI display.
+
+        The timeline store of the display file is loaded once and shared by the later queries.
+
+        Args:
+            device_type (str): The device type, it should be ascend or gpu.
+            start_time (Optional[float]): The start time of the window. Default: None.
+            end_time (Optional[float]): The end time of the window. Default: None.
+            resolution (Optional[int]): The number of pixels of the window, the ops shorter than a pixel
+                are aggregated. Default: None.
+
+        Returns:
+            dict, the events in the window and the time range of the timeline.
+        """
+        timeline_store = self._timeline_stores.get(device_type)
+        if timeline_store is None:
+            file_path = self._get_display_file_path(device_type)
+            # The compressed display file contains all the events, while the display file may be truncated.
+            if os.path.exists(file_path + COMPRESSED_SUFFIX):
+                timeline_store = TimelineStore.load(file_path + COMPRESSED_SUFFIX)
+            elif os.path.exists(file_path):
+                timeline_store = TimelineStore.load(file_path)
+            else:
+                logger.info('No timeline file. Please check the output path.')
+                timeline_store = TimelineStore([])
+            self._timeline_stores[device_type] = timeline_store
+
+        return timeline_store.query(start_time, end_time, resolution)
+
     def get_timeline_summary(self, device_type):
         """
         Get timeline summary information for UI display.
@@ -162,37 +252,38 @@ class TimelineAnalyser(BaseAnalyser):
 
         return timeline_summary
 
-    def write_timeline(self):
-        """Load data according to the parsed profiling files."""
+    def write_timeline(self, device_type='ascend'):
+        """
+        Load data according to the parsed profiling files.
+
+        Args:
+            device_type (str): The device type, it should be ascend or gpu. Default: 'ascend'.
+        """
         # Write timeline to file.
         logger.info('Writing timeline file...')
-        self.write_timeline_to_json_by_limitation()
+        self.write_timeline_to_json_by_limitation(device_type)
         logger.info('Finished file writing!')
 
-    def write_timeline_to_json_by_limitation(self):
-        """Write timeline to json by limitation."""
-        display_filename = self._display_filename.format(self._device_id)
-        display_file_path = os.path.join(
-            self._profiling_dir,
-            display_filename
-        )
-        display_file_path = validate_and_normalize_path(
-            display_file_path, raise_key='Invalid timeline display json path.'
-        )
+    def write_timeline_to_json_by_limitation(self, device_type='ascend'):
+        """
+        Write timeline to json by limitation.
+
+        The display file is truncated by the size limit for the query of the whole timeline, and all the
+        events are written into a compressed display file for the window queries.
+
+        Args:
+            device_type (str): The device type, it should be ascend or gpu. Default: 'ascend'.
+        """
+        display_file_path = self._get_display_file_path(device_type)
 
-        length = len(self._timeline_meta)
         try:
             with open(display_file_path, 'w') as json_file:
-                json_file.write('[')
-                for index, item in enumerate(self._timeline_meta):
-                    json.dump(item, json_file)
-                    file_size = os.path.getsize(display_file_path)
-                    if file_size > SIZE_LIMIT:
-                        break
-                    if index == length - 1:
-                        break
-                    json_file.write(',')
-                json_file.write(']')
+                count = write_timeline_events(json_file, self._timeline_meta, SIZE_LIMIT)
+            if count < len(self._timeline_meta):
+                logger.warning('Timeline display file is truncated to %d of %d events by size limit.',
+                               count, len(self._timeline_meta))
+            with gzip.open(display_file_path + COMPRESSED_SUFFIX, 'wt') as gzip_file:
+                write_timeline_events(gzip_file, self._timeline_meta)
         except (IOError, OSError) as err:
             logger.error('Error occurred when write timeline display file: %s', err)
             raise ProfilerIOException
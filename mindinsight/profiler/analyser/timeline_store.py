@@ -0,0 +1,220 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Timeline store for window queries.
+
+The events of timeline are grouped into tracks by pid and tid, and the events of each track are sorted
+by start time, so the events in a time window are found by binary search instead of scanning the whole
+timeline. The events shorter than a pixel of the requested resolution are aggregated into summary bars,
+so the size of a response depends on the resolution instead of the length of the timeline.
+"""
+import gzip
+import json
+
+import numpy as np
+
+from mindinsight.profiler.common.exceptions.exceptions import ProfilerIOException
+from mindinsight.profiler.common.log import logger
+from mindinsight.utils.exceptions import ParamValueError
+
+MERGED_EVENT_NAME = 'Merged Ops'
+
+
+class _Track:
+    """
+    Events of a track sorted by start time.
+
+    Args:
+        events (list[dict]): The events of the track.
+    """
+
+    def __init__(self, events):
+        events.sort(key=lambda event: event['ts'])
+        self.events = events
+        self.start_times = np.array([event['ts'] for event in events], dtype=np.float64)
+        self.end_times = self.start_times + np.array([event.get('dur', 0) for event in events], dtype=np.float64)
+        self.max_duration = float(np.max(self.end_times - self.start_times)) if events else 0
+
+    def get_window_indexes(self, start, end):
+        """
+        Get the indexes of the events overlapping the time window.
+
+        Args:
+            start (float): The start time of the window.
+            end (float): The end time of the window.
+
+        Returns:
+            numpy.ndarray, the indexes of the events sorted by start time.
+        """
+        # An event starts at most `max_duration` before the window if it overlaps the window.
+        begin = np.searchsorted(self.start_times, start - self.max_duration, side='left')
+        stop = np.searchsorted(self.start_times, end, side='right')
+        indexes = np.arange(begin, stop)
+        return indexes[self.end_times[begin:stop] >= start]
+
+
+class TimelineStore:
+    """
+    Timeline events indexed by track.
+
+    Args:
+        events (list[dict]): The events in chrome trace format. The events without `ts` are regarded
+            as metadata events and returned by every query.
+    """
+
+    def __init__(self, events):
+        self._meta_events = []
+        track_events = {}
+        for event in events:
+            if not isinstance(event, dict) or not isinstance(event.get('ts'), (int, float)):
+                self._meta_events.append(event)
+                continue
+            track_events.setdefault((event.get('pid'), event.get('tid')), []).append(event)
+
+        self._tracks = [_Track(events) for events in track_events.values()]
+        self._event_count = sum(len(track.events) for track in self._tracks)
+        if self._tracks:
+            self._start_time = min(float(track.start_times[0]) for track in self._tracks)
+            self._end_time = max(float(np.max(track.end_times)) for track in self._tracks)
+        else:
+            self._start_time = 0
+            self._end_time = 0
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        Load the timeline store from the display file of timeline.
+
+        Args:
+            file_path (str): The path of the display file, it is read as a gzip file if it ends with `.gz`.
+
+        Returns:
+            TimelineStore, the timeline store.
+
+        Raises:
+            ProfilerIOException: If the file can not be read.
+        """
+        try:
+            open_file = gzip.open if file_path.endswith('.gz') else open
+            with open_file(file_path, 'rt') as f_obj:
+                events = json.load(f_obj)
+        except (IOError, OSError, EOFError, json.JSONDecodeError) as err:
+            logger.error('Error occurred when read timeline display file: %s', err)
+            raise ProfilerIOException
+        if not isinstance(events, list):
+            events = events.get('traceEvents', []) if isinstance(events, dict) else []
+        return cls(events)
+
+    @property
+    def start_time(self):
+        """Get the start time of the earliest event."""
+        return self._start_time
+
+    @property
+    def end_time(self):
+        """Get the end time of the latest event."""
+        return self._end_time
+
+    @property
+    def event_count(self):
+        """Get the number of events except metadata events."""
+        return self._event_count
+
+    def query(self, start_time=None, end_time=None, resolution=None):
+        """
+        Query the events in the time window.
+
+        Args:
+            start_time (Optional[float]): The start time of the window. If it is None, the start time of
+                the earliest event is used. Default: None.
+            end_time (Optional[float]): The end time of the window. If it is None, the end time of the
+                latest event is used. Default: None.
+            resolution (Optional[int]): The number of pixels of the window. Adjacent events shorter than
+                a pixel in the same pixel of a track are merged into one event whose args contains the
+                number of merged events. If it is None, no events are merged. Default: None.
+
+        Returns:
+            dict, the events in the window, the window and the time range of the whole timeline.
+
+        Raises:
+            ParamValueError: If the window or resolution is invalid.
+        """
+        start_time = self._start_time if start_time is None else start_time
+        end_time = self._end_time if end_time is None else end_time
+        if start_time > end_time:
+            raise ParamValueError("The start time should not be greater than the end time.")
+        if resolution is not None and resolution <= 0:
+            raise ParamValueError("The resolution should be a positive integer.")
+
+        pixel = (end_time - start_time) / resolution if resolution else 0
+        events = list(self._meta_events)
+        window_events = []
+        for track in self._tracks:
+            indexes = track.get_window_indexes(start_time, end_time)
+            if pixel > 0:
+                window_events.extend(self._merge_short_events(track, indexes, start_time, pixel))
+            else:
+                window_events.extend(track.events[index] for index in indexes.tolist())
+        window_events.sort(key=lambda event: event['ts'])
+        events.extend(window_events)
+
+        return {
+            'start_time': start_time,
+            'end_time': end_time,
+            'total_start_time': self._start_time,
+            'total_end_time': self._end_time,
+            'events': events
+        }
+
+    @staticmethod
+    def _merge_short_events(track, indexes, start_time, pixel):
+        """
+        Merge the events shorter than a pixel in the same pixel.
+
+        Args:
+            track (_Track): The track of the events.
+            indexes (numpy.ndarray): The indexes of the events in the window, sorted by start time.
+            start_time (float): The start time of the window.
+            pixel (float): The duration of a pixel.
+
+        Returns:
+            list[dict], the long events, the short events which are alone in the pixel and the merged events.
+        """
+        durations = track.end_times[indexes] - track.start_times[indexes]
+        is_short = durations < pixel
+        events = [track.events[index] for index in indexes[~is_short].tolist()]
+
+        short_indexes = indexes[is_short]
+        if not short_indexes.size:
+            return events
+        pixels = np.floor((np.maximum(track.start_times[short_indexes], start_time) - start_time) / pixel)
+        # The pixels are in ascending order, since the events are sorted by start time.
+        _, firsts, counts = np.unique(pixels, return_index=True, return_counts=True)
+        ends = np.maximum.reduceat(track.end_times[short_indexes], firsts)
+        for first, count, end in zip(firsts.tolist(), counts.tolist(), ends.tolist()):
+            first_event = track.events[int(short_indexes[first])]
+            if count == 1:
+                events.append(first_event)
+                continue
+            events.append({
+                'name': MERGED_EVENT_NAME,
+                'ph': 'X',
+                'pid': first_event.get('pid'),
+                'tid': first_event.get('tid'),
+                'ts': first_event['ts'],
+                'dur': end - first_event['ts'],
+                'args': {'op_count': count}
+            })
+        return events
@@ -218,6 +218,26 @@ def validate_filter_condition(search_condition):
         if "op_name" in filter_condition:
             op_name_condition = filter_condition.get("op_name")
             validate_op_filter_condition(op_name_condition)
+        for condition in filter_condition.values():
+            if isinstance(condition, dict) and "range" in condition:
+                validate_range_filter_condition(condition.get("range"))
+
+
+def validate_range_filter_condition(range_condition):
+    """
+    Verify the range condition in filter_condition is valid or not.
+
+    Args:
+        range_condition (list): The inclusive lower and upper bounds of the range.
+
+    Raises:
+        ProfilerFilterConditionException: If the range condition is invalid.
+    """
+    if not isinstance(range_condition, list) or len(range_condition) != 2:
+        raise ProfilerFilterConditionException("The range value must be a list of lower and upper bounds.")
+    for item in range_condition:
+        if isinstance(item, bool) or not isinstance(item, (int, float)):
+            raise ProfilerFilterConditionException("The item in range value must be int or float.")
 
 
 def validate_and_set_job_id_env(job_id_env):
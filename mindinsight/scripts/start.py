@@ -128,6 +128,29 @@ class PortAction(argparse.Action):
         setattr(namespace, self.dest, port)
 
 
+class WorkersAction(argparse.Action):
+    """Workers action class definition."""
+
+    MIN_WORKERS = 1
+    MAX_WORKERS = 64
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        """
+        Inherited __call__ method from argparse.Action.
+
+        Args:
+            parser (ArgumentParser): Passed-in argument parser.
+            namespace (Namespace): Namespace object to hold arguments.
+            values (object): Argument values with type depending on argument definition.
+            option_string (str): Optional string for specific argument name. Default: None.
+        """
+        workers = values
+        if not self.MIN_WORKERS <= workers <= self.MAX_WORKERS:
+            parser.error(f'{option_string} should be chosen from {self.MIN_WORKERS} to {self.MAX_WORKERS}')
+
+        setattr(namespace, self.dest, workers)
+
+
 class UrlPathPrefixAction(argparse.Action):
     """Url Path prefix action class definition."""
 
@@ -220,6 +243,16 @@ class Command(BaseCommand):
                 Debugger port ranging from %s to %s. Default value is %s.
             """ % (PortAction.MIN_PORT, PortAction.MAX_PORT, settings.DEBUGGER_PORT))
 
+        parser.add_argument(
+            '--workers',
+            type=int,
+            action=WorkersAction,
+            help="""
+                Number of worker processes of the web service ranging from %s to %s. If there are
+                multiple workers, only one worker parses summary files and the others read the data
+                published by it. Debugger only supports one worker. Default value is %s.
+            """ % (WorkersAction.MIN_WORKERS, WorkersAction.MAX_WORKERS, settings.WORKERS))
+
         parser.add_argument(
             '--url-path-prefix',
             type=str,
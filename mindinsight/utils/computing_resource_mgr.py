@@ -173,6 +173,8 @@ class Executor:
         self._slots = threading.Semaphore(value=self._effective_workers)
         self._id = executor_id
         self._futures = set()
+        # Notified when all futures are removed after their done callbacks.
+        self._futures_condition = threading.Condition()
 
         self._lock = threading.Lock()
 
@@ -203,8 +205,8 @@ class Executor:
         self._slots.acquire()
         future = self._mgr.submit(*args, **kwargs)
 
-        # set.add is atomic in c-python.
-        self._futures.add(future)
+        with self._futures_condition:
+            self._futures.add(future)
         return WrappedFuture(self, future)
 
     def release_slot(self):
@@ -223,8 +225,10 @@ class Executor:
 
         This method should only be called by WrappedFuture.
         """
-        # set.remove is atomic in c-python so no lock is needed.
-        self._futures.remove(future)
+        with self._futures_condition:
+            self._futures.remove(future)
+            if not self._futures:
+                self._futures_condition.notify_all()
 
     @staticmethod
     def _calc_effective_workers(available_workers):
@@ -258,8 +262,12 @@ class Executor:
 
     def wait_all_tasks_finish(self):
         """
-        Wait all tasks finish.
+        Wait all tasks finish, including the done callbacks of the tasks.
+
+        A future is removed from the executor after its callback finishes, and futures.wait() may return
+        before the callbacks are invoked, so wait until no future remains.
 
         This method is not thread safe.
         """
-        futures.wait(self._futures)
+        with self._futures_condition:
+            self._futures_condition.wait_for(lambda: not self._futures)
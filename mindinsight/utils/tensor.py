@@ -13,6 +13,7 @@
 # limitations under the License.
 # ============================================================================
 """Tensor utils."""
+import math
 
 import numpy as np
 
@@ -254,6 +255,42 @@ class TensorUtils:
         }
         return statistics
 
+    @staticmethod
+    def get_min_max_pyramid(tensors, max_points, factor=4):
+        """
+        Calculate the min/max pyramid of the flattened tensor data.
+
+        Each level of the pyramid divides the flattened data into blocks of the same size, and keeps the min and
+        max of each block, NaN is ignored unless all values of a block are NaN. The finest level has at most
+        `max_points` blocks, and the block size of each coarser level is `factor` times the finer one, until the
+        coarsest level has only one block.
+
+        Args:
+            tensors (numpy.ndarray): An numpy.ndarray of tensor data.
+            max_points (int): The max number of blocks in the finest level.
+            factor (int): The ratio of the block sizes of adjacent levels. Default: 4.
+
+        Returns:
+            list[tuple[int, numpy.ndarray, numpy.ndarray]], the block size, the mins and the maxes of each level,
+                from the coarsest level to the finest level.
+        """
+        flat = tensors.reshape(-1)
+        if not flat.size:
+            return []
+        block_size = 1
+        while math.ceil(flat.size / block_size) > max_points:
+            block_size *= factor
+        starts = np.arange(0, flat.size, block_size)
+        mins, maxes = np.fmin.reduceat(flat, starts), np.fmax.reduceat(flat, starts)
+        levels = [(block_size, mins, maxes)]
+        while mins.size > 1:
+            starts = np.arange(0, mins.size, factor)
+            mins, maxes = np.fmin.reduceat(mins, starts), np.fmax.reduceat(maxes, starts)
+            block_size *= factor
+            levels.append((block_size, mins, maxes))
+        levels.reverse()
+        return levels
+
     @staticmethod
     def calc_diff_between_two_tensor(first_tensor, second_tensor, tolerance):
         """
@@ -0,0 +1,62 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Benchmark of the BFS order of debugger graphs on synthetic graphs.
+
+The BFS order got with the visited set is compared with the one got by scanning the traversed nodes, and the
+lookup of node positions by dict is compared with `list.index`:
+
+    python -m tests.benchmark.bench_debugger_graph --node-counts 2000 20000 100000
+"""
+import argparse
+import random
+import timeit
+
+from tests.utils.graph_generator import generate_debugger_graph, get_bfs_order_by_scan
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark of the BFS order of debugger graphs.')
+    parser.add_argument('--node-counts', type=int, nargs='+', default=[2000, 20000, 100000],
+                        help='The numbers of connected nodes of the graphs.')
+    parser.add_argument('--scan-limit', type=int, default=20000,
+                        help='The max number of nodes on which the scanning algorithm is run.')
+    parser.add_argument('--lookup-count', type=int, default=1000, help='The number of node positions to look up.')
+    parser.add_argument('--repeat', type=int, default=3, help='The number of times to run.')
+    args = parser.parse_args()
+
+    rand = random.Random(0)
+    for node_count in args.node_counts:
+        graph = generate_debugger_graph(node_count, isolated_count=node_count // 100)
+        seconds = min(timeit.repeat(graph.get_bfs_order, repeat=args.repeat, number=1))
+        print('{} nodes: BFS with visited set {:.3f}s'.format(node_count, seconds))
+        bfs_order = graph.get_bfs_order()
+        if node_count <= args.scan_limit:
+            seconds = min(timeit.repeat(lambda: get_bfs_order_by_scan(graph), repeat=args.repeat, number=1))
+            print('{} nodes: BFS by scan {:.3f}s, same order: {}'.format(
+                node_count, seconds, bfs_order == get_bfs_order_by_scan(graph)))
+
+        node_names = rand.sample(bfs_order, min(args.lookup_count, len(bfs_order)))
+        bfs_index = {node_name: index for index, node_name in enumerate(bfs_order)}
+        seconds = min(timeit.repeat(lambda: [bfs_order.index(name) for name in node_names],
+                                    repeat=args.repeat, number=1))
+        print('{} nodes: {} lookups by list.index {:.4f}s'.format(node_count, len(node_names), seconds))
+        seconds = min(timeit.repeat(lambda: [bfs_index[name] for name in node_names], repeat=args.repeat, number=1))
+        print('{} nodes: {} lookups by dict {:.4f}s'.format(node_count, len(node_names), seconds))
+
+
+if __name__ == '__main__':
+    main()
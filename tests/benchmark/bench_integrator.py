@@ -0,0 +1,142 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Benchmark of the profiler integrator on a synthetic profile.
+
+The synthetic profile has the parsed AICORE operator time file and the framework file of `op_count`
+operators. Another integrator module, e.g. one of an earlier revision, can be given to be compared with:
+
+    git show <revision>:mindinsight/profiler/analyser/integrator.py > /tmp/integrator_base.py
+    python -m tests.benchmark.bench_integrator --baseline /tmp/integrator_base.py
+"""
+import argparse
+import csv
+import importlib.util
+import os
+import random
+import shutil
+import tempfile
+import timeit
+
+from mindinsight.profiler.analyser.integrator import Integrator
+
+FRAMEWORK_HEADER = ['task_id', 'stream_id', 'block_dim', 'full_op_name', 'op_name', 'op_type', 'subgraph',
+                    'op_info']
+
+
+def generate_profile(profiling_dir, op_count, type_count, device_id='0', seed=0):
+    """
+    Generate the synthetic parsed profiling files.
+
+    Args:
+        profiling_dir (str): The directory where the files are generated.
+        op_count (int): The number of operators.
+        type_count (int): The number of operator types.
+        device_id (str): The device ID. Default: '0'.
+        seed (int): The seed of the random execution time. Default: 0.
+    """
+    rand = random.Random(seed)
+    op_types = ['OpType{}'.format(index) for index in range(type_count)]
+    op_infos = []
+    for index in range(op_count):
+        op_type = op_types[index % type_count]
+        op_name = '{}-op{}'.format(op_type, index)
+        op_infos.append(('Default/network/layer{}/{}'.format(index % 100, op_name), op_name, op_type))
+
+    total_time = 0
+    time_file_path = os.path.join(profiling_dir, 'output_op_compute_time_{}.txt'.format(device_id))
+    with open(time_file_path, 'w') as time_file:
+        time_file.write('====================op compute time====================\n')
+        time_file.write('op_name       compute_time(ms) stream_id\n')
+        time_file.write('------------  ---------------  ---------\n')
+        for full_op_name, _, _ in op_infos:
+            op_time = round(rand.uniform(0.001, 10), 3)
+            total_time += op_time
+            time_file.write('{} {}  1\n'.format(full_op_name, op_time))
+        time_file.write('total op  {} 0\n'.format(round(total_time, 3)))
+
+    framework_file_path = os.path.join(profiling_dir, 'framework_raw_{}.csv'.format(device_id))
+    with open(framework_file_path, 'w') as framework_file:
+        csv_writer = csv.writer(framework_file)
+        csv_writer.writerow(FRAMEWORK_HEADER)
+        for task_id, (full_op_name, op_name, op_type) in enumerate(op_infos):
+            csv_writer.writerow([task_id, 1, 32, full_op_name, op_name, op_type, 'Default', '{}'])
+
+
+def load_integrator(module_path):
+    """
+    Load the `Integrator` class from the module file.
+
+    Args:
+        module_path (str): The path of the integrator module.
+
+    Returns:
+        type, the integrator class.
+    """
+    spec = importlib.util.spec_from_file_location('integrator_baseline', module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.Integrator
+
+
+def time_integrators(integrators, profiling_dir, repeat):
+    """
+    Time the integration of the profile by the integrators.
+
+    The integrators are run in turn in each round, so the noise of the machine affects them alike.
+
+    Args:
+        integrators (list[type]): The integrator classes.
+        profiling_dir (str): The directory of the profile.
+        repeat (int): The number of rounds.
+
+    Returns:
+        list[list[float]], the seconds of each integration of each integrator.
+    """
+    seconds = [[] for _ in integrators]
+    for _ in range(repeat):
+        for index, integrator_class in enumerate(integrators):
+            timer = timeit.Timer(lambda: integrator_class(profiling_dir, '0').integrate())
+            seconds[index].append(timer.timeit(number=1))
+    return seconds
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark of the profiler integrator.')
+    parser.add_argument('--op-count', type=int, default=1000000, help='The number of operators.')
+    parser.add_argument('--type-count', type=int, default=200, help='The number of operator types.')
+    parser.add_argument('--repeat', type=int, default=5, help='The number of times to integrate.')
+    parser.add_argument('--baseline', help='The path of the integrator module to be compared with.')
+    args = parser.parse_args()
+
+    profiling_dir = tempfile.mkdtemp()
+    try:
+        generate_profile(profiling_dir, args.op_count, args.type_count)
+        integrators = [('current', Integrator)]
+        if args.baseline:
+            integrators.insert(0, ('baseline', load_integrator(args.baseline)))
+        # Warm up the page cache of the profiling files.
+        time_integrators([Integrator], profiling_dir, 1)
+        all_seconds = time_integrators([integrator for _, integrator in integrators], profiling_dir, args.repeat)
+        for (name, _), seconds in zip(integrators, all_seconds):
+            print('{:<10} best {:.3f}s, median {:.3f}s of {} runs'.format(
+                name, min(seconds), sorted(seconds)[len(seconds) // 2], len(seconds)))
+    finally:
+        shutil.rmtree(profiling_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -34,6 +34,8 @@ TRAIN_ROUTES = dict(
     train_jobs='/v1/mindinsight/datavisual/train-jobs',
     single_job='/v1/mindinsight/datavisual/single-job',
     plugins='/v1/mindinsight/datavisual/plugins',
+    loading_queue='/v1/mindinsight/datavisual/loading-queue',
+    cache_memory='/v1/mindinsight/datavisual/cache-memory',
     graph_nodes='/v1/mindinsight/datavisual/graphs/nodes',
     graph_nodes_names='/v1/mindinsight/datavisual/graphs/nodes/names',
     graph_single_node='/v1/mindinsight/datavisual/graphs/single-node',
@@ -184,3 +184,41 @@ class TestTrainTask:
         assert response.status_code == 200
         results = response.get_json()
         assert results == f'{train_id}{manual_update}'
+
+    @patch.object(TrainTaskManager, 'query_loading_queue')
+    def test_query_loading_queue_success(self, mock_query_loading_queue, client):
+        """
+        Test querying the loading queue.
+
+        Test Params:
+        request route: GET('/v1/mindinsight/datavisual/loading-queue').
+
+        Expect:
+        response status code: 200.
+        response json: status of the loading queue.
+        """
+        queue_status = dict(queue_depth=1, pending_requests=1, loaders=[dict(train_id='./test_id', lag=0)])
+        mock_query_loading_queue.return_value = queue_status
+
+        response = client.get(TRAIN_ROUTES['loading_queue'])
+        assert response.status_code == 200
+        assert response.get_json() == queue_status
+
+    @patch.object(TrainTaskManager, 'query_cache_memory_usage')
+    def test_query_cache_memory_usage_success(self, mock_query_cache_memory_usage, client):
+        """
+        Test querying the memory usage of detail cache.
+
+        Test Params:
+        request route: GET('/v1/mindinsight/datavisual/cache-memory').
+
+        Expect:
+        response status code: 200.
+        response json: memory usage of detail cache.
+        """
+        memory_usage = dict(memory_limit=0, total_nbytes=100, loaders=[], evicted_train_ids=[])
+        mock_query_cache_memory_usage.return_value = memory_usage
+
+        response = client.get(TRAIN_ROUTES['cache_memory'])
+        assert response.status_code == 200
+        assert response.get_json() == memory_usage
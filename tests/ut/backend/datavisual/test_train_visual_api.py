@@ -26,6 +26,7 @@ from mindinsight.datavisual.processors.graph_processor import GraphProcessor
 from mindinsight.datavisual.processors.images_processor import ImageProcessor
 from mindinsight.datavisual.processors.scalars_processor import ScalarsProcessor
 from mindinsight.datavisual.processors.histogram_processor import HistogramProcessor
+from mindinsight.datavisual.utils.response_cache import RESPONSE_CACHE
 
 from ....utils.tools import get_url
 from .conftest import TRAIN_ROUTES
@@ -165,10 +166,10 @@ class TestTrainVisual:
         assert response['error_code'] == '50540001'
         assert response['error_msg'] == "Invalid parameter type. 'step' expect Integer type."
 
-    @patch.object(ImageProcessor, 'get_single_image')
+    @patch.object(ImageProcessor, 'get_single_image_with_digest')
     def test_single_image_with_params_success(self, mock_processor, client):
         """Test getting single image with params successfully."""
-        mock_get_single_image = Mock(return_value=b'123')
+        mock_get_single_image = Mock(return_value=(b'123', 'digest'))
         params = dict(train_id='123', tag='123', step=1)
         url = get_url(TRAIN_ROUTES['image_single_image'], params)
 
@@ -178,6 +179,14 @@ class TestTrainVisual:
         assert response.status_code == 200
         assert response.data == b'123'
 
+        response = client.get(url, headers={'Range': 'bytes=1-'})
+        assert response.status_code == 206
+        assert response.data == b'23'
+
+        assert response.headers['ETag'] == '"digest"'
+        response = client.get(url, headers={'If-None-Match': response.headers['ETag']})
+        assert response.status_code == 304
+
     def test_scalar_metadata_with_params_is_none(self, client):
         """Parsing unavailable params to get scalar metadata."""
         params = dict()
@@ -451,3 +460,34 @@ class TestTrainVisual:
         assert response.status_code == 200
         results = response.get_json()
         assert results == expect_resp
+
+    @patch.object(HistogramProcessor, 'get_data_version')
+    @patch.object(HistogramProcessor, 'get_histograms')
+    def test_histograms_with_etag(self, mock_histogram_processor, mock_data_version, client):
+        """Test the histograms are served from cache until the data version changes."""
+        RESPONSE_CACHE.clear()
+        mock_histogram_processor.return_value = {'histograms': [], 'train_id': 'aa', 'tag': 'bb'}
+        mock_data_version.return_value = 1
+
+        url = get_url(TRAIN_ROUTES['histograms'], dict(train_id='aa', tag='bb'))
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers['Cache-Control'] == 'no-cache'
+        etag = response.headers['ETag']
+
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers['ETag'] == etag
+        assert mock_histogram_processor.call_count == 1
+
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert not response.data
+
+        mock_histogram_processor.return_value = {'histograms': [{'buckets': []}], 'train_id': 'aa', 'tag': 'bb'}
+        mock_data_version.return_value = 2
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert response.get_json()['histograms'] == [{'buckets': []}]
+        assert mock_histogram_processor.call_count == 2
@@ -211,3 +211,191 @@ class TestDataManager:
         assert sorted(current_loader_ids) == sorted(expected_loader_ids)
 
         shutil.rmtree(summary_base_dir)
+
+    @patch.object(data_manager.DataLoaderGenerator, "generate_loaders")
+    def test_load_requested_train_job_first(self, mock_generate_loaders):
+        """Test the requested train job is loaded before the others and the loading queue status."""
+        summary_base_dir = tempfile.mkdtemp()
+        loader_dict = self._make_loader_dict(summary_base_dir, 3)
+        load_order = []
+        remaining_slices = {'./job0': 3, './job1': 1, './job2': 1}
+
+        def make_load(loader_id):
+            def load(_):
+                load_order.append(loader_id)
+                remaining_slices[loader_id] -= 1
+                return remaining_slices[loader_id] <= 0
+            return load
+
+        for loader_id, loader in loader_dict.items():
+            loader.data_loader.load = make_load(loader_id)
+        mock_generate_loaders.return_value = loader_dict
+
+        detail_cache = data_manager._DetailCacheManager(summary_base_dir)
+        detail_cache._generate_loaders()
+        detail_cache.cache_train_job('./job0')
+
+        queue_status = detail_cache.get_loading_queue_status()
+        assert queue_status['queue_depth'] == 3
+        assert queue_status['pending_requests'] == 1
+        assert [loader['train_id'] for loader in queue_status['loaders']] == ['./job0', './job2', './job1']
+
+        assert detail_cache._execute_load_data(executor=None)
+        # All slices of the requested train job are loaded first, then every loader loads one slice in the order of
+        # access time and update time.
+        assert load_order == ['./job0', './job0', './job0', './job0', './job2', './job1']
+
+        queue_status = detail_cache.get_loading_queue_status()
+        assert queue_status['queue_depth'] == 0
+        assert queue_status['pending_requests'] == 0
+        loader_status = queue_status['loaders'][0]
+        assert loader_status['train_id'] == './job0'
+        assert loader_status['slices'] == 4
+        assert loader_status['lag'] == 0
+        assert loader_status['cache_status'] == 'CACHED'
+
+        shutil.rmtree(summary_base_dir)
+
+    @patch.object(data_manager.settings, 'REQUESTED_LOADER_TIME_SLICE', 0)
+    @patch.object(data_manager.DataLoaderGenerator, "generate_loaders")
+    def test_requested_loaders_share_round_budget(self, mock_generate_loaders):
+        """Test the requested train job loads no extra slices once the time budget of the round is used up."""
+        summary_base_dir = tempfile.mkdtemp()
+        loader_dict = self._make_loader_dict(summary_base_dir, 3)
+        load_order = []
+
+        def make_load(loader_id):
+            def load(_):
+                load_order.append(loader_id)
+                return False
+            return load
+
+        for loader_id, loader in loader_dict.items():
+            loader.data_loader.load = make_load(loader_id)
+        mock_generate_loaders.return_value = loader_dict
+
+        detail_cache = data_manager._DetailCacheManager(summary_base_dir)
+        detail_cache._generate_loaders()
+        detail_cache.cache_train_job('./job0')
+
+        assert not detail_cache._execute_load_data(executor=None)
+        assert load_order == ['./job0', './job2', './job1']
+
+        shutil.rmtree(summary_base_dir)
+
+    @patch.object(data_manager.settings, 'DETAIL_CACHE_MEMORY_LIMIT', 1)
+    @patch.object(data_manager.DataLoaderGenerator, "generate_loaders")
+    def test_evict_by_memory_limit(self, mock_generate_loaders):
+        """Test loaders are removed when the memory limit is exceeded, until they are requested again."""
+        summary_base_dir = tempfile.mkdtemp()
+        loader_dict = self._make_loader_dict(summary_base_dir, 3)
+        # The memory limit is 1MB, job0 and job1 are used at the same time and job2 is the most recently used.
+        nbytes = {'./job0': 300 * 1024, './job1': 600 * 1024, './job2': 600 * 1024}
+        latest_update_times = {'./job0': time.time() - 100, './job1': time.time() - 100, './job2': time.time()}
+        for loader_id, loader in loader_dict.items():
+            loader.latest_update_time = latest_update_times[loader_id]
+            loader.data_loader.load = Mock(return_value=True)
+            loader.data_loader.get_nbytes_by_plugin = Mock(return_value={'image': nbytes[loader_id]})
+        mock_generate_loaders.return_value = loader_dict
+
+        detail_cache = data_manager._DetailCacheManager(summary_base_dir)
+        assert detail_cache._execute_load_data(executor=None)
+        # job1 is removed rather than job0, because it uses more memory.
+        assert sorted(detail_cache._loader_pool) == ['./job0', './job2']
+
+        memory_usage = detail_cache.get_memory_usage()
+        assert memory_usage['memory_limit'] == 1024 * 1024
+        assert memory_usage['total_nbytes'] == 900 * 1024
+        assert [loader['train_id'] for loader in memory_usage['loaders']] == ['./job2', './job0']
+        assert memory_usage['evicted_train_ids'] == ['./job1']
+
+        # The removed loader is not loaded again until it is requested.
+        detail_cache._execute_load_data(executor=None)
+        assert './job1' not in detail_cache._loader_pool
+        mock_generate_loaders.return_value = loader_dict
+        with patch.object(data_manager.DataLoaderGenerator, "generate_loader_by_train_id",
+                          return_value=loader_dict['./job1']):
+            detail_cache.cache_train_job('./job1')
+        assert './job1' in detail_cache._loader_pool
+        assert detail_cache.get_memory_usage()['evicted_train_ids'] == []
+
+        shutil.rmtree(summary_base_dir)
+
+    @patch.object(data_manager.settings, 'DETAIL_CACHE_MEMORY_LIMIT', 1)
+    @patch.object(data_manager.DataLoaderGenerator, "generate_loaders")
+    def test_evict_by_access_time(self, mock_generate_loaders):
+        """Test loaders are removed in order of access time rather than update time of summary files."""
+        summary_base_dir = tempfile.mkdtemp()
+        loader_dict = self._make_loader_dict(summary_base_dir, 3)
+        nbytes = {'./job0': 600 * 1024, './job1': 300 * 1024, './job2': 300 * 1024}
+        for loader_id, loader in loader_dict.items():
+            loader.data_loader.load = Mock(return_value=True)
+            loader.data_loader.get_nbytes_by_plugin = Mock(return_value={'image': nbytes[loader_id]})
+        mock_generate_loaders.return_value = loader_dict
+
+        detail_cache = data_manager._DetailCacheManager(summary_base_dir)
+        detail_cache._generate_loaders()
+        now = time.time()
+        # job2 is accessed 300 seconds ago and job0 is accessed 100 seconds ago.
+        for loader_id, access_time in (('./job2', now - 300), ('./job0', now - 100)):
+            with patch.object(data_manager.time, 'time', return_value=access_time):
+                detail_cache.cache_train_job(loader_id)
+        # job1 is never accessed, though its summary files are updated just now.
+        loader_dict['./job1'].latest_update_time = now
+
+        assert detail_cache._execute_load_data(executor=None)
+        assert sorted(detail_cache._loader_pool) == ['./job0', './job2']
+        assert detail_cache.get_memory_usage()['evicted_train_ids'] == ['./job1']
+
+        shutil.rmtree(summary_base_dir)
+
+    @patch.object(data_manager.settings, 'DETAIL_CACHE_MEMORY_LIMIT', 1)
+    @patch.object(data_manager.DataLoaderGenerator, "generate_loaders")
+    def test_prune_evicted_loaders(self, mock_generate_loaders):
+        """Test the evicted loaders are forgotten when their train jobs no longer exist."""
+        summary_base_dir = tempfile.mkdtemp()
+        loader_dict = self._make_loader_dict(summary_base_dir, 2)
+        for loader in loader_dict.values():
+            loader.data_loader.load = Mock(return_value=True)
+            loader.data_loader.get_nbytes_by_plugin = Mock(return_value={'image': 600 * 1024})
+        mock_generate_loaders.return_value = loader_dict
+
+        detail_cache = data_manager._DetailCacheManager(summary_base_dir)
+        detail_cache._execute_load_data(executor=None)
+        assert detail_cache.get_memory_usage()['evicted_train_ids'] == ['./job0']
+
+        # job0 is not listed, but it still exists.
+        mock_generate_loaders.return_value = {'./job1': loader_dict['./job1']}
+        with patch.object(data_manager.DataLoaderGenerator, "check_train_job_exist", return_value=True):
+            detail_cache._execute_load_data(executor=None)
+        assert detail_cache.get_memory_usage()['evicted_train_ids'] == ['./job0']
+
+        with patch.object(data_manager.DataLoaderGenerator, "check_train_job_exist", return_value=False):
+            detail_cache._execute_load_data(executor=None)
+        assert detail_cache.get_memory_usage()['evicted_train_ids'] == []
+
+        shutil.rmtree(summary_base_dir)
+
+    @patch.object(data_manager.settings, 'SUMMARY_WATCH_MODE', 'mtime')
+    def test_brief_cache_with_incremental_watcher(self):
+        """Test updating brief cache with the changes of summary directories."""
+        summary_base_dir = tempfile.mkdtemp()
+        for name in ('job0', 'job1'):
+            self._make_path_and_file_list(os.path.join(summary_base_dir, name))
+
+        brief_cache = data_manager._BriefCacheManager(summary_base_dir)
+        brief_cache.update_cache(executor=None)
+        cached_job = brief_cache.get_train_job('./job0')
+        assert sorted(brief_cache.cache_items) == ['./job0', './job1']
+
+        shutil.rmtree(os.path.join(summary_base_dir, 'job1'))
+        brief_cache.update_cache(executor=None)
+        assert list(brief_cache.cache_items) == ['./job0']
+        assert brief_cache.get_train_job('./job0') is cached_job
+
+        # The train job deleted from cache is cached again if it is still on disk.
+        brief_cache.delete_train_job('./job0')
+        brief_cache.update_cache(executor=None)
+        assert list(brief_cache.cache_items) == ['./job0']
+
+        shutil.rmtree(summary_base_dir)
@@ -46,6 +46,11 @@ class MockReservoir:
 
         return self._samples
 
+    def last_step(self):
+        """Replace the last_step function."""
+
+        return self._samples[-1].step if self._samples else None
+
     def add_sample(self, sample):
         """Replace the add_sample function."""
 
@@ -122,7 +127,7 @@ class TestEventsData:
     def test_add_tensor_event_out_of_order(self):
         """Test add_tensor_event success for out_of_order summaries."""
         wall_time = 1
-        value = '1'
+        value = 1.0
         tag = 'tag'
         plugin_name = 'scalar'
         file1 = 'file1'
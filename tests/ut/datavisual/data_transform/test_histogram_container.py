@@ -16,6 +16,7 @@
 import unittest.mock as mock
 
 from mindinsight.datavisual.data_transform import histogram_container as hist
+from mindinsight.datavisual.data_transform.histogram import Bucket, Histogram
 
 
 class TestHistogram:
@@ -103,3 +104,19 @@ class TestHistogram:
             (0.0, 0.6666666666666666, 1),
             (0.6666666666666666, 0.6666666666666666, 3),
             (1.3333333333333333, 0.6666666666666666, 0))
+
+    def test_re_sample_histograms_in_batch(self):
+        """Test re-sampling histograms of all steps in batch."""
+        histograms = []
+        for step in range(3):
+            buckets = (Bucket(step, 1, 1), Bucket(step + 1, 1, step + 2), Bucket(step + 2, 0, 3))
+            histograms.append(Histogram(buckets, max_val=step + 2, min_val=step, count=step + 6))
+        for histogram in histograms:
+            histogram.set_visual_range(max_val=4, min_val=0, bins=4)
+
+        Histogram.re_sample_histograms(histograms)
+        assert [histogram.buckets() for histogram in histograms] == [
+            ((0.0, 1.0, 1), (1.0, 1.0, 2), (2.0, 1.0, 3), (3.0, 1.0, 0)),
+            ((0.0, 1.0, 0), (1.0, 1.0, 1), (2.0, 1.0, 3), (3.0, 1.0, 3)),
+            ((0.0, 1.0, 0), (1.0, 1.0, 0), (2.0, 1.0, 1), (3.0, 1.0, 7)),
+        ]
@@ -0,0 +1,129 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Function:
+    Test mindinsight.datavisual.data_transform.image_blob_store.
+Usage:
+    pytest tests/ut/datavisual
+"""
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+import pytest
+
+from mindinsight.datavisual.data_transform import image_blob_store, image_container
+from mindinsight.datavisual.data_transform.image_blob_store import ImageBlobStore
+from mindinsight.datavisual.proto_files.mindinsight_summary_pb2 import Summary
+
+
+class TestImageBlobStore:
+    """Test image blob store."""
+    _store_dir = ''
+
+    def setup_method(self):
+        """Run before method."""
+        self._store_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Run after method."""
+        shutil.rmtree(self._store_dir)
+
+    def test_put_and_get(self):
+        """Test the same data is stored once and can be got by its key."""
+        blob_store = ImageBlobStore(self._store_dir, disk_limit=1024)
+        key = blob_store.put(b'image')
+        assert blob_store.put(b'image') == key
+        assert blob_store.get(key) == b'image'
+        assert len(os.listdir(self._store_dir)) == 1
+        assert blob_store.get('not_exist') is None
+
+    def test_evict(self):
+        """Test the blobs read least recently are removed."""
+        blob_store = ImageBlobStore(self._store_dir, disk_limit=10)
+        keys = [blob_store.put(data) for data in (b'image1', b'image2')]
+        for index, key in enumerate(keys):
+            blob_path = os.path.join(self._store_dir, key + '.blob')
+            os.utime(blob_path, ns=(index, index))
+
+        assert blob_store.evict() == 1
+        assert blob_store.get(keys[0]) is None
+        assert blob_store.get(keys[1]) == b'image2'
+
+    def test_evict_keeps_referenced_blobs(self):
+        """Test the blobs referenced by loaded images are not removed even if the limit is exceeded."""
+        blob_store = ImageBlobStore(self._store_dir, disk_limit=10)
+        keys = [blob_store.put(data) for data in (b'image1', b'image2', b'image3')]
+        for index, key in enumerate(keys):
+            blob_path = os.path.join(self._store_dir, key + '.blob')
+            os.utime(blob_path, ns=(index, index))
+
+        assert blob_store.evict(referenced_keys={keys[0], keys[1]}) == 1
+        assert blob_store.exists(keys[0]) and blob_store.exists(keys[1])
+        assert not blob_store.exists(keys[2])
+
+    def test_evict_without_scan(self):
+        """Test only the blobs not known before are checked on disk between two scans of the directory."""
+        blob_store = ImageBlobStore(self._store_dir, disk_limit=12)
+        keys = [blob_store.put(data) for data in (b'image1', b'image2')]
+        os.utime(os.path.join(self._store_dir, keys[0] + '.blob'), ns=(0, 0))
+        assert blob_store.evict(referenced_keys={keys[1]}) == 0
+
+        keys.append(blob_store.put(b'image3'))
+        with mock.patch.object(image_blob_store.os, 'scandir') as mock_scandir:
+            # The blob never referenced is removed first, and the new blob is counted.
+            assert blob_store.evict(referenced_keys={keys[2]}) == 1
+        mock_scandir.assert_not_called()
+        assert not blob_store.exists(keys[0])
+        assert blob_store.exists(keys[1]) and blob_store.exists(keys[2])
+
+    def test_store_dir_of_port(self):
+        """Test the default directory of the store is different for each port."""
+        with mock.patch.object(image_blob_store.settings, 'PORT', 8080):
+            store_dir = ImageBlobStore().store_dir
+        with mock.patch.object(image_blob_store.settings, 'PORT', 8081):
+            assert ImageBlobStore().store_dir != store_dir
+
+    def test_image_container(self):
+        """Test the image container keeps only the keys if the store is enabled."""
+        image_message = Summary.Image(height=1, width=1, encoded_image=b'image')
+        with mock.patch.object(image_container, 'IMAGE_BLOB_STORE', ImageBlobStore(self._store_dir, 1024)):
+            container = image_container.ImageContainer(image_message)
+            assert container.nbytes == 0
+            assert len(container.blob_keys) == 1
+            assert container.encoded_image == b'image'
+            assert container.thumbnail == b'image'
+            assert container.get_digest() == container.blob_keys[0]
+
+        with mock.patch.object(image_container, 'IMAGE_BLOB_STORE', ImageBlobStore(self._store_dir, 0)):
+            container = image_container.ImageContainer(image_message)
+            assert container.nbytes == len(b'image')
+            assert container.encoded_image == b'image'
+            assert container.get_digest(thumbnail=True) == hashlib.sha256(b'image').hexdigest()
+
+    def test_create_thumbnail(self):
+        """Test creating the thumbnail of a large image."""
+        pil_image = pytest.importorskip('PIL.Image')
+        output = io.BytesIO()
+        pil_image.new('RGB', (400, 200)).save(output, format='PNG')
+
+        thumbnail = image_container.create_thumbnail(output.getvalue(), 100)
+        with pil_image.open(io.BytesIO(thumbnail)) as image:
+            assert image.size == (100, 50)
+        assert image_container.create_thumbnail(output.getvalue(), 400) is None
+        assert image_container.create_thumbnail(b'not an image', 100) is None
@@ -21,13 +21,17 @@ Usage:
 import os
 import shutil
 import tempfile
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from mindinsight.datavisual.data_transform import ms_data_loader
+from mindinsight.datavisual.data_transform import summary_record_reader
 from mindinsight.datavisual.data_transform.ms_data_loader import MSDataLoader
 from mindinsight.datavisual.data_transform.ms_data_loader import _PbParser
+from mindinsight.datavisual.data_transform.ms_data_loader import _SummaryParser
+from mindinsight.datavisual.data_transform.summary_index_cache import SummaryIndexCache
+from mindinsight.datavisual.data_transform.summary_record_reader import SummaryRecordReader
 from mindinsight.datavisual.data_transform.events_data import TensorEvent
 from mindinsight.datavisual.common.enums import PluginNameEnum
 
@@ -59,12 +63,12 @@ class TestMsDataLoader:
     @pytest.fixture(scope="function")
     def crc_pass(self):
         """Mock the crc to pass the check."""
-        ms_data_loader.crc32.CheckValueAgainstData = Mock(return_value=True)
+        summary_record_reader.crc32.CheckValueAgainstData = Mock(return_value=True)
 
     @pytest.fixture(scope="function")
     def crc_fail(self):
         """Mock the crc to fail the check."""
-        ms_data_loader.crc32.CheckValueAgainstData = Mock(return_value=False)
+        summary_record_reader.crc32.CheckValueAgainstData = Mock(return_value=False)
 
     def test_check_files_update_success_deleted_files(self):
         """Test new file list delete some files."""
@@ -102,6 +106,73 @@ class TestMsDataLoader:
         shutil.rmtree(summary_dir)
         assert 'Check crc faild and ignore this file' in str(MockLogger.log_msg['warning'])
 
+    @pytest.mark.usefixtures('crc_pass')
+    def test_load_single_file_in_batches(self):
+        """Test events are framed in batches and each batch is submitted as one task."""
+        summary_dir = tempfile.mkdtemp()
+        file1 = os.path.join(summary_dir, 'summary.01')
+        write_file(file1, SCALAR_RECORD)
+        parser = _SummaryParser(summary_dir)
+        record_reader = SummaryRecordReader(file1)
+        executor = Mock()
+        with patch.object(ms_data_loader, '_EVENT_COUNT_PER_PARSE_TASK', 2):
+            finished_first = parser._load_single_file(record_reader, executor)
+            finished_second = parser._load_single_file(record_reader, executor)
+        record_reader.close()
+        shutil.rmtree(summary_dir)
+
+        assert not finished_first
+        assert finished_second
+        batches = [call_args[0][1] for call_args in executor.submit.call_args_list]
+        assert [len(batch) for batch in batches] == [2, 1]
+        tensor_events = _SummaryParser._events_parse(batches[0], 'summary.01')
+        assert [tensor_event.step for tensor_event in tensor_events] == [1, 3]
+
+    @pytest.mark.usefixtures('crc_pass')
+    def test_load_with_index_cache(self):
+        """Test a new loader resumes from the saved index and only parses appended events."""
+        summary_dir = tempfile.mkdtemp()
+        cache_dir = tempfile.mkdtemp()
+        index_cache = SummaryIndexCache(cache_dir)
+        single_record_len = RECORD_LEN // 3
+        file1 = os.path.join(summary_dir, 'summary.01')
+        write_file(file1, SCALAR_RECORD[:2 * single_record_len])
+        ms_loader = MSDataLoader(summary_dir)
+        ms_loader.load()
+        ms_loader.save_index(index_cache)
+
+        write_file(file1, SCALAR_RECORD)
+        new_loader = MSDataLoader(summary_dir)
+        assert new_loader.load_index(index_cache)
+        tag = new_loader.get_events_data().list_tags_by_plugin('scalar')[0]
+        assert [tensor.step for tensor in new_loader.get_events_data().tensors(tag)] == [1, 3]
+        summary_parser = new_loader._parser_list[0]
+        assert summary_parser._summary_record_reader.offset == 2 * single_record_len
+
+        new_loader.load()
+        shutil.rmtree(summary_dir)
+        shutil.rmtree(cache_dir)
+        assert [tensor.step for tensor in new_loader.get_events_data().tensors(tag)] == [1, 3, 5]
+
+    @pytest.mark.usefixtures('crc_pass')
+    def test_load_index_with_modified_file(self):
+        """Test the index is ignored if a parsed file is rewritten."""
+        summary_dir = tempfile.mkdtemp()
+        cache_dir = tempfile.mkdtemp()
+        index_cache = SummaryIndexCache(cache_dir)
+        file1 = os.path.join(summary_dir, 'summary.01')
+        write_file(file1, SCALAR_RECORD)
+        ms_loader = MSDataLoader(summary_dir)
+        ms_loader.load()
+        ms_loader.save_index(index_cache)
+
+        write_file(file1, SCALAR_RECORD[:RECORD_LEN // 3])
+        new_loader = MSDataLoader(summary_dir)
+        is_restored = new_loader.load_index(index_cache)
+        shutil.rmtree(summary_dir)
+        shutil.rmtree(cache_dir)
+        assert not is_restored
+
     def test_filter_event_files(self):
         """Test filter_event_files function ok."""
         file_list = [
@@ -15,7 +15,11 @@
 """Test reservoir."""
 import unittest.mock as mock
 
+import pytest
+
 import mindinsight.datavisual.data_transform.reservoir as reservoir
+from mindinsight.datavisual.data_transform.events_data import _Tensor
+from mindinsight.datavisual.data_transform.histogram import Bucket, Histogram
 
 
 class TestHistogramReservoir:
@@ -39,3 +43,143 @@ class TestHistogramReservoir:
         my_reservoir.add_sample(sample2)
         samples = my_reservoir.samples()
         assert len(samples) == 2
+
+    def test_samples_after_remove(self):
+        """Test the visual range is updated after samples are removed."""
+        my_reservoir = reservoir.ReservoirFactory().create_reservoir(reservoir.PluginNameEnum.HISTOGRAM.value, size=10)
+        for step, (max_val, min_val) in enumerate([(1, 0), (4, 0)]):
+            value = mock.MagicMock()
+            value.count = 1
+            value.max = max_val
+            value.min = min_val
+            value.histogram = Histogram((Bucket(min_val, max_val - min_val, 1),), max_val, min_val, 1)
+            my_reservoir.add_sample(_Tensor(wall_time=0, step=step, value=value, filename='filename'))
+
+        samples = my_reservoir.samples()
+        assert samples[0].value.histogram.buckets() == ((0.0, 2.0, 1), (2.0, 2.0, 0))
+
+        my_reservoir.remove_sample(lambda sample: sample.step == 0)
+        samples = my_reservoir.samples()
+        assert samples[0].value.histogram.buckets() == ((0.0, 0.5, 1), (0.5, 0.5, 1))
+
+
+class TestScalarReservoir:
+    """Test scalar reservoir."""
+    @staticmethod
+    def _create_reservoir(size):
+        """Create a scalar reservoir."""
+        return reservoir.ReservoirFactory().create_reservoir(reservoir.PluginNameEnum.SCALAR.value, size=size)
+
+    @staticmethod
+    def _create_sample(step, value=0.0, filename='filename'):
+        """Create a scalar sample."""
+        return _Tensor(wall_time=float(step), step=step, value=value, filename=filename)
+
+    def test_add_sample_in_order(self):
+        """Test samples are sorted by step."""
+        my_reservoir = self._create_reservoir(size=0)
+        for step in (3, 1, 2, 5, 4):
+            my_reservoir.add_sample(self._create_sample(step, value=step * 0.5))
+
+        assert my_reservoir.last_step() == 5
+        samples = my_reservoir.samples()
+        assert [sample.step for sample in samples] == [1, 2, 3, 4, 5]
+        assert samples[0] == self._create_sample(1, value=0.5)
+
+        columns = my_reservoir.columns()
+        assert columns.steps.tolist() == [1, 2, 3, 4, 5]
+        assert columns.values.tolist() == [0.5, 1.0, 1.5, 2.0, 2.5]
+
+    def test_add_sample_with_size_limit(self):
+        """Test the number of samples is limited by the size."""
+        my_reservoir = self._create_reservoir(size=10)
+        for step in range(100):
+            my_reservoir.add_sample(self._create_sample(step))
+
+        steps = my_reservoir.columns().steps.tolist()
+        assert len(steps) == 10
+        assert steps == sorted(steps)
+        # The newly added sample is always preserved.
+        assert steps[-1] == 99
+
+    def test_columns_are_not_modified(self):
+        """Test the exported columns are read-only and not modified by the later samples."""
+        my_reservoir = self._create_reservoir(size=0)
+        for step in (1, 3):
+            my_reservoir.add_sample(self._create_sample(step, value=float(step)))
+        columns = my_reservoir.columns()
+        with pytest.raises(ValueError):
+            columns.values[0] = 2.0
+
+        my_reservoir.add_sample(self._create_sample(2, value=2.0))
+        assert columns.steps.tolist() == [1, 3]
+        assert columns.values.tolist() == [1.0, 3.0]
+        assert my_reservoir.columns().steps.tolist() == [1, 2, 3]
+
+    def test_remove_out_of_order_samples(self):
+        """Test removing out of order samples."""
+        my_reservoir = self._create_reservoir(size=0)
+        for step in (1, 2, 3, 4):
+            my_reservoir.add_sample(self._create_sample(step, filename='file1'))
+        my_reservoir.add_sample(self._create_sample(5, filename='file2'))
+        columns = my_reservoir.columns()
+
+        remove_size = my_reservoir.remove_out_of_order_samples('file2', 2)
+        assert remove_size == 3
+        assert my_reservoir.columns().steps.tolist() == [1, 5]
+        assert columns.steps.tolist() == [1, 2, 3, 4, 5]
+
+    def test_nbytes(self):
+        """Test the memory of scalar reservoir is the memory of its columns."""
+        my_reservoir = self._create_reservoir(size=10)
+        # Steps, wall times and values are 8 bytes, and file name codes are 4 bytes.
+        assert my_reservoir.nbytes() == 10 * 28
+
+    def test_columns_grow_up_to_size(self):
+        """Test the columns start small and grow geometrically up to the size."""
+        my_reservoir = self._create_reservoir(size=1000)
+        my_reservoir.add_sample(self._create_sample(0))
+        assert my_reservoir.nbytes() == 64 * 28
+
+        for step in range(1, 100):
+            my_reservoir.add_sample(self._create_sample(step))
+        assert my_reservoir.nbytes() == 128 * 28
+
+        for step in range(100, 3000):
+            my_reservoir.add_sample(self._create_sample(step))
+        assert my_reservoir.nbytes() == 1000 * 28
+        assert len(my_reservoir.columns().steps) == 1000
+
+
+class TestReservoir:
+    """Test reservoir."""
+    def test_nbytes(self):
+        """Test the memory of samples is counted by the `nbytes` of values."""
+        my_reservoir = reservoir.ReservoirFactory().create_reservoir(reservoir.PluginNameEnum.IMAGE.value, size=10)
+        assert my_reservoir.nbytes() == 0
+
+        for step in range(3):
+            image = mock.MagicMock(nbytes=1000)
+            my_reservoir.add_sample(_Tensor(wall_time=1, step=step, value=image, filename='filename'))
+        assert my_reservoir.nbytes() == 3 * (1000 + reservoir._SAMPLE_BYTES)
+
+    def test_version(self):
+        """Test the version increases when samples are changed."""
+        my_reservoir = reservoir.ReservoirFactory().create_reservoir(reservoir.PluginNameEnum.IMAGE.value, size=10)
+        versions = [my_reservoir.version]
+        my_reservoir.add_sample(_Tensor(wall_time=1, step=1, value=None, filename='filename'))
+        versions.append(my_reservoir.version)
+        my_reservoir.samples()
+        my_reservoir.remove_sample(lambda sample: sample.step != 1)
+        versions.append(my_reservoir.version)
+        assert versions == sorted(set(versions))
+
+        # The version is not changed if no sample is removed.
+        my_reservoir.remove_sample(lambda sample: sample.step != 1)
+        assert my_reservoir.version == versions[-1]
+
+        scalar_reservoir = reservoir.ReservoirFactory().create_reservoir(reservoir.PluginNameEnum.SCALAR.value, size=10)
+        assert scalar_reservoir.version > versions[-1]
+        version = scalar_reservoir.version
+        scalar_reservoir.add_sample(_Tensor(wall_time=1, step=1, value=1.0, filename='filename'))
+        assert scalar_reservoir.version > version
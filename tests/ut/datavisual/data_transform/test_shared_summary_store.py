@@ -0,0 +1,132 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Function:
+    Test mindinsight.datavisual.data_transform.shared_summary_store.
+Usage:
+    pytest tests/ut/datavisual
+"""
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mindinsight.datavisual.data_transform import data_loader
+from mindinsight.datavisual.data_transform import shared_summary_store
+from mindinsight.datavisual.data_transform import summary_record_reader
+from mindinsight.datavisual.data_transform.data_loader import DataLoader
+from mindinsight.datavisual.data_transform.shared_summary_store import SharedSummaryStore
+
+from .test_ms_data_loader import SCALAR_RECORD, write_file
+
+
+@patch.object(shared_summary_store.settings, 'WORKERS', 2)
+class TestSharedSummaryStore:
+    """Test shared summary store."""
+    _store_dir = ''
+
+    def setup_method(self):
+        """Run before method."""
+        self._store_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Run after method."""
+        shutil.rmtree(self._store_dir)
+
+    @pytest.fixture(scope="function")
+    def crc_pass(self):
+        """Mock the crc to pass the check."""
+        summary_record_reader.crc32.CheckValueAgainstData = Mock(return_value=True)
+
+    def test_elect_loader_worker(self):
+        """Test only one store becomes the loader worker."""
+        loader_store = SharedSummaryStore(self._store_dir)
+        reader_store = SharedSummaryStore(self._store_dir)
+        assert not loader_store.is_reader()
+        assert reader_store.is_reader()
+        assert not loader_store.is_reader()
+
+        # The reader takes over loading after the loader worker exits, once the interval of attempts passes.
+        loader_store._lock_file.close()
+        with patch.object(shared_summary_store.os, 'makedirs') as mock_makedirs:
+            assert reader_store.is_reader()
+        mock_makedirs.assert_not_called()
+        next_time = time.time() + shared_summary_store.settings.SUMMARY_PUBLISH_INTERVAL
+        with patch.object(shared_summary_store.time, 'time', return_value=next_time):
+            assert not reader_store.is_reader()
+        reader_store._lock_file.close()
+
+    def test_disabled_with_single_worker(self):
+        """Test the store is not used if there is only one worker."""
+        with patch.object(shared_summary_store.settings, 'WORKERS', 1):
+            store = SharedSummaryStore(self._store_dir)
+            assert not store.enabled
+            assert not store.is_reader()
+        assert not os.listdir(self._store_dir)
+
+    def test_request_train_jobs(self):
+        """Test train jobs requested by reader workers are popped by the loader worker once."""
+        store = SharedSummaryStore(self._store_dir)
+        assert store.pop_requested_train_jobs() == []
+
+        store.request_train_job('./job0')
+        store.request_train_job('./job0')
+        assert store.pop_requested_train_jobs() == ['./job0']
+        assert store.pop_requested_train_jobs() == []
+
+    @pytest.mark.usefixtures('crc_pass')
+    def test_publish_image_blob_keys(self):
+        """Test the loader worker gets the image blob keys published by the alive reader workers."""
+        loader_store = SharedSummaryStore(self._store_dir)
+        reader_store = SharedSummaryStore(self._store_dir)
+        assert loader_store.get_published_image_blob_keys() == set()
+        reader_store.publish_image_blob_keys({'key1', 'key2'})
+        assert loader_store.get_published_image_blob_keys() == {'key1', 'key2'}
+
+        with patch.object(shared_summary_store, '_is_process_alive', return_value=False):
+            assert loader_store.get_published_image_blob_keys() == set()
+        assert loader_store.get_published_image_blob_keys() == set()
+
+    def test_reader_restores_published_data(self):
+        """Test the data published by the loader worker is restored by reader workers without parsing."""
+        summary_dir = tempfile.mkdtemp()
+        single_record_len = len(SCALAR_RECORD) // 3
+        write_file(os.path.join(summary_dir, 'summary.01'), SCALAR_RECORD[:2 * single_record_len])
+        loader_store = SharedSummaryStore(self._store_dir)
+        reader_store = SharedSummaryStore(self._store_dir)
+        assert not loader_store.is_reader()
+
+        with patch.object(data_loader, 'SHARED_SUMMARY_STORE', loader_store):
+            loader = DataLoader(summary_dir)
+            assert loader.load()
+            loader.save_index()
+
+        with patch.object(data_loader, 'SHARED_SUMMARY_STORE', reader_store):
+            reader = DataLoader(summary_dir)
+            with patch.object(data_loader.MSDataLoader, 'load') as mock_load:
+                assert reader.load()
+                mock_load.assert_not_called()
+            events_data = reader.get_events_data()
+            tag = events_data.list_tags_by_plugin('scalar')[0]
+            assert [tensor.step for tensor in events_data.tensors(tag)] == [1, 3]
+            # The data is not restored again until it is published again.
+            assert reader.load()
+            assert reader.get_events_data() is events_data
+
+        loader_store._lock_file.close()
+        shutil.rmtree(summary_dir)
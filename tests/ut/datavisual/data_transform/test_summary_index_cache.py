@@ -0,0 +1,73 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Function:
+    Test mindinsight.datavisual.data_transform.summary_index_cache.
+Usage:
+    pytest tests/ut/datavisual
+"""
+import os
+import shutil
+import tempfile
+
+from mindinsight.datavisual.data_transform.summary_index_cache import SummaryIndexCache
+
+
+class TestSummaryIndexCache:
+    """Test summary index cache."""
+    _cache_dir = ''
+    _summary_dir = ''
+
+    def setup_method(self):
+        """Run before method."""
+        self._cache_dir = tempfile.mkdtemp()
+        self._summary_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Run after method."""
+        shutil.rmtree(self._cache_dir)
+        shutil.rmtree(self._summary_dir)
+
+    def test_save_and_load(self):
+        """Test the saved index can be loaded."""
+        index_cache = SummaryIndexCache(self._cache_dir)
+        index = dict(parser_states=[dict(latest_filename='summary.01', offset=10)])
+        index_cache.save(self._summary_dir, index)
+        assert index_cache.load(self._summary_dir) == index
+
+        index_files = os.listdir(self._cache_dir)
+        assert len(index_files) == 1
+        assert not index_files[0].endswith('.tmp')
+
+    def test_load_without_index(self):
+        """Test loading the index of a summary directory which has not been saved."""
+        index_cache = SummaryIndexCache(self._cache_dir)
+        assert index_cache.load(self._summary_dir) is None
+
+    def test_load_broken_index(self):
+        """Test a broken index file is ignored."""
+        index_cache = SummaryIndexCache(self._cache_dir)
+        index_cache.save(self._summary_dir, dict())
+        index_path = os.path.join(self._cache_dir, os.listdir(self._cache_dir)[0])
+        with open(index_path, 'wb') as index_file:
+            index_file.write(b'broken')
+        assert index_cache.load(self._summary_dir) is None
+
+    def test_remove(self):
+        """Test removing the index."""
+        index_cache = SummaryIndexCache(self._cache_dir)
+        index_cache.save(self._summary_dir, dict())
+        index_cache.remove(self._summary_dir)
+        assert index_cache.load(self._summary_dir) is None
@@ -0,0 +1,107 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Function:
+    Test mindinsight.datavisual.data_transform.summary_record_reader.
+Usage:
+    pytest tests/ut/datavisual
+"""
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock
+
+import pytest
+
+from mindinsight.datavisual.common.exceptions import CRCFailedError
+from mindinsight.datavisual.data_transform import summary_record_reader
+from mindinsight.datavisual.data_transform.summary_record_reader import SummaryRecordReader
+from mindinsight.datavisual.proto_files import mindinsight_summary_pb2 as summary_pb2
+
+from .test_ms_data_loader import SCALAR_RECORD, write_file
+
+# Every scalar record in `SCALAR_RECORD` has the same length.
+SINGLE_RECORD_LEN = len(SCALAR_RECORD) // 3
+
+
+class TestSummaryRecordReader:
+    """Test summary record reader."""
+    _summary_dir = ''
+
+    def setup_method(self):
+        """Run before method."""
+        self._summary_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Run after method."""
+        shutil.rmtree(self._summary_dir)
+
+    @pytest.fixture(scope="function")
+    def crc_pass(self):
+        """Mock the crc to pass the check."""
+        summary_record_reader.crc32.CheckValueAgainstData = Mock(return_value=True)
+
+    @pytest.fixture(scope="function")
+    def crc_fail(self):
+        """Mock the crc to fail the check."""
+        summary_record_reader.crc32.CheckValueAgainstData = Mock(return_value=False)
+
+    @pytest.mark.usefixtures('crc_pass')
+    def test_records_success(self):
+        """Test iterating all records with offsets."""
+        file_path = os.path.join(self._summary_dir, 'summary.01')
+        write_file(file_path, SCALAR_RECORD)
+        reader = SummaryRecordReader(file_path)
+        records = list(reader.records())
+        reader.close()
+
+        assert [offset for offset, _ in records] == [0, SINGLE_RECORD_LEN, 2 * SINGLE_RECORD_LEN]
+        assert reader.offset == len(SCALAR_RECORD)
+        steps = [summary_pb2.Event.FromString(event).step for _, event in records]
+        assert steps == [1, 3, 5]
+
+    @pytest.mark.usefixtures('crc_pass')
+    def test_read_truncated_record(self):
+        """Test the truncated record is read again after the file grows."""
+        file_path = os.path.join(self._summary_dir, 'summary.01')
+        write_file(file_path, SCALAR_RECORD[:SINGLE_RECORD_LEN + 20])
+        reader = SummaryRecordReader(file_path)
+        assert reader.read_record() is not None
+        assert reader.read_record() is None
+        assert reader.offset == SINGLE_RECORD_LEN
+
+        write_file(file_path, SCALAR_RECORD)
+        assert len(list(reader.records())) == 2
+        assert reader.offset == len(SCALAR_RECORD)
+        reader.close()
+
+    @pytest.mark.usefixtures('crc_fail')
+    def test_read_record_with_crc_fail(self):
+        """Test the offset is kept when crc check fails."""
+        file_path = os.path.join(self._summary_dir, 'summary.01')
+        write_file(file_path, SCALAR_RECORD)
+        reader = SummaryRecordReader(file_path)
+        with pytest.raises(CRCFailedError):
+            reader.read_record()
+        assert reader.offset == 0
+        reader.close()
+
+    def test_read_empty_file(self):
+        """Test reading an empty file."""
+        file_path = os.path.join(self._summary_dir, 'summary.01')
+        write_file(file_path, b'')
+        reader = SummaryRecordReader(file_path)
+        assert reader.read_record() is None
+        reader.close()
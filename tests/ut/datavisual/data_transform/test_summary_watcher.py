@@ -24,8 +24,11 @@ import os
 import random
 import shutil
 import tempfile
+from unittest.mock import patch
 
-from mindinsight.datavisual.data_transform.summary_watcher import SummaryWatcher
+import pytest
+
+from mindinsight.datavisual.data_transform.summary_watcher import SummaryWatcher, IncrementalSummaryWatcher
 
 
 def gen_directories_and_files(summary_base_dir, file_count, directory_count):
@@ -115,3 +118,67 @@ class TestSummaryWatcher:
         summaries = summary_watcher.list_summaries(summary_base_dir, './\x00')
         assert not summaries
         shutil.rmtree(summary_base_dir)
+
+
+class TestIncrementalSummaryWatcher:
+    """Test incremental summary watcher."""
+
+    def setup_method(self):
+        """Run before method."""
+        self._summary_base_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Run after method."""
+        shutil.rmtree(self._summary_base_dir)
+
+    @pytest.mark.parametrize('use_inotify', [False, True])
+    def test_list_summary_directories(self, use_inotify):
+        """Test the result is the same as full scanning."""
+        gen_directories_and_files(self._summary_base_dir, file_count=3, directory_count=3)
+
+        summary_watcher = IncrementalSummaryWatcher(use_inotify=use_inotify)
+        expected = SummaryWatcher().list_summary_directories(self._summary_base_dir)
+        assert summary_watcher.list_summary_directories(self._summary_base_dir) == expected
+        # Only scan the changed directories at the second time.
+        with patch.object(summary_watcher, '_scan_directory', wraps=summary_watcher._scan_directory) as mocked_scan:
+            assert summary_watcher.list_summary_directories(self._summary_base_dir) == expected
+            mocked_scan.assert_not_called()
+        summary_watcher.close()
+
+    @pytest.mark.parametrize('use_inotify', [False, True])
+    def test_scan_changes(self, use_inotify):
+        """Test scanning the changes of summary directories."""
+        gen_directories_and_files(self._summary_base_dir, file_count=1, directory_count=2)
+        summary_watcher = IncrementalSummaryWatcher(use_inotify=use_inotify)
+        changes = summary_watcher.scan_changes(self._summary_base_dir)
+        assert sorted(directory['relative_path'] for directory in changes.updated) == ['./', './run', './run0']
+        assert not changes.removed
+
+        shutil.rmtree(os.path.join(self._summary_base_dir, 'run0'))
+        summary_file = os.path.join(self._summary_base_dir, 'run', 'summary.1')
+        with open(summary_file, 'w'):
+            pass
+        # Make sure the mtime of directory changes on file systems with coarse timestamps.
+        os.utime(os.path.join(self._summary_base_dir, 'run'), ns=(0, 0))
+        changes = summary_watcher.scan_changes(self._summary_base_dir)
+        assert [directory['relative_path'] for directory in changes.updated] == ['./run']
+        assert changes.updated[0]['summary_files'] == 2
+        assert changes.removed == ['./run0']
+
+        # The update time comes from the summary file with the latest timestamp in file name.
+        os.utime(summary_file, (0, 0))
+        changes = summary_watcher.scan_changes(self._summary_base_dir)
+        assert not changes.updated
+        assert not changes.removed
+
+        latest_file = [name for name in os.listdir(os.path.join(self._summary_base_dir, 'run'))
+                       if name.startswith('prefix')][0]
+        os.utime(os.path.join(self._summary_base_dir, 'run', latest_file), (0, 0))
+        changes = summary_watcher.scan_changes(self._summary_base_dir)
+        assert [directory['relative_path'] for directory in changes.updated] == ['./run']
+        assert changes.updated[0]['update_time'] == datetime.datetime.fromtimestamp(0).astimezone()
+
+        summary_watcher.forget('./run')
+        changes = summary_watcher.scan_changes(self._summary_base_dir)
+        assert [directory['relative_path'] for directory in changes.updated] == ['./run']
+        summary_watcher.close()
@@ -16,8 +16,11 @@
 import unittest.mock as mock
 
 import numpy as np
+import pytest
 
 from mindinsight.datavisual.data_transform import tensor_container as tensor
+from mindinsight.datavisual.proto_files import mindinsight_anf_ir_pb2 as anf_ir_pb2
+from mindinsight.utils.exceptions import ParamValueError
 from mindinsight.utils.tensor import TensorUtils
 
 
@@ -26,14 +29,63 @@ class TestTensorContainer:
 
     def test_get_ndarray(self):
         """Tests get ndarray."""
-        mocked_input = mock.MagicMock()
-        mocked_input.float_data = [1, 2, 3, 4]
-        mocked_input.dims = [2, 2]
-        tensor_container = tensor.TensorContainer(mocked_input)
-        result = tensor_container.get_ndarray(mocked_input.float_data)
+        tensor_message = anf_ir_pb2.TensorProto(dims=[2, 2], data_type=anf_ir_pb2.DT_FLOAT32, float_data=[1, 2, 3, 4])
+        tensor_container = tensor.TensorContainer(tensor_message)
+        result = tensor_container.get_ndarray(tensor_message.float_data)
         for res_array, literal_array in zip(result, [[1, 2], [3, 4]]):
             assert all(res_array == literal_array)
 
+    @pytest.mark.parametrize('implementation', ['python', 'cpp'])
+    def test_decode_float_data(self, implementation):
+        """Tests decoding float data with different protobuf implementations."""
+        tensor_message = anf_ir_pb2.TensorProto(dims=[2, 2], data_type=anf_ir_pb2.DT_FLOAT32,
+                                                float_data=[1.5, 2, float('NAN'), 4])
+        with mock.patch.object(tensor.api_implementation, 'Type', return_value=implementation):
+            tensor_container = tensor.TensorContainer(tensor_message)
+        assert tensor_container.size == 4
+        assert tensor_container.ndarray.dtype == np.float64
+        np.testing.assert_array_equal(tensor_container.ndarray, [[1.5, 2], [float('NAN'), 4]])
+        assert (tensor_container.max, tensor_container.min, tensor_container.count) == (4, 1.5, 3)
+
+    def test_decode_raw_data(self):
+        """Tests decoding raw data lazily."""
+        raw_data = np.array([[1, -2, 3]], dtype='<i2').tobytes()
+        tensor_message = anf_ir_pb2.TensorProto(dims=[1, 3], data_type=anf_ir_pb2.DT_INT16, raw_data=raw_data)
+        with mock.patch.object(TensorUtils, 'get_statistics_from_tensor') as mocked_get_statistics:
+            tensor_container = tensor.TensorContainer(tensor_message)
+        mocked_get_statistics.assert_not_called()
+        assert tensor_container.dims == (1, 3)
+        assert tensor_container.ndarray.dtype == np.int64
+        np.testing.assert_array_equal(tensor_container.ndarray, [[1, -2, 3]])
+        assert tensor_container.stats.max == 3
+
+    def test_histogram_keeps_packed_data(self):
+        """Tests the data is not copied from raw data, and it is kept packed after the histogram is computed."""
+        raw_data = np.arange(6, dtype='<f4').tobytes()
+        tensor_message = anf_ir_pb2.TensorProto(dims=[2, 3], data_type=anf_ir_pb2.DT_FLOAT32, raw_data=raw_data)
+        tensor_container = tensor.TensorContainer(tensor_message)
+        assert np.shares_memory(tensor_container._buffer, np.frombuffer(tensor_message.raw_data, dtype=np.uint8))
+        nbytes = tensor_container.nbytes
+
+        histogram = tensor_container.histogram
+        assert tensor_container.count == 6
+        assert tensor_container.stats.max == 5
+        assert tensor_container.nbytes == nbytes + histogram.nbytes
+        assert tensor_container.ndarray.tolist() == [[0, 1, 2], [3, 4, 5]]
+
+    def test_decode_int_tensor_in_float_data(self):
+        """Tests decoding integer tensor whose data is stored in float data."""
+        tensor_message = anf_ir_pb2.TensorProto(dims=[2, 2], data_type=anf_ir_pb2.DT_INT32, float_data=[1, -2, 3, 4])
+        tensor_container = tensor.TensorContainer(tensor_message)
+        np.testing.assert_array_equal(tensor_container.ndarray, [[1, -2], [3, 4]])
+        assert (tensor_container.max, tensor_container.min) == (4, -2)
+
+    def test_decode_with_wrong_dims(self):
+        """Tests decoding tensor whose data does not match the dims."""
+        tensor_message = anf_ir_pb2.TensorProto(dims=[2, 2], data_type=anf_ir_pb2.DT_FLOAT32, float_data=[1, 2, 3])
+        with pytest.raises(ParamValueError):
+            tensor.TensorContainer(tensor_message)
+
     def test_get_statistics_from_tensor(self):
         """Tests get statistics from tensor."""
         ndarray = np.array([1, 2, 3, 4, 5, float('-INF'), float('INF'), float('NAN')]).reshape(
@@ -29,6 +29,7 @@ from mindinsight.datavisual.common.exceptions import ScalarNotExistError
 from mindinsight.datavisual.data_transform import data_manager
 from mindinsight.datavisual.processors.scalars_processor import ScalarsProcessor
 from mindinsight.datavisual.utils import crc32
+from mindinsight.utils.exceptions import ParamValueError
 
 from ....utils.log_operations import LogOperations
 from ....utils.tools import delete_files_or_dirs
@@ -128,3 +129,18 @@ class TestScalarsProcessor:
             assert recv_values.get('wall_time') == expected_values.get('wall_time')
             assert recv_values.get('step') == expected_values.get('step')
             assert abs(recv_values.get('value') - expected_values.get('value')) < 1e-6
+
+    @pytest.mark.usefixtures('load_scalar_record')
+    def test_get_scalars_columnar_with_max_points(self):
+        """Get downsampled scalars in columns."""
+        scalar_processor = ScalarsProcessor(self._mock_data_manager)
+        scalars = scalar_processor.get_scalars([self._train_id], [self._complete_tag_name], max_points=3,
+                                               columnar=True)
+        scalar = scalars[0]
+
+        assert scalar['steps'] == [metadata['step'] for metadata in self._scalars_metadata]
+        assert scalar['wall_times'] == [metadata['wall_time'] for metadata in self._scalars_metadata]
+        assert len(scalar['values']) == len(self._scalars_metadata)
+
+        with pytest.raises(ParamValueError):
+            scalar_processor.get_scalars([self._train_id], [self._complete_tag_name], max_points=2)
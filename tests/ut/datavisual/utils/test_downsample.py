@@ -0,0 +1,81 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Function:
+    Test downsampling of series.
+Usage:
+    pytest tests/ut/datavisual
+"""
+import numpy as np
+import pytest
+
+from mindinsight.datavisual.utils.downsample import downsample_indexes, lttb_indexes, min_max_indexes
+from mindinsight.utils.exceptions import ParamValueError
+
+
+def naive_lttb_indexes(x, y, max_points):
+    """Downsample by LTTB point by point, with the same buckets as `lttb_indexes`."""
+    count = len(x)
+    edges = np.linspace(1, count - 1, max_points - 1).astype(np.int64).tolist() + [count]
+    indexes = [0]
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_start, next_end = end, edges[bucket + 2] if bucket + 2 < max_points - 1 else count
+        avg_x = sum(x[next_start:next_end]) / (next_end - next_start)
+        avg_y = sum(y[next_start:next_end]) / (next_end - next_start)
+        prev = indexes[-1]
+        areas = [abs((x[prev] - avg_x) * (y[i] - y[prev]) - (x[prev] - x[i]) * (avg_y - y[prev]))
+                 for i in range(start, end)]
+        indexes.append(start + areas.index(max(areas)))
+    indexes.append(count - 1)
+    return indexes
+
+
+class TestDownsample:
+    """Test downsampling of series."""
+
+    @pytest.mark.parametrize('count, max_points', [(10, 3), (1000, 100), (997, 50)])
+    def test_lttb_indexes(self, count, max_points):
+        """Test LTTB keeps the same points as the point by point implementation."""
+        x = np.arange(count) * 2
+        y = np.random.RandomState(0).normal(size=count).cumsum()
+        indexes = lttb_indexes(x, y, max_points)
+        assert indexes.tolist() == naive_lttb_indexes(x.tolist(), y.tolist(), max_points)
+
+    def test_min_max_indexes(self):
+        """Test the min and max points are kept."""
+        y = np.random.RandomState(0).normal(size=1000)
+        indexes = min_max_indexes(y, 100)
+        assert len(indexes) <= 100
+        assert np.all(np.diff(indexes) > 0)
+        assert np.argmax(y) in indexes
+        assert np.argmin(y) in indexes
+
+    @pytest.mark.parametrize('method', ['lttb', 'min_max'])
+    def test_downsample_with_nan(self, method):
+        """Test NaN and Inf points are always kept."""
+        y = np.random.RandomState(0).normal(size=100)
+        y[[5, 50]] = [np.nan, np.inf]
+        indexes = downsample_indexes(np.arange(100), y, 10, method)
+        assert 5 in indexes
+        assert 50 in indexes
+        assert len(indexes) <= 12
+
+    def test_downsample_with_invalid_params(self):
+        """Test downsampling with invalid method or max points."""
+        with pytest.raises(ParamValueError):
+            downsample_indexes(np.arange(10), np.arange(10), 2)
+        with pytest.raises(ParamValueError):
+            downsample_indexes(np.arange(10), np.arange(10), 5, 'mean')
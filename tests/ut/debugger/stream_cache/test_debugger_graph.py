@@ -0,0 +1,45 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the debugger graph."""
+import pytest
+
+from mindinsight.debugger.common.exceptions.exceptions import DebuggerParamValueError
+from mindinsight.debugger.stream_cache.debugger_graph import DebuggerGraph
+from tests.utils.graph_generator import generate_debugger_graph, get_bfs_order_by_scan
+
+
+class TestDebuggerGraph:
+    """Test the class of `DebuggerGraph`."""
+
+    @pytest.mark.parametrize('input_count, window, isolated_count', [(1, 1, 0), (2, 50, 0), (3, 10, 30)])
+    def test_get_bfs_order(self, input_count, window, isolated_count):
+        """Test the BFS order is the same as the one got by scanning the traversed nodes."""
+        graph = generate_debugger_graph(2000, input_count, window, isolated_count)
+        bfs_order = graph.get_bfs_order()
+        assert bfs_order == get_bfs_order_by_scan(graph)
+        assert len(bfs_order) == 2000 + isolated_count
+        assert bfs_order[0] == graph.get_default_root().name
+
+    def test_get_bfs_graph_with_traversed_nodes(self):
+        """Test the nodes traversed before are skipped when the visited set is not given."""
+        graph = generate_debugger_graph(10, input_count=1, window=1, isolated_count=1)
+        bfs_order = ['Default/network/Add-op0']
+        graph.get_bfs_graph('Default/network/Add-op1', bfs_order)
+        assert bfs_order == ['Default/network/Add-op{}'.format(index) for index in range(10)]
+
+    def test_get_bfs_order_without_root(self):
+        """Test getting the BFS order of the graph without the root node."""
+        with pytest.raises(DebuggerParamValueError):
+            DebuggerGraph().get_bfs_order()
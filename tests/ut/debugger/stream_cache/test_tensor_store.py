@@ -0,0 +1,156 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the tensor store of debugger."""
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from mindinsight.debugger.proto.ms_graph_pb2 import DataType, TensorProto
+from mindinsight.debugger.stream_cache import tensor_store
+from mindinsight.debugger.stream_cache.tensor import OpTensor
+from mindinsight.debugger.stream_cache.tensor_store import TensorStore
+
+# The size of each tensor value is 1024 Bytes, and the size of its `.npy` file is 1152 Bytes.
+TENSOR_SIZE = 256
+TENSOR_BYTES = 1024
+FILE_BYTES = 1152
+
+
+def create_tensor(index):
+    """Create the tensor whose values are all the index."""
+    value = np.full(TENSOR_SIZE, index, dtype=np.float32)
+    tensor_proto = TensorProto(node_name='Default/Add-op{}'.format(index), slot='0',
+                               data_type=DataType.Value('DT_FLOAT32'), dims=[TENSOR_SIZE],
+                               tensor_content=value.tobytes())
+    return OpTensor(tensor_proto)
+
+
+class TestTensorStore:
+    """Test the class of `TensorStore`."""
+
+    def setup_method(self):
+        """Initialization before test case execution."""
+        self._store_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Clean up after test case execution."""
+        shutil.rmtree(self._store_dir, ignore_errors=True)
+
+    @staticmethod
+    def _put_tensors(store, stop, start=0):
+        """Put the tensors of the indexes in the range into the store, the step of tensors is 1."""
+        for index in range(start, stop):
+            store.put('tensor{}'.format(index), 1, create_tensor(index))
+
+    def _scratch_dirs(self):
+        """Get the scratch directories in the store directory."""
+        return os.listdir(self._store_dir)
+
+    def test_memory_limit(self):
+        """Test the tensors read least recently are spilled when the memory limit is exceeded."""
+        store = TensorStore(memory_limit=2 * TENSOR_BYTES, disk_limit=10 * FILE_BYTES, store_dir=self._store_dir)
+        self._put_tensors(store, 2)
+        assert store.nbytes == 2 * TENSOR_BYTES
+        assert store.disk_usage == 0
+        assert not self._scratch_dirs()
+
+        store.get('tensor0', 1)
+        self._put_tensors(store, 4, start=2)
+        assert store.nbytes == 2 * TENSOR_BYTES
+        assert store.disk_usage == 2 * FILE_BYTES
+        assert isinstance(store.get('tensor1', 1).numpy_value, np.memmap)
+        assert isinstance(store.get('tensor0', 1).numpy_value, np.memmap)
+        assert not isinstance(store.get('tensor3', 1).numpy_value, np.memmap)
+        for index in range(4):
+            assert np.all(store.get('tensor{}'.format(index), 1).numpy_value == index)
+
+    def test_disk_limit(self):
+        """Test the spilled tensors read least recently are removed when the disk limit is exceeded."""
+        store = TensorStore(memory_limit=TENSOR_BYTES, disk_limit=2 * FILE_BYTES, store_dir=self._store_dir)
+        self._put_tensors(store, 4)
+        assert store.nbytes == TENSOR_BYTES
+        assert store.disk_usage == 2 * FILE_BYTES
+        assert store.get('tensor0', 1) is None
+        for index in (1, 2):
+            tensor = store.get('tensor{}'.format(index), 1)
+            assert isinstance(tensor.numpy_value, np.memmap)
+            assert np.all(tensor.numpy_value == index)
+        scratch_dir = os.path.join(self._store_dir, self._scratch_dirs()[0])
+        assert len(os.listdir(scratch_dir)) == 2
+
+    def test_zero_disk_limit(self):
+        """Test the tensors are removed instead of spilled when the disk limit is 0."""
+        store = TensorStore(memory_limit=2 * TENSOR_BYTES, disk_limit=0, store_dir=self._store_dir)
+        self._put_tensors(store, 3)
+        assert store.nbytes == 2 * TENSOR_BYTES
+        assert store.disk_usage == 0
+        assert store.get('tensor0', 1) is None
+        assert store.get('tensor2', 1) is not None
+        assert not self._scratch_dirs()
+
+    def test_put_same_key(self):
+        """Test the tensor of the same name and step is replaced."""
+        store = TensorStore(memory_limit=TENSOR_BYTES, disk_limit=10 * FILE_BYTES, store_dir=self._store_dir)
+        self._put_tensors(store, 2)
+        store.put('tensor0', 1, create_tensor(5))
+        assert store.disk_usage == FILE_BYTES
+        assert np.all(store.get('tensor0', 1).numpy_value == 5)
+
+    def test_clear(self):
+        """Test all tensors and the scratch directory are removed by clear."""
+        store = TensorStore(memory_limit=TENSOR_BYTES, disk_limit=10 * FILE_BYTES, store_dir=self._store_dir)
+        self._put_tensors(store, 3)
+        assert len(self._scratch_dirs()) == 1
+
+        store.clear()
+        assert store.nbytes == 0
+        assert store.disk_usage == 0
+        assert store.get('tensor2', 1) is None
+        assert not self._scratch_dirs()
+
+        self._put_tensors(store, 2)
+        assert store.disk_usage == FILE_BYTES
+        assert len(self._scratch_dirs()) == 1
+
+    def test_remove_stale_scratch_dirs(self):
+        """Test the scratch directories of the processes which no longer exist are removed."""
+        # The pid is larger than the max pid of system, so the process never exists.
+        stale_dir = os.path.join(self._store_dir, '999999999-stale')
+        alive_dir = os.path.join(self._store_dir, '{}-alive'.format(os.getppid()))
+        other_dir = os.path.join(self._store_dir, 'other')
+        for dir_path in (stale_dir, alive_dir, other_dir):
+            os.makedirs(dir_path)
+
+        store = TensorStore(memory_limit=TENSOR_BYTES, disk_limit=10 * FILE_BYTES, store_dir=self._store_dir)
+        self._put_tensors(store, 2)
+        assert not os.path.exists(stale_dir)
+        assert os.path.exists(alive_dir)
+        assert os.path.exists(other_dir)
+        assert len(self._scratch_dirs()) == 3
+
+    def test_remove_scratch_dir_at_exit(self, monkeypatch):
+        """Test the scratch directory is removed at exit."""
+        exit_funcs = []
+        monkeypatch.setattr(tensor_store.atexit, 'register', exit_funcs.append)
+        store = TensorStore(memory_limit=TENSOR_BYTES, disk_limit=10 * FILE_BYTES, store_dir=self._store_dir)
+        self._put_tensors(store, 2)
+        store.clear()
+        self._put_tensors(store, 2)
+        assert len(exit_funcs) == 1
+
+        exit_funcs[0]()
+        assert not self._scratch_dirs()
@@ -0,0 +1,128 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the event handler of debugger."""
+import threading
+import time
+from unittest import mock
+
+import pytest
+from flask import Flask
+
+from mindinsight.datavisual.common.error_handler import handle_mindinsight_error
+from mindinsight.debugger.common.exceptions.exceptions import DebuggerTooManyWaitingRequestsError
+from mindinsight.debugger.stream_handler.event_handler import EventHandler
+
+
+class _SmallEventHandler(EventHandler):
+    """The event handler whose cache is wrapped around after 3 events."""
+    max_limit = 3
+
+
+class _WaitingRequest(threading.Thread):
+    """A request waiting for the event in another thread."""
+
+    def __init__(self, handler, pos):
+        super(_WaitingRequest, self).__init__(daemon=True)
+        self._handler = handler
+        self._pos = pos
+        self.event = None
+
+    def run(self):
+        self.event = self._handler.get(self._pos)
+
+    def start_waiting(self):
+        """Start the request and return after it is waiting."""
+        waiting_count = self._handler._waiting_count
+        self.start()
+        while self._handler._waiting_count <= waiting_count:
+            time.sleep(0.001)
+
+
+class TestEventHandler:
+    """Test the class of `EventHandler`."""
+
+    def setup_method(self):
+        """Initialization before test case execution."""
+        self._handler = EventHandler()
+
+    def test_get_cached_events(self):
+        """Test the events in cache are got in the order of being put."""
+        for index in range(3):
+            self._handler.put({'index': index})
+        pos = '0'
+        for index in range(3):
+            event = self._handler.get(pos)
+            assert event['index'] == index
+            pos = event['metadata']['pos']
+        assert pos == self._handler.next_pos
+
+    def test_get_across_wrap_around(self):
+        """Test the events put before the cache is wrapped around are replayed by the pos of previous round."""
+        handler = _SmallEventHandler()
+        handler.put({'index': 0})
+        pos = handler.next_pos
+        for index in range(1, 4):
+            handler.put({'index': index})
+
+        events = []
+        for _ in range(3):
+            event = handler.get(pos)
+            events.append(event['index'])
+            pos = event['metadata']['pos']
+        assert events == [1, 2, 3]
+        assert pos == handler.next_pos
+
+    def test_wait_for_put(self):
+        """Test the waiting requests are woken by the new event."""
+        requests = [_WaitingRequest(self._handler, self._handler.next_pos) for _ in range(2)]
+        for request in requests:
+            request.start_waiting()
+        self._handler.put({'index': 0})
+        for request in requests:
+            request.join(timeout=5)
+            assert request.event['index'] == 0
+        assert self._handler._waiting_count == 0
+
+    def test_clean_during_wait(self):
+        """Test the waiting request gets the reset event if the cache is cleaned."""
+        self._handler.put({'index': 0})
+        request = _WaitingRequest(self._handler, self._handler.next_pos)
+        request.start_waiting()
+        self._handler.clean()
+        request.join(timeout=5)
+        assert request.event == {'metadata': {'pos': '0'}}
+
+    def test_wait_timeout(self):
+        """Test the pos is returned unchanged if there is no new event before timeout."""
+        pos = self._handler.next_pos
+        with mock.patch.object(EventHandler, 'wait_timeout', 0.01):
+            assert self._handler.get(pos) == {'metadata': {'pos': pos}}
+        assert self._handler._waiting_count == 0
+
+    def test_max_waiting(self):
+        """Test the requests beyond the limit are rejected with 429 and Retry-After."""
+        with mock.patch.object(EventHandler, 'max_waiting', 1):
+            request = _WaitingRequest(self._handler, self._handler.next_pos)
+            request.start_waiting()
+            with pytest.raises(DebuggerTooManyWaitingRequestsError) as exc_info:
+                self._handler.get(self._handler.next_pos)
+        self._handler.put({'index': 0})
+        request.join(timeout=5)
+
+        with Flask(__name__).test_request_context('/v1/mindinsight/debugger/poll_data'):
+            response, http_code = handle_mindinsight_error(exc_info.value)
+        assert http_code == 429
+        assert response.headers['Retry-After'] == str(EventHandler.retry_after)
+        assert response.get_json()['error_code'] == exc_info.value.error_code
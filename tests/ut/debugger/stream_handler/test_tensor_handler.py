@@ -0,0 +1,133 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the tensor handler of debugger."""
+import numpy as np
+
+from mindinsight.debugger.proto.ms_graph_pb2 import DataType, TensorProto
+from mindinsight.debugger.stream_handler.tensor_handler import TensorHandler
+
+NODE_NAME = 'Default/network/Add-op1'
+TENSOR_NAME = NODE_NAME + ':0'
+
+
+def create_tensor_value(value, prev=False):
+    """Create the tensor value message put by grpc server."""
+    tensor_proto = TensorProto(node_name=NODE_NAME, slot='0', data_type=DataType.Value('DT_FLOAT32'),
+                               dims=list(value.shape), tensor_content=value.astype(np.float32).tobytes(),
+                               iter='prev' if prev else '')
+    return {'step': 1, 'tensor_protos': [tensor_proto]}
+
+
+class TestTensorHandler:
+    """Test the class of `TensorHandler`."""
+
+    def setup_method(self):
+        """Initialization before test case execution."""
+        self._handler = TensorHandler()
+        self._handler.clean_tensors(1)
+
+    def test_get_data(self):
+        """Test getting the tensor value."""
+        self._handler.put(create_tensor_value(np.arange(6).reshape(2, 3)))
+        tensor_info = self._handler.get({'name': TENSOR_NAME})['tensor_value']
+        assert tensor_info['value'] == [[0, 1, 2], [3, 4, 5]]
+        assert 'pyramid' not in tensor_info
+
+    def test_put_chunked_tensor(self):
+        """Test the tensor sent in chunks is merged, decoded without copy, and its content is not kept in protos."""
+        value = np.arange(12, dtype=np.float32).reshape(3, 4)
+        content = value.tobytes()
+        chunk_size = 16
+        tensor_protos = [TensorProto(node_name=NODE_NAME, slot='0', data_type=DataType.Value('DT_FLOAT32'),
+                                     dims=[3, 4], tensor_content=content[begin:begin + chunk_size],
+                                     finished=begin + chunk_size >= len(content))
+                         for begin in range(0, len(content), chunk_size)]
+        self._handler.put({'step': 1, 'tensor_protos': tensor_protos})
+
+        tensor = self._handler.get_tensor_value_by_name(TENSOR_NAME)
+        np.testing.assert_array_equal(tensor.numpy_value, value)
+        # The value is a read-only view of the merged bytes instead of a copy.
+        assert not tensor.numpy_value.flags.owndata
+        assert not tensor.numpy_value.flags.writeable
+        assert all(not tensor_proto.tensor_content for tensor_proto in tensor_protos)
+        assert not tensor._tensor_proto.tensor_content
+
+    def test_get_overview(self):
+        """Test getting the statistics, histogram and min/max pyramid instead of the tensor value."""
+        value = np.arange(2048).reshape(32, 64)
+        value[0][0] = -1
+        self._handler.put(create_tensor_value(value))
+        tensor_info = self._handler.get({'name': TENSOR_NAME, 'detail': 'overview'})['tensor_value']
+        assert 'value' not in tensor_info
+        assert tensor_info['shape'] == [32, 64]
+        assert tensor_info['statistics']['min'] == -1
+        assert tensor_info['statistics']['max'] == 2047
+        assert tensor_info['statistics']['count'] == 2048
+        assert sum(bucket[2] for bucket in tensor_info['histogram']) == 2048
+
+        pyramid = tensor_info['pyramid']
+        assert [level['block_size'] for level in pyramid] == [4096, 1024, 256, 64, 16, 4]
+        assert len(pyramid[-1]['min']) == 512
+        assert pyramid[-1]['min'][:2] == [-1, 4]
+        assert pyramid[-1]['max'][:2] == [3, 7]
+        assert pyramid[0] == {'block_size': 4096, 'min': [-1], 'max': [2047]}
+
+    def test_get_overview_of_prev_step(self):
+        """Test the overview has `has_prev_step` field like the tensor value."""
+        self._handler.put(create_tensor_value(np.ones(4), prev=True))
+        self._handler.put(create_tensor_value(np.zeros(4)))
+        tensor_info = self._handler.get({'name': TENSOR_NAME, 'node_type': 'Parameter',
+                                         'detail': 'overview'})['tensor_value']
+        assert tensor_info['has_prev_step'] is True
+        assert tensor_info['statistics']['max'] == 0
+
+    def test_diff_cache(self):
+        """Test the reply of tensor comparison is cached until the tensors are updated."""
+        self._handler.put(create_tensor_value(np.ones(4), prev=True))
+        self._handler.put(create_tensor_value(np.arange(4)))
+        reply = self._handler.get_tensors_diff(TENSOR_NAME, None)
+        assert reply['tensor_value']['diff'] == [[1, 0, -1], [1, 1, 0], [1, 2, 1], [1, 3, 2]]
+        assert self._handler.get_tensors_diff(TENSOR_NAME, None) is reply
+
+        self._handler.put(create_tensor_value(np.zeros(4)))
+        reply = self._handler.get_tensors_diff(TENSOR_NAME, None)
+        assert reply['tensor_value']['diff'] == [[1, 0, -1]] * 4
+
+    def test_diff_cache_size(self):
+        """Test the replies cached earliest are removed when the cache is full."""
+        self._handler.put(create_tensor_value(np.ones(4), prev=True))
+        self._handler.put(create_tensor_value(np.arange(4)))
+        replies = [self._handler.get_tensors_diff(TENSOR_NAME, None, tolerance)
+                   for tolerance in range(TensorHandler.max_diff_cache_size + 1)]
+        assert self._handler.get_tensors_diff(TENSOR_NAME, None, 0) is not replies[0]
+        assert self._handler.get_tensors_diff(TENSOR_NAME, None, 2) is replies[2]
+
+    def test_diff_not_cached_when_updated(self):
+        """Test the reply is not cached if the tensors are updated during its calculation."""
+        self._handler.put(create_tensor_value(np.ones(4), prev=True))
+        self._handler.put(create_tensor_value(np.arange(4)))
+        calc_tensors_diff = self._handler._calc_tensors_diff
+
+        def calc_tensors_diff_with_update(*args):
+            reply = calc_tensors_diff(*args)
+            self._handler.put(create_tensor_value(np.zeros(4)))
+            return reply
+
+        self._handler._calc_tensors_diff = calc_tensors_diff_with_update
+        stale_reply = self._handler.get_tensors_diff(TENSOR_NAME, None)
+        self._handler._calc_tensors_diff = calc_tensors_diff
+        reply = self._handler.get_tensors_diff(TENSOR_NAME, None)
+        assert reply is not stale_reply
+        assert reply['tensor_value']['diff'] == [[1, 0, -1]] * 4
@@ -0,0 +1,47 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the grpc server of debugger."""
+from unittest.mock import MagicMock
+
+from mindinsight.debugger.common.utils import ServerStatus, Streams
+from mindinsight.debugger.debugger_grpc_server import DebuggerGrpcServer
+from mindinsight.debugger.proto.debug_grpc_pb2 import Chunk
+from mindinsight.debugger.proto.ms_graph_pb2 import GraphProto, NodeProto
+
+
+class TestDebuggerGrpcServer:
+    """Test the class of `DebuggerGrpcServer`."""
+
+    def setup_method(self):
+        """Initialization before test case execution."""
+        self._cache_store = MagicMock()
+        self._grpc_server = DebuggerGrpcServer(self._cache_store)
+
+    def test_send_graph_in_chunks(self):
+        """Test the graph sent in chunks is joined and deserialized."""
+        graph = GraphProto(name='graph_0')
+        for index in range(100):
+            graph.node.append(NodeProto(name='Default/Add-op{}'.format(index), op_type='Add'))
+        serial_graph = graph.SerializeToString()
+        chunk_size = len(serial_graph) // 7
+        chunks = [Chunk(buffer=serial_graph[begin:begin + chunk_size])
+                  for begin in range(0, len(serial_graph), chunk_size)]
+        assert len(chunks) > 1
+
+        self._grpc_server.SendGraph(iter(chunks), None)
+        graph_stream = self._cache_store.get_stream_handler(Streams.GRAPH)
+        received_graph = graph_stream.put.call_args[0][0]
+        assert received_graph == graph
+        assert self._grpc_server._status == ServerStatus.RECEIVE_GRAPH
@@ -18,6 +18,7 @@ import json
 import os
 from unittest import TestCase
 
+from mindinsight.profiler.analyser.analyser import AicoreDetailAnalyser
 from mindinsight.profiler.analyser.analyser_factory import AnalyserFactory
 from tests.ut.profiler import PROFILER_DIR
 
@@ -268,6 +269,71 @@ class TestAicoreDetailAnalyser(TestCase):
         result = self._analyser.query(condition)
         self.assertDictEqual(expect_result, result)
 
+    def test_query_success_7(self):
+        """Test the success of the querying function with range filter condition."""
+        detail_infos = get_detail_infos()
+        exec_times = sorted(item[2] for item in detail_infos)
+        low, high = exec_times[2], exec_times[6]
+        expect_result = {
+            'col_name': COL_NAMES,
+            'object': [item for item in detail_infos if low <= item[2] <= high],
+            'size': 5
+        }
+        condition = {
+            'filter_condition': {
+                'avg_execution_time': {
+                    'range': [low, high]
+                }
+            }
+        }
+        result = self._analyser.query(condition)
+        self.assertDictEqual(expect_result, result)
+
+    def test_query_range_with_none_cell(self):
+        """Test the rows whose values are not numbers do not match the range filter condition."""
+        analyser = AicoreDetailAnalyser(PROFILER_DIR, '1')
+        analyser._data[0][2] = None
+        analyser._data[1][2] = 'N/A'
+        detail_infos = get_detail_infos()[2:]
+        exec_times = sorted(item[2] for item in detail_infos)
+        low, high = exec_times[0], exec_times[-1]
+        condition = {
+            'filter_condition': {
+                'avg_execution_time': {
+                    'range': [low, high]
+                }
+            }
+        }
+        result = analyser.query(condition)
+        self.assertEqual(len(detail_infos), result['size'])
+        self.assertListEqual(detail_infos, result['object'])
+
+    def test_query_success_8(self):
+        """Test the querying function sorts the top rows the same as sorting all rows."""
+        for sort_name in ['avg_execution_time', 'op_type']:
+            for sort_type, reverse in [('descending', True), ('ascending', False)]:
+                detail_infos = get_detail_infos()
+                sort_index = COL_NAMES.index(sort_name)
+                detail_infos.sort(key=lambda item, index=sort_index: item[index], reverse=reverse)
+                for offset in range(3):
+                    expect_result = {
+                        'col_name': COL_NAMES,
+                        'object': detail_infos[3 * offset: 3 * (offset + 1)],
+                        'size': 10
+                    }
+                    condition = {
+                        'sort_condition': {
+                            'name': sort_name,
+                            'type': sort_type
+                        },
+                        'group_condition': {
+                            'limit': 3,
+                            'offset': offset
+                        }
+                    }
+                    result = self._analyser.query(condition)
+                    self.assertDictEqual(expect_result, result)
+
     def test_query_and_sort_by_op_type_1(self):
         """Test the success of the querying and sorting function by operator type."""
         detail_infos = get_detail_infos(indexes=[9, 0, 2, 1, 5, 3, 4])
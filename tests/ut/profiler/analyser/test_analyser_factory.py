@@ -0,0 +1,59 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the analyser factory module."""
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+from mindinsight.profiler.analyser.analyser import AicoreTypeAnalyser
+from mindinsight.profiler.analyser.analyser_factory import AnalyserFactory
+from tests.ut.profiler import PROFILER_DIR
+
+
+class TestAnalyserFactory(TestCase):
+    """Test the class of `AnalyserFactory`."""
+    def setUp(self) -> None:
+        """Initialization before test case execution."""
+        self._profiling_dir = tempfile.mkdtemp()
+        shutil.copy(os.path.join(PROFILER_DIR, 'aicore_intermediate_1_type.csv'), self._profiling_dir)
+        AnalyserFactory.instance()._cache.clear()
+
+    def tearDown(self) -> None:
+        """Clean up after test case execution."""
+        shutil.rmtree(self._profiling_dir)
+        AnalyserFactory.instance()._cache.clear()
+
+    @mock.patch.object(AicoreTypeAnalyser, '_load', autospec=True, side_effect=AicoreTypeAnalyser._load)
+    def test_get_analyser_from_cache(self, mock_load):
+        """Test the parsed profiling files are loaded once until they are changed."""
+        factory = AnalyserFactory.instance()
+        analyser = factory.get_analyser('aicore_type', self._profiling_dir, '1')
+        cached_analyser = factory.get_analyser('aicore_type', self._profiling_dir, '1')
+        assert mock_load.call_count == 1
+        assert cached_analyser is not analyser
+        assert cached_analyser.data is analyser.data
+
+        # The query state is not shared between the analysers.
+        result = analyser.query({'group_condition': {'limit': 1, 'offset': 0}})
+        cached_result = cached_analyser.query({})
+        assert len(result['object']) == 1
+        assert cached_result['object'] == analyser.data
+
+        file_path = os.path.join(self._profiling_dir, 'aicore_intermediate_1_type.csv')
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        factory.get_analyser('aicore_type', self._profiling_dir, '1')
+        assert mock_load.call_count == 2
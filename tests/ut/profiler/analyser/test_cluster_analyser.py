@@ -0,0 +1,92 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the cluster analyser module."""
+import csv
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+from mindinsight.profiler.analyser import cluster_analyser
+from mindinsight.profiler.analyser.cluster_analyser import ClusterAnalyser, analyse_device_step_trace
+from tests.ut.profiler import PROFILER_DIR
+
+DEVICE_IDS = ['0', '10']
+STEP_COUNT = 20
+
+
+def get_step_totals(device_id):
+    """Get the total time of each step of the device."""
+    file_path = os.path.join(PROFILER_DIR, 'step_trace_raw_{}_detail_time.csv'.format(device_id))
+    with open(file_path, 'r') as file:
+        csv_reader = csv.reader(file)
+        header = next(csv_reader)
+        index = header.index('total')
+        return [int(row[index]) for row in list(csv_reader)[:-1]]
+
+
+class TestClusterAnalyser(TestCase):
+    """Test the class of `ClusterAnalyser`."""
+
+    def setUp(self):
+        """Initialization before test case execution."""
+        self._analyser = ClusterAnalyser(PROFILER_DIR)
+
+    def test_query(self):
+        """Test querying the average step time of devices."""
+        result = self._analyser.query({
+            'sort_condition': {
+                'name': 'slowest_step_count',
+                'type': 'descending'
+            }
+        })
+        self.assertEqual(2, result['size'])
+        self.assertListEqual(['10', '0'], [row[0] for row in result['object']])
+        self.assertListEqual([STEP_COUNT, STEP_COUNT], [row[1] for row in result['object']])
+        self.assertEqual(STEP_COUNT, sum(row[-1] for row in result['object']))
+
+    def test_step_skew(self):
+        """Test the slowest device of each step."""
+        totals = {device_id: get_step_totals(device_id)[:STEP_COUNT] for device_id in DEVICE_IDS}
+        step_skew = self._analyser.step_skew
+        self.assertEqual(STEP_COUNT, len(step_skew))
+        for step, skew in enumerate(step_skew):
+            expect_slowest = max(DEVICE_IDS, key=lambda device_id, step=step: totals[device_id][step])
+            self.assertEqual(step + 1, skew['step_num'])
+            self.assertEqual(expect_slowest, skew['slowest_device_id'])
+            self.assertGreaterEqual(skew['slowest_time'], skew['fastest_time'])
+
+    def test_all_reduce_skew(self):
+        """Test the skew of all reduces among devices."""
+        reduce_names = set(analyse_device_step_trace(PROFILER_DIR, '0')['reduces'])
+        all_reduce_skew = self._analyser.all_reduce_skew
+        self.assertSetEqual(reduce_names, {skew['name'] for skew in all_reduce_skew})
+        for skew in all_reduce_skew:
+            self.assertGreaterEqual(skew['max_duration_skew'], skew['avg_duration_skew'])
+            self.assertIn(skew['most_longest_device_id'], DEVICE_IDS)
+
+    def test_analyse_device_without_step_trace(self):
+        """Test analysing the device which has no step trace file."""
+        self.assertIsNone(analyse_device_step_trace(PROFILER_DIR, '1'))
+
+    def test_analyse_devices_in_processes(self):
+        """Test devices are analysed by processes only if there are many devices, with the same results."""
+        with patch.object(ClusterAnalyser, '_submit_devices') as mock_submit_devices:
+            self.assertListEqual(DEVICE_IDS, [row[0] for row in ClusterAnalyser(PROFILER_DIR).data])
+        mock_submit_devices.assert_not_called()
+
+        with patch.object(cluster_analyser.settings, 'MIN_DEVICE_COUNT_ANALYSED_IN_PROCESSES', 2):
+            analyser = ClusterAnalyser(PROFILER_DIR)
+        self.assertListEqual(self._analyser.data, analyser.data)
+        self.assertListEqual(self._analyser.step_skew, analyser.step_skew)
@@ -0,0 +1,99 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the integrator module."""
+import csv
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from mindinsight.profiler.analyser.integrator import Integrator
+
+FRAMEWORK_HEADER = ['task_id', 'stream_id', 'block_dim', 'full_op_name', 'op_name', 'op_type', 'subgraph',
+                    'op_info']
+FRAMEWORK_ROWS = [
+    ['1', '1', '1', 'Default/Conv2D-op1', 'Conv2D-op1', 'Conv2D', 'Default', '{"input_0": {"shape": "1,3"}}'],
+    ['2', '1', '1', 'Default/Cast-op2', 'Cast-op2', 'Cast', 'Default', '{}'],
+    ['3', '1', '1', 'Default/Conv2D-op3', 'Conv2D-op3', 'Conv2D', 'Default', '{}'],
+    ['4', '1', '1', 'Default/a,b-op4', 'a,b-op4', 'Cast', 'Default', '{}']
+]
+OP_COMPUTE_TIME = """====================op compute time====================
+op_name       compute_time(ms) stream_id
+------------  ---------------  ---------
+Default/Cast-op2 1.5  1
+Default/Conv2D-op1 2.0  1
+Default/Conv2D-op3 3.0  1
+Default/Cast-op2 0.5  1
+Default/Unknown-op5 1.0  1
+total op  10.0 0
+"""
+
+
+def read_csv(file_path):
+    """Read the rows of the csv file."""
+    with open(file_path, 'r') as file:
+        return list(csv.reader(file))
+
+
+class TestIntegrator(TestCase):
+    """Test the class of `Integrator`."""
+
+    def setUp(self):
+        """Initialization before test case execution."""
+        self._profiling_dir = tempfile.mkdtemp()
+        with open(os.path.join(self._profiling_dir, 'framework_raw_0.csv'), 'w') as file:
+            csv_writer = csv.writer(file)
+            csv_writer.writerow(FRAMEWORK_HEADER)
+            csv_writer.writerows(FRAMEWORK_ROWS)
+        with open(os.path.join(self._profiling_dir, 'output_op_compute_time_0.txt'), 'w') as file:
+            file.write(OP_COMPUTE_TIME)
+
+    def tearDown(self):
+        """Clean up after test case execution."""
+        shutil.rmtree(self._profiling_dir)
+
+    def test_integrate(self):
+        """Test integrating the AICORE operator time."""
+        Integrator(self._profiling_dir, '0').integrate()
+
+        detail_rows = read_csv(os.path.join(self._profiling_dir, 'aicore_intermediate_0_detail.csv'))
+        self.assertListEqual([
+            ['full_op_name', 'execution_time'],
+            ['Default/Cast-op2', '1.5'],
+            ['Default/Conv2D-op1', '2.0'],
+            ['Default/Conv2D-op3', '3.0'],
+            ['Default/Cast-op2', '0.5'],
+            ['Default/Unknown-op5', '1.0']
+        ], detail_rows)
+
+        # The time of the op executed again overrides the previous one.
+        type_rows = read_csv(os.path.join(self._profiling_dir, 'aicore_intermediate_0_type.csv'))
+        self.assertListEqual([
+            ['op_type', 'execution_time', 'execution_frequency', 'percent'],
+            ['Cast', '0.5', '1', '5.00'],
+            ['Conv2D', '5.0', '2', '50.00'],
+            ['', '1.0', '1', '10.00']
+        ], type_rows)
+
+    def test_integrate_with_quoted_op_name(self):
+        """Test the op name which needs to be quoted in csv."""
+        with open(os.path.join(self._profiling_dir, 'output_op_compute_time_0.txt'), 'a') as file:
+            file.write('Default/a,b-op4 4.0  1\n')
+        Integrator(self._profiling_dir, '0').integrate()
+
+        detail_rows = read_csv(os.path.join(self._profiling_dir, 'aicore_intermediate_0_detail.csv'))
+        self.assertListEqual(['Default/a,b-op4', '4.0'], detail_rows[-1])
+        type_rows = read_csv(os.path.join(self._profiling_dir, 'aicore_intermediate_0_type.csv'))
+        self.assertListEqual(['Cast', '4.5', '2', '45.00'], type_rows[1])
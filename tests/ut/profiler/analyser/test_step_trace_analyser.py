@@ -0,0 +1,101 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the step trace analyser module."""
+import csv
+import os
+from unittest import TestCase
+
+import numpy as np
+
+from mindinsight.profiler.analyser.analyser_factory import AnalyserFactory
+from mindinsight.profiler.common.exceptions.exceptions import ProfilerParamValueErrorException
+from tests.ut.profiler import PROFILER_DIR
+
+
+def get_step_trace():
+    """
+    Get the step trace of device 0.
+
+    Returns:
+        tuple[list[str], list[list[str]]], the header and rows of step trace.
+    """
+    file_path = os.path.join(PROFILER_DIR, 'step_trace_raw_0_detail_time.csv')
+    with open(file_path, 'r') as file:
+        csv_reader = csv.reader(file)
+        header = next(csv_reader)
+        return header, list(csv_reader)
+
+
+class TestStepTraceAnalyser(TestCase):
+    """Test the class of `StepTraceAnalyser`."""
+
+    def setUp(self):
+        """Initialization before test case execution."""
+        self._analyser = AnalyserFactory.instance().get_analyser('step_trace', PROFILER_DIR, '0')
+        self._header, self._rows = get_step_trace()
+
+    def test_query_proc(self):
+        """Test querying the values of a field."""
+        index = self._header.index('fp_and_bp')
+        condition = {'filter_condition': {'mode': 'proc', 'proc_name': 'fp_and_bp'}}
+        result = self._analyser.query(condition)
+        expect_values = [round(int(row[index]) / 100000, 4) for row in self._rows[:-1]]
+        self.assertDictEqual({'size': 20, 'info': {'fp_and_bp': expect_values}}, result)
+
+        condition['filter_condition'].update({'step_id': 3, 'time_type': 'systime'})
+        result = self._analyser.query(condition)
+        self.assertListEqual([int(self._rows[2][index])], result['info']['fp_and_bp'])
+
+    def test_query_step(self):
+        """Test querying the graph of a step, step 0 is the average step."""
+        result = self._analyser.query({'filter_condition': {'mode': 'step', 'step_id': 0}})
+        total = round(int(self._rows[-1][self._header.index('total')]) / 100000, 4)
+        self.assertDictEqual({'name': '', 'start': 0, 'duration': total}, result['training_trace_graph'][0][0])
+        self.assertListEqual(['iteration_interval', 'fp_and_bp', 'tail'],
+                             [point['name'] for point in result['training_trace_graph'][1]])
+
+        same_result = self._analyser.query({'filter_condition': {'mode': 'step'}})
+        self.assertListEqual(result['training_trace_graph'], same_result['training_trace_graph'])
+
+    def test_statistics(self):
+        """Test the statistics of fields."""
+        index = self._header.index('tail')
+        values = np.array([int(row[index]) for row in self._rows[:-1]]) / 100000
+        statistics = self._analyser.statistics['tail']
+        self.assertEqual(round(float(np.max(values)), 4), statistics['max'])
+        self.assertEqual(round(float(np.percentile(values, 90)), 4), statistics['p90'])
+        self.assertNotIn('start_point', self._analyser.statistics)
+
+    def test_summary(self):
+        """Test the summary of step trace."""
+        summary = self._analyser.summary
+        self.assertEqual(20, summary['total_steps'])
+        self.assertEqual(round(int(self._rows[-1][self._header.index('tail')]) / 100000, 4), summary['tail'])
+
+    def test_query_for_all_reduce(self):
+        """Test querying the all reduce info of all steps."""
+        reduce_infos = self._analyser.query_for_all_reduce()
+        reduce_fields = [name for name in self._header if name.startswith('stream_') and not name.endswith('point')]
+        self.assertEqual(20 * len(reduce_fields), len(reduce_infos))
+        start_index = self._header.index(reduce_fields[0] + '_start_point')
+        self.assertListEqual(
+            [reduce_fields[0], int(reduce_fields[0].split('_')[1]), int(self._rows[0][start_index]) / 1e5],
+            reduce_infos[0][:3])
+
+    def test_query_invalid_proc_name(self):
+        """Test querying the field which is not a time field."""
+        condition = {'filter_condition': {'mode': 'proc', 'proc_name': 'step_num'}}
+        with self.assertRaises(ProfilerParamValueErrorException):
+            self._analyser.query(condition)
@@ -0,0 +1,181 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the timeline analyser module."""
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+from unittest import TestCase, mock
+
+from mindinsight.profiler.analyser.analyser_factory import AnalyserFactory
+from mindinsight.profiler.analyser.timeline_analyser import SIZE_LIMIT, write_timeline_events
+from mindinsight.profiler.analyser.timeline_store import MERGED_EVENT_NAME, TimelineStore
+from mindinsight.utils.exceptions import ParamValueError
+
+META_EVENT = {'name': 'process_name', 'ph': 'M', 'pid': 0, 'args': {'name': 'AI Core'}}
+
+
+def dump_events(events):
+    """Dump the events as the display file content."""
+    return json.dumps(events)
+
+
+def get_events():
+    """
+    Get the timeline events.
+
+    Stream 0 has ten short ops from 0 to 100, stream 1 has a long op from 50 to 250.
+
+    Returns:
+        list[dict], the timeline events.
+    """
+    events = [META_EVENT]
+    for index in range(10):
+        events.append({'name': 'op{}'.format(index), 'ph': 'X', 'pid': 0, 'tid': 0,
+                       'ts': index * 10, 'dur': 5})
+    events.append({'name': 'long_op', 'ph': 'X', 'pid': 0, 'tid': 1, 'ts': 50, 'dur': 200})
+    return events
+
+
+class TestTimelineStore(TestCase):
+    """Test the class of `TimelineStore`."""
+
+    def setUp(self):
+        """Initialization before test case execution."""
+        self._store = TimelineStore(get_events())
+
+    def test_query_all(self):
+        """Test querying all events."""
+        result = self._store.query()
+        self.assertEqual(0, result['total_start_time'])
+        self.assertEqual(250, result['total_end_time'])
+        self.assertEqual(12, len(result['events']))
+        self.assertDictEqual(META_EVENT, result['events'][0])
+        self.assertEqual(11, self._store.event_count)
+
+    def test_query_window(self):
+        """Test querying the events overlapping the window."""
+        result = self._store.query(start_time=33, end_time=62)
+        names = [event['name'] for event in result['events'][1:]]
+        self.assertListEqual(['op3', 'op4', 'op5', 'long_op', 'op6'], names)
+
+        result = self._store.query(start_time=200, end_time=300)
+        names = [event['name'] for event in result['events'][1:]]
+        self.assertListEqual(['long_op'], names)
+
+    def test_query_with_resolution(self):
+        """Test the ops shorter than a pixel are merged."""
+        result = self._store.query(start_time=0, end_time=250, resolution=5)
+        events = result['events'][1:]
+        merged_events = [event for event in events if event['name'] == MERGED_EVENT_NAME]
+        self.assertEqual(2, len(merged_events))
+        self.assertDictEqual({'name': MERGED_EVENT_NAME, 'ph': 'X', 'pid': 0, 'tid': 0, 'ts': 0, 'dur': 45,
+                              'args': {'op_count': 5}}, merged_events[0])
+        self.assertEqual(5, merged_events[1]['args']['op_count'])
+        self.assertEqual(95, merged_events[1]['ts'] + merged_events[1]['dur'])
+        self.assertIn('long_op', [event['name'] for event in events])
+
+    def test_query_invalid_window(self):
+        """Test querying with invalid window."""
+        with self.assertRaises(ParamValueError):
+            self._store.query(start_time=10, end_time=0)
+        with self.assertRaises(ParamValueError):
+            self._store.query(resolution=0)
+
+
+class TestTimelineAnalyser(TestCase):
+    """Test the window query of `TimelineAnalyser`."""
+
+    def setUp(self):
+        """Initialization before test case execution."""
+        self._profiling_dir = tempfile.mkdtemp()
+        with open(os.path.join(self._profiling_dir, 'ascend_timeline_display_0.json'), 'w') as file:
+            json.dump(get_events(), file)
+
+    def tearDown(self):
+        """Clean up after test case execution."""
+        shutil.rmtree(self._profiling_dir)
+
+    def test_get_display_timeline_window(self):
+        """Test getting the timeline in the window."""
+        analyser = AnalyserFactory.instance().get_analyser('timeline', self._profiling_dir, '0')
+        result = analyser.get_display_timeline_window('ascend', 0, 25)
+        names = [event['name'] for event in result['events'][1:]]
+        self.assertListEqual(['op0', 'op1', 'op2'], names)
+
+        result = analyser.get_display_timeline_window('gpu')
+        self.assertListEqual([], result['events'])
+
+        with self.assertRaises(ParamValueError):
+            analyser.get_display_timeline_window('cpu')
+
+    def test_write_timeline(self):
+        """Test writing the truncated display file and the compressed display file."""
+        analyser = AnalyserFactory.instance().get_analyser('timeline', self._profiling_dir, '0')
+        events = get_events()
+        analyser._timeline_meta = events
+        size_limit = len(dump_events(events[:3])) - 2
+        with mock.patch('mindinsight.profiler.analyser.timeline_analyser.SIZE_LIMIT', size_limit):
+            analyser.write_timeline('gpu')
+
+        with open(os.path.join(self._profiling_dir, 'gpu_timeline_display_0.json')) as file:
+            truncated_events = json.load(file)
+        self.assertListEqual(events[:3], truncated_events)
+
+        result = analyser.get_display_timeline_window('gpu')
+        self.assertEqual(len(events), len(result['events']))
+
+    def test_get_window_past_size_limit(self):
+        """Test the window query returns the events written after the size limit of the display file."""
+        analyser = AnalyserFactory.instance().get_analyser('timeline', self._profiling_dir, '0')
+        detail = 'x' * 1000
+        events = [META_EVENT]
+        for index in range(SIZE_LIMIT // len(detail) + 1000):
+            events.append({'name': 'op{}'.format(index), 'ph': 'X', 'pid': 0, 'tid': 0,
+                           'ts': index * 10, 'dur': 5, 'args': {'detail': detail}})
+        analyser._timeline_meta = events
+        analyser.write_timeline('gpu')
+
+        display_file_size = os.path.getsize(os.path.join(self._profiling_dir, 'gpu_timeline_display_0.json'))
+        self.assertLess(display_file_size, len(dump_events(events)))
+        last_event = events[-1]
+        result = analyser.get_display_timeline_window('gpu', last_event['ts'], last_event['ts'] + 1)
+        self.assertListEqual([META_EVENT, last_event], result['events'])
+
+
+class TestWriteTimelineEvents(TestCase):
+    """Test the function of `write_timeline_events`."""
+
+    def test_write_all_events(self):
+        """Test writing all events in multiple chunks."""
+        events = get_events()
+        file_obj = StringIO()
+        with mock.patch('mindinsight.profiler.analyser.timeline_analyser.WRITE_CHUNK_SIZE', 5):
+            count = write_timeline_events(file_obj, events)
+        self.assertEqual(len(events), count)
+        self.assertEqual(dump_events(events), file_obj.getvalue())
+
+    def test_write_events_by_limitation(self):
+        """Test the event making the size exceed the limit is the last event written."""
+        events = get_events()
+        # The size limit is exceeded by the content of the first 3 events without the closing bracket.
+        size_limit = len(dump_events(events[:3])) - 2
+        for chunk_size in (2, 5, len(events)):
+            file_obj = StringIO()
+            with mock.patch('mindinsight.profiler.analyser.timeline_analyser.WRITE_CHUNK_SIZE', chunk_size):
+                count = write_timeline_events(file_obj, events, size_limit)
+            self.assertEqual(3, count)
+            self.assertEqual(dump_events(events[:3]), file_obj.getvalue())
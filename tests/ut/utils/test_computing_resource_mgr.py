@@ -0,0 +1,40 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the computing resource manager."""
+import time
+
+from mindinsight.utils.computing_resource_mgr import ComputingResourceManager
+
+
+class TestExecutor:
+    """Test the class of `Executor`."""
+
+    def test_wait_all_tasks_finish(self):
+        """Test waiting until the done callbacks of all tasks are finished."""
+        results = []
+
+        def callback(future):
+            time.sleep(0.05)
+            results.append(future.result())
+
+        with ComputingResourceManager(executors_cnt=1, max_processes_cnt=2) as mgr:
+            executor = mgr.get_executor()
+            with executor:
+                for value in range(4):
+                    executor.submit(abs, -value).add_done_callback(callback)
+                executor.wait_all_tasks_finish()
+                assert sorted(results) == [0, 1, 2, 3]
+                # Waiting without tasks returns at once.
+                executor.wait_all_tasks_finish()
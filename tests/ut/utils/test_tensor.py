@@ -0,0 +1,62 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the tensor utils."""
+import numpy as np
+
+from mindinsight.utils.tensor import TensorUtils
+
+
+class TestTensorUtils:
+    """Test the class of `TensorUtils`."""
+
+    def test_min_max_pyramid_levels(self):
+        """Test the block sizes of levels, and the mins and maxes of blocks."""
+        value = np.arange(10, dtype=np.float32).reshape(2, 5)
+        pyramid = TensorUtils.get_min_max_pyramid(value, max_points=4, factor=2)
+        assert [level[0] for level in pyramid] == [16, 8, 4]
+        block_size, mins, maxes = pyramid[-1]
+        assert block_size == 4
+        assert mins.tolist() == [0, 4, 8]
+        assert maxes.tolist() == [3, 7, 9]
+        assert pyramid[1][1].tolist() == [0, 8]
+        assert pyramid[1][2].tolist() == [7, 9]
+        assert pyramid[0][1].tolist() == [0]
+        assert pyramid[0][2].tolist() == [9]
+
+    def test_min_max_pyramid_of_small_tensor(self):
+        """Test the finest level keeps the values when the tensor has no more values than `max_points`."""
+        value = np.array([3, 1, 2], dtype=np.int32)
+        pyramid = TensorUtils.get_min_max_pyramid(value, max_points=4)
+        assert [level[0] for level in pyramid] == [4, 1]
+        assert pyramid[-1][1].tolist() == [3, 1, 2]
+        assert pyramid[-1][2].tolist() == [3, 1, 2]
+        assert pyramid[0][1].tolist() == [1]
+        assert pyramid[0][2].tolist() == [3]
+
+    def test_min_max_pyramid_with_nan(self):
+        """Test NaN is ignored unless all values of a block are NaN."""
+        value = np.array([np.nan, 1, np.nan, np.nan, 2, np.inf], dtype=np.float64)
+        pyramid = TensorUtils.get_min_max_pyramid(value, max_points=3, factor=2)
+        assert [level[0] for level in pyramid] == [8, 4, 2]
+        _, mins, maxes = pyramid[-1]
+        np.testing.assert_array_equal(mins, [1, np.nan, 2])
+        np.testing.assert_array_equal(maxes, [1, np.nan, np.inf])
+        _, mins, maxes = pyramid[0]
+        np.testing.assert_array_equal(mins, [1])
+        np.testing.assert_array_equal(maxes, [np.inf])
+
+    def test_min_max_pyramid_of_empty_tensor(self):
+        """Test the pyramid of empty tensor is empty."""
+        assert TensorUtils.get_min_max_pyramid(np.zeros((0, 3)), max_points=4) == []
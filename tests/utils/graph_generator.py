@@ -0,0 +1,105 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Generate synthetic debugger graphs."""
+import random
+from collections import deque
+
+from mindinsight.datavisual.data_transform.graph.node import Node
+from mindinsight.debugger.stream_cache.debugger_graph import DebuggerGraph
+
+
+def generate_debugger_graph(node_count, input_count=2, window=50, isolated_count=0, seed=0):
+    """
+    Generate a debugger graph of leaf nodes.
+
+    Each connected node takes `input_count` inputs among the previous `window` nodes, and some of them also
+    take an input which is not in graph.
+
+    Args:
+        node_count (int): The number of connected nodes.
+        input_count (int): The number of inputs of each connected node. Default: 2.
+        window (int): The range of the previous nodes the inputs are chosen from. Default: 50.
+        isolated_count (int): The number of nodes without input and output. Default: 0.
+        seed (int): The seed of the random inputs. Default: 0.
+
+    Returns:
+        DebuggerGraph, the graph.
+    """
+    rand = random.Random(seed)
+    nodes = []
+    for index in range(node_count + isolated_count):
+        node = Node('Default/network/Add-op{}'.format(index), str(index + 1))
+        node.type = 'Add'
+        nodes.append(node)
+
+    for index in range(1, node_count):
+        node = nodes[index]
+        candidates = range(max(0, index - window), index)
+        for src_index in rand.sample(candidates, min(input_count, len(candidates))):
+            node.add_input(nodes[src_index].name, {})
+            nodes[src_index].add_output(node.name, {})
+        if index % 1000 == 0:
+            node.add_input('Default/network/Missing-op{}'.format(index), {})
+
+    # Put the isolated nodes among the others, so they are found in the middle of traversal.
+    ordered_nodes = nodes[:node_count]
+    for node in nodes[node_count:]:
+        ordered_nodes.insert(rand.randrange(1, len(ordered_nodes) + 1), node)
+
+    graph = DebuggerGraph()
+    for node in ordered_nodes:
+        graph._cache_node(node)
+    graph._leaf_nodes = graph._get_leaf_nodes()
+    return graph
+
+
+def get_bfs_order_by_scan(graph):
+    """
+    Get the BFS order of the graph by the algorithm which scans the queue and the traversed nodes.
+
+    It is the algorithm used before the visited set is introduced, kept for checking the order and benchmark.
+
+    Args:
+        graph (DebuggerGraph): The graph.
+
+    Returns:
+        list[str], the leaf nodes arranged in BFS order.
+    """
+    leaf_nodes = graph._leaf_nodes
+
+    def bfs(node_name, bfs_order):
+        temp_list = deque()
+        temp_list.append(node_name)
+        while temp_list:
+            node_name = temp_list.popleft()
+            node = leaf_nodes.get(node_name)
+            if not node:
+                continue
+            bfs_order.append(node_name)
+            if node.input:
+                for name in node.input.keys():
+                    if name not in temp_list and name not in bfs_order:
+                        temp_list.append(name)
+            if node.output:
+                for name in node.output.keys():
+                    if name not in temp_list and name not in bfs_order:
+                        temp_list.append(name)
+
+    bfs_order = []
+    bfs(graph.get_default_root().name, bfs_order)
+    for node_name in leaf_nodes:
+        if node_name not in bfs_order:
+            bfs(node_name, bfs_order)
+    return bfs_order